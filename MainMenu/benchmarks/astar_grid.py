@@ -0,0 +1,124 @@
+"""
+astar알고리즘_최종본.py 의 a_star() 와 pathfinding.grid.GridAStar 의 초당 노드 확장 수를 비교합니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.astar_grid [크기] [반복 횟수]
+"""
+import contextlib
+import importlib.util
+import io
+import os
+import random
+import sys
+import time
+
+from pathfinding.grid import GridMap, GridAStar
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+LEGACY_FILE = "astar알고리즘_최종본.py"
+
+
+def load_script(file_name):
+    """
+    저장소 최상위의 예제 스크립트를 모듈로 불러옵니다.
+    예제 스크립트는 import 할 때 사용 예시를 출력하므로 출력을 버립니다.
+    """
+    spec = importlib.util.spec_from_file_location(os.path.splitext(file_name)[0], os.path.join(ROOT, file_name))
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+
+def load_legacy_astar():
+    return load_script(LEGACY_FILE)
+
+
+def make_grid_map(width, height, wall_ratio, seed):
+    rng = random.Random(seed)
+    grid_map = {}
+    for y in range(height):
+        for x in range(width):
+            grid_map[(x, y)] = {"wall": rng.random() < wall_ratio}
+    return grid_map
+
+
+def pick_points(grid_map, width, height, count, seed):
+    rng = random.Random(seed)
+    open_cells = [cell for cell, data in grid_map.items() if not data["wall"]]
+    points = []
+    while len(points) < count:
+        start = rng.choice(open_cells)
+        goal = rng.choice(open_cells)
+        if abs(start[0] - goal[0]) + abs(start[1] - goal[1]) > (width + height) // 2:
+            points.append((start, goal))
+    return points
+
+
+def run_legacy(legacy, grid_map, size, points):
+    legacy.GRID_SIZE = size
+    expanded = 0
+    original_get_neighbors = legacy.get_neighbors
+
+    # get_neighbors() 는 노드를 확장할 때마다 한 번 호출되므로 호출 횟수로 확장 수를 셉니다.
+    def counting_get_neighbors(node, grid_map, closed_set):
+        nonlocal expanded
+        expanded += 1
+        return original_get_neighbors(node, grid_map, closed_set)
+
+    legacy.get_neighbors = counting_get_neighbors
+    costs = []
+    start_time = time.perf_counter()
+    for start, goal in points:
+        costs.append(path_cost(legacy.a_star(start, goal, grid_map)))
+    elapsed = time.perf_counter() - start_time
+    legacy.get_neighbors = original_get_neighbors
+    return expanded, elapsed, costs
+
+
+def run_grid(grid_map, size, points):
+    convert_start = time.perf_counter()
+    grid = GridMap.from_grid_map(grid_map, size)
+    engine = GridAStar(grid)
+    convert_time = time.perf_counter() - convert_start
+
+    expanded = 0
+    costs = []
+    start_time = time.perf_counter()
+    for start, goal in points:
+        costs.append(path_cost(engine.find_path(start, goal)))
+        expanded += engine.expanded
+    elapsed = time.perf_counter() - start_time
+    return expanded, elapsed, costs, convert_time
+
+
+def path_cost(path):
+    cost = 0
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        cost += 14 if x1 != x2 and y1 != y2 else 10
+    return cost
+
+
+def main():
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    searches = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    size = (side, side)
+
+    grid_map = make_grid_map(side, side, wall_ratio=0.25, seed=1)
+    points = pick_points(grid_map, side, side, searches, seed=2)
+    legacy = load_legacy_astar()
+
+    legacy_expanded, legacy_time, legacy_costs = run_legacy(legacy, grid_map, size, points)
+    grid_expanded, grid_time, grid_costs, convert_time = run_grid(grid_map, size, points)
+
+    print(f"맵 {side}x{side}, 탐색 {searches}회")
+    print(f"  legacy a_star : {legacy_expanded:>9} 확장, {legacy_time:8.3f}s, {legacy_expanded / legacy_time:12.0f} 확장/초")
+    print(f"  GridAStar     : {grid_expanded:>9} 확장, {grid_time:8.3f}s, {grid_expanded / grid_time:12.0f} 확장/초")
+    print(f"  변환 시간 (한 번): {convert_time:.3f}s")
+    print(f"  속도 향상 (전체 시간): {legacy_time / grid_time:.1f}배")
+    if legacy_costs != grid_costs:
+        print("  경고: 경로 비용이 다릅니다", legacy_costs, grid_costs)
+
+
+if __name__ == "__main__":
+    main()
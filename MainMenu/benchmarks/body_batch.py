@@ -0,0 +1,91 @@
+"""
+BodyBatch 로 몸 여러 개를 한 번에 움직인 결과가 Player.move 를 하나씩 부른 결과와 프레임마다 같은지 확인하고
+몸 수별로 시간을 비교합니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.body_batch [프레임 수]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from benchmarks.merged_tiles import PLAYER_TYPES, platform_rows, random_keys, spawn_points
+from benchmarks.tile_collision import random_rows
+from entities.body_batch import BodyBatch
+from entities.player import Player
+from entities.tilemap import TileMap
+
+TILE_SIZE = 50
+BODY_COUNTS = (100, 1000, 5000)
+
+
+def keys_to_arrays(inputs):
+    directions = np.array([-1 if keys[pygame.K_LEFT] else (1 if keys[pygame.K_RIGHT] else 0) for keys in inputs])
+    jumps = np.array([keys[pygame.K_SPACE] for keys in inputs])
+    return directions, jumps
+
+
+def simulate(tile_map, body_count, frames, seed):
+    rng = random.Random(seed)
+    players = [Player(x, y, player_type, tile_map) for x, y, player_type in spawn_points(rng, tile_map, body_count)]
+    batch = BodyBatch.from_players(players)
+    mismatches = 0
+    scalar_time = batch_time = 0.0
+
+    for _ in range(frames):
+        inputs = [random_keys(rng) for _ in range(body_count)]
+        directions, jumps = keys_to_arrays(inputs)
+
+        start_time = time.perf_counter()
+        for player, keys in zip(players, inputs):
+            player.move(keys)
+        scalar_time += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        batch.move(directions, jumps)
+        batch_time += time.perf_counter() - start_time
+
+        x = np.array([player.rect.x for player in players])
+        y = np.array([player.rect.y for player in players])
+        velocity_y = np.array([player.velocity_y for player in players])
+        on_ground = np.array([player.on_ground for player in players])
+        mismatches += int(
+            np.count_nonzero(
+                (x != batch.x) | (y != batch.y) | (velocity_y != batch.velocity_y) | (on_ground != batch.on_ground)
+            )
+        )
+    return mismatches, scalar_time, batch_time
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    rng = random.Random(3)
+    cases = [
+        ("basic", TileMap(TILE_SIZE, "basic")),
+        ("400x40 발판", TileMap(TILE_SIZE, None, platform_rows(rng, 400, 40))),
+        ("100x100 무작위", TileMap(TILE_SIZE, None, random_rows(rng, 100, 100, 0.2))),
+    ]
+    failures = 0
+    for name, tile_map in cases:
+        for body_count in BODY_COUNTS:
+            if name == "basic" and body_count > 100:
+                continue  # 작은 맵에는 몸을 많이 둘 빈자리가 없습니다.
+            mismatches, scalar_time, batch_time = simulate(tile_map, body_count, frames, seed=body_count)
+            failures += mismatches
+            print(
+                f"{name}, 몸 {body_count}: Player.move {scalar_time / frames * 1000:7.2f}ms, "
+                f"BodyBatch {batch_time / frames * 1000:5.2f}ms / 프레임 ({scalar_time / batch_time:.1f}배), "
+                f"다른 몸 {mismatches}"
+            )
+    print("결과 확인: 모두 같음" if not failures else f"결과 확인: 다른 몸-프레임 {failures}개")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,92 @@
+"""
+카메라가 긴 맵을 가로질러 갈 때 TileMap.draw(surface, camera_position) 가
+- 예전처럼 맵 전체를 그린 뒤 화면 크기만큼 잘라 낸 그림과 같은지 (몇 군데에서)
+- 미리 그려 둔 청크 수가 max_layer_chunks 를 넘지 않는지
+- 한도가 화면에 보이는 청크 수보다 작아도 카메라가 멈춰 있으면 청크를 다시 그리지 않는지
+확인하고, 프레임마다 그리는 시간과 새로 그린 청크 수를 봅니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.chunk_culling [맵 너비(칸)]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.tile_collision import TILE_SIZE, random_rows
+from benchmarks.tile_layer import SCREEN_SIZE
+from entities.tilemap import LAYER_CHUNK_CACHE, LAYER_CHUNK_TILES, TileMap
+
+MAP_HEIGHT = 30
+CAMERA_SPEED = 7  # 프레임마다 움직이는 픽셀
+
+
+def expected_view(tile_map, camera_position):
+    # 비교용: 화면 근처 타일만 맵 좌표로 그려서 잘라 냅니다.
+    camera_x, camera_y = camera_position
+    world = pygame.Surface(SCREEN_SIZE)
+    view = pygame.Rect(camera_position, SCREEN_SIZE)
+    for tile in tile_map.tiles:
+        if view.colliderect(tile):
+            pygame.draw.rect(world, tile_map.color, tile.move(-camera_x, -camera_y))
+    return world
+
+
+def main():
+    map_width = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    pygame.display.set_mode((1, 1))
+    rng = random.Random(22)
+    tile_map = TileMap(TILE_SIZE, None, random_rows(rng, map_width, MAP_HEIGHT, 0.2))
+    screen = pygame.Surface(SCREEN_SIZE)
+
+    max_x = map_width * TILE_SIZE - SCREEN_SIZE[0]
+    mismatches = 0
+    largest_cache = 0
+    frames = 0
+    baked = 0
+    slowest = 0.0
+    start_time = time.perf_counter()
+    for camera_x in range(0, max_x, CAMERA_SPEED):
+        camera_position = (camera_x, (camera_x // 3) % (MAP_HEIGHT * TILE_SIZE - SCREEN_SIZE[1]))
+        before = set(tile_map.layer_chunks)
+        frame_start = time.perf_counter()
+        tile_map.draw(screen, camera_position)
+        slowest = max(slowest, time.perf_counter() - frame_start)
+        baked += len(set(tile_map.layer_chunks) - before)
+        largest_cache = max(largest_cache, len(tile_map.layer_chunks))
+        frames += 1
+        if frames % 500 == 0:
+            expected = expected_view(tile_map, camera_position)
+            if pygame.image.tobytes(expected, "RGB") != pygame.image.tobytes(screen, "RGB"):
+                mismatches += 1
+        screen.fill((0, 0, 0))
+    total_time = time.perf_counter() - start_time
+
+    chunk_count = -(-map_width // 16) * -(-MAP_HEIGHT // 16)
+    print(f"맵 {map_width}x{MAP_HEIGHT}칸 (청크 {chunk_count}장), 카메라 {frames}프레임")
+    print(
+        f"  평균 {total_time / frames * 1000:.3f}ms, 가장 느린 프레임 {slowest * 1000:.2f}ms / 프레임, "
+        f"새로 그린 청크 {baked}장, 들고 있던 청크 최대 {largest_cache}장 (한도 {LAYER_CHUNK_CACHE})"
+    )
+    # 한도를 1장으로 줄이고 같은 곳을 두 번 그립니다. 두 번째에는 새로 그리는 청크가 없어야 합니다.
+    tile_map.max_layer_chunks = 1
+    wide_screen = pygame.Surface((SCREEN_SIZE[0] * 4, MAP_HEIGHT * TILE_SIZE))
+    tile_map.draw(wide_screen, (0, 0))
+    before = dict(tile_map.layer_chunks)
+    tile_map.draw(wide_screen, (0, 0))
+    chunk_pixels = TILE_SIZE * LAYER_CHUNK_TILES
+    visible = -(-wide_screen.get_width() // chunk_pixels) * -(-wide_screen.get_height() // chunk_pixels)
+    rebaked = visible - sum(1 for key, chunk in tile_map.layer_chunks.items() if before.get(key) is chunk)
+    print(f"  한도 1장, 화면에 보이는 청크 {visible}장: 멈춘 카메라에서 다시 그린 청크 {rebaked}장")
+
+    failures = mismatches + (largest_cache > LAYER_CHUNK_CACHE) + rebaked
+    print("확인: 같은 그림, 한도 지킴" if not failures else f"확인: 다른 그림 {mismatches}번, 청크 최대 {largest_cache}장, 다시 그린 청크 {rebaked}장")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
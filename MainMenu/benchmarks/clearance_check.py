@@ -0,0 +1,111 @@
+"""
+ClearanceMap 의 "몸이 들어가는지" 결과가 칸을 하나씩 검사한 결과와 같은지, 타일을 바꾼 뒤에도 같은지 확인하고
+이웃을 볼 때마다 칸을 검사하는 방식과 시간을 비교합니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.clearance_check [맵 개수]
+"""
+import random
+import sys
+import time
+
+from pathfinding.clearance import ClearanceMap
+from pathfinding.grid import GridMap
+
+BODY_SIZES = ((1, 1), (1, 2), (2, 2), (2, 3), (3, 1))
+
+
+def random_rows(rng, width, height, wall_ratio):
+    return ["".join("#" if rng.random() < wall_ratio else "." for _ in range(width)) for _ in range(height)]
+
+
+def body_fits(rows, x, y, width, height):
+    # 비교용: 몸이 덮는 칸을 하나씩 봅니다.
+    if x < 0 or y < 0 or x + width > len(rows[0]) or y + height > len(rows):
+        return False
+    return all(rows[y + dy][x + dx] != "#" for dy in range(height) for dx in range(width))
+
+
+def set_tile(rows, clearance, x, y, tile):
+    rows[y] = rows[y][:x] + tile + rows[y][x + 1:]
+    clearance.on_tile_changed(x, y)
+
+
+def compare(rows, clearance):
+    for width, height in BODY_SIZES:
+        for y in range(len(rows)):
+            for x in range(len(rows[0])):
+                if clearance.fits(x, y, width, height) != body_fits(rows, x, y, width, height):
+                    return f"{width}x{height} 몸, ({x}, {y}) 가 다릅니다"
+                for dx, dy in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+                    expected = (
+                        0 <= x + dx < len(rows[0])
+                        and 0 <= y + dy < len(rows)
+                        and body_fits(rows, x + dx, y, width, height)
+                        and body_fits(rows, x, y + dy, width, height)
+                        and body_fits(rows, x + dx, y + dy, width, height)
+                    )
+                    if clearance.can_move_diagonal(x, y, dx, dy, width, height) != expected:
+                        return f"{width}x{height} 몸, ({x}, {y}) 에서 {(dx, dy)} 대각선 이동이 다릅니다"
+    return None
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    rng = random.Random(6)
+    failures = 0
+
+    for map_number in range(map_count):
+        width = rng.randint(1, 30)
+        height = rng.randint(1, 30)
+        rows = random_rows(rng, width, height, rng.choice((0.0, 0.1, 0.2, 0.4)))
+        clearance = ClearanceMap(rows)
+        grids = [GridMap.from_clearance(clearance, *size) for size in BODY_SIZES]
+        for _ in range(10):
+            x, y = rng.randrange(width), rng.randrange(height)
+            set_tile(rows, clearance, x, y, rng.choice("#."))
+            for grid in grids:
+                grid.refresh_cells(x, y)
+        problem = compare(rows, clearance)
+        for grid, size in zip(grids, BODY_SIZES):
+            if grid.walls != GridMap.from_rows(rows, agent_width=size[0], agent_height=size[1]).walls:
+                problem = problem or f"{size[0]}x{size[1]} 그리드의 부분 갱신 결과가 다릅니다"
+        if problem:
+            failures += 1
+            print(f"맵 {map_number} {width}x{height}: {problem}")
+
+    print(f"무작위 맵 {map_count}개, 타일 변경 후 비교")
+    print("  실패 없음" if not failures else f"  실패 {failures}건")
+
+    rows = random_rows(random.Random(2), 512, 512, 0.1)
+    for width, height in ((1, 2), (2, 3)):
+        start_time = time.perf_counter()
+        for y in range(512):
+            for x in range(512):
+                body_fits(rows, x, y, width, height)
+        check_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        clearance = ClearanceMap(rows)
+        layer = clearance.widths(height)
+        build_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        for y in range(512):
+            for x in range(512):
+                layer[clearance.index(x, y)] >= width
+        lookup_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for _ in range(100):
+            x, y = rng.randrange(512), rng.randrange(512)
+            set_tile(rows, clearance, x, y, rng.choice("#."))
+        update_time = (time.perf_counter() - start_time) / 100
+        print(
+            f"512x512, {width}x{height} 몸: 칸마다 검사 {check_time:.3f}s, "
+            f"ClearanceMap 준비 {build_time:.3f}s + 조회 {lookup_time:.3f}s, 타일 하나 갱신 {update_time * 1000:.2f}ms"
+        )
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
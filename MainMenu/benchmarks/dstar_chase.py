@@ -0,0 +1,81 @@
+"""
+움직이는 플레이어를 쫓는 상황에서, 매번 새로 A* 를 돌릴 때와 DStarLite 로 고쳐 쓸 때의
+계획 한 번당 확장 수를 (적이 한 칸 이동 / 플레이어가 한 칸 이동 / 타일 변경) 경우별로 비교합니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.dstar_chase [맵 크기] [틱 수]
+"""
+import random
+import sys
+import time
+
+from benchmarks.jps_check import check_path, random_grid
+from pathfinding.dstar_lite import DStarLite
+from pathfinding.grid import GridAStar
+
+
+def main():
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 600
+    rng = random.Random(9)
+    grid = random_grid(rng, side, side, 0.2)
+    a_star = GridAStar(grid)
+    planner = DStarLite(grid)
+    open_cells = [(x, y) for y in range(side) for x in range(side) if grid.is_walkable(x, y)]
+    enemy = min(open_cells)
+    player = max(open_cells)
+
+    events = {"적 이동": [0, 0, 0], "플레이어 이동": [0, 0, 0], "타일 변경": [0, 0, 0]}  # 횟수, A* 확장, D* Lite 확장
+    times = [0.0, 0.0]
+    failures = 0
+    path = []
+    for tick in range(ticks):
+        if tick % 15 == 7:
+            event = "타일 변경"
+            x, y = rng.randrange(side), rng.randrange(side)
+            if (x, y) not in (enemy, player):
+                grid.set_wall(x, y, not grid.walls[grid.index(x, y)])
+                planner.changed_cells.append((x, y))
+        elif tick % 3 == 0:
+            event = "플레이어 이동"
+            moves = [
+                (player[0] + dx, player[1] + dy)
+                for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                if (dx or dy) and grid.is_walkable(player[0] + dx, player[1] + dy)
+            ]
+            player = rng.choice(moves) if moves else player
+        else:
+            event = "적 이동"
+            if len(path) > 2:
+                enemy = path[1]
+        if enemy == player or not grid.is_walkable(*enemy) or not grid.is_walkable(*player):
+            continue
+
+        start_time = time.perf_counter()
+        path = a_star.find_path(enemy, player)
+        times[0] += time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        incremental_path = planner.find_path(enemy, player)
+        times[1] += time.perf_counter() - start_time
+
+        counts = events[event]
+        counts[0] += 1
+        counts[1] += a_star.expanded
+        counts[2] += planner.expanded
+        if bool(path) != bool(incremental_path) or (
+            path and (a_star.path_cost(path) != a_star.path_cost(incremental_path)
+                      or check_path(grid, incremental_path, enemy, player))
+        ):
+            failures += 1
+
+    print(f"{side}x{side}, {ticks}틱 추격 (계획 한 번당 평균 확장 수)")
+    for event, (count, a_star_expanded, planner_expanded) in events.items():
+        if count:
+            print(f"  {event:<8}: {count:4}번, A* {a_star_expanded / count:8.1f}, D* Lite {planner_expanded / count:8.1f}")
+    print(f"  전체 시간: A* {times[0]:.3f}s, D* Lite {times[1]:.3f}s")
+    print("  경로 비용 확인: 실패 없음" if not failures else f"  경로 비용 확인: 실패 {failures}건")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,72 @@
+"""
+같은 플레이어를 쫓는 적 N 마리가 각자 A* 를 돌릴 때와 흐름장 하나를 같이 쓸 때를 비교합니다.
+적마다 흐름장의 거리가 A* 경로 비용과 같은지, next_step 이 한 칸 이동이면서 거리를 줄이는지 확인합니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.flow_field [맵 크기] [적 수]
+"""
+import random
+import sys
+import time
+
+from benchmarks.jps_check import random_grid
+from pathfinding.flow_field import FlowField
+from pathfinding.grid import GridAStar
+
+
+def main():
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    enemy_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rng = random.Random(5)
+    grid = random_grid(rng, side, side, 0.2)
+    open_cells = [(x, y) for y in range(side) for x in range(side) if grid.is_walkable(x, y)]
+    enemies = rng.sample(open_cells, enemy_count)
+    # 플레이어가 칸을 다섯 번 옮긴다고 가정합니다.
+    player_cells = rng.sample(open_cells, 5)
+
+    a_star = GridAStar(grid)
+    start_time = time.perf_counter()
+    a_star_costs = []
+    for goal in player_cells:
+        for enemy in enemies:
+            path = a_star.find_path(enemy, goal)
+            a_star_costs.append(a_star.path_cost(path) if path else -1)
+    a_star_time = time.perf_counter() - start_time
+
+    field = FlowField(grid)
+    start_time = time.perf_counter()
+    field_results = []  # (거리, 다음 칸, 다음 칸의 거리)
+    for goal in player_cells:
+        # 매 프레임 적마다 부르지만 플레이어 칸이 같으면 다시 계산하지 않습니다.
+        for _ in range(10):
+            for enemy in enemies:
+                field.update(goal)
+                step = field.next_step(enemy)
+        for enemy in enemies:
+            step = field.next_step(enemy)
+            field_results.append((field.distance_to_goal(enemy), step, field.distance_to_goal(step) if step else None))
+    field_time = time.perf_counter() - start_time
+
+    failures = 0
+    for (goal, enemy), cost, (distance, step, step_distance) in zip(
+        ((goal, enemy) for goal in player_cells for enemy in enemies), a_star_costs, field_results
+    ):
+        if distance != cost:
+            failures += 1
+            print(f"  {enemy}->{goal}: 흐름장 거리 {distance}, A* 비용 {cost}")
+        elif distance > 0 and (
+            step is None
+            or max(abs(step[0] - enemy[0]), abs(step[1] - enemy[1])) != 1
+            or not 0 <= step_distance < distance
+        ):
+            failures += 1
+            print(f"  {enemy}->{goal}: 다음 칸 {step} (거리 {step_distance}) 가 거리 {distance} 를 줄이지 않습니다")
+    print(f"{side}x{side}, 적 {enemy_count}마리, 플레이어 칸 변경 5회")
+    print(f"  적마다 A*  : {a_star_time:.3f}s")
+    print(f"  흐름장 공유 : {field_time:.3f}s (다시 계산 {field.recomputed}회, 조회 {enemy_count * 55}회)")
+    print(f"  거리와 다음 칸 확인 ({len(a_star_costs)}개): " + ("실패 없음" if not failures else f"실패 {failures}건"))
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
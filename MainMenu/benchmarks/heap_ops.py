@@ -0,0 +1,121 @@
+"""
+IndexedMinHeap, heapq, 이진힙.py 의 MinHeap, astar알고리즘_최종본.py 의 MinHeap 을 비교하는 마이크로 벤치마크입니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.heap_ops [연산 횟수 ...]
+기본값은 10^4, 10^5 입니다. 10^6 은 재귀 힙이 느려서 직접 넘겨 주세요.
+"""
+import heapq
+import random
+import sys
+import time
+
+from benchmarks.astar_grid import load_legacy_astar, load_script, make_grid_map, pick_points
+from pathfinding.grid import GridMap, GridAStar
+from pathfinding.heap import IndexedMinHeap
+
+
+def timed(function):
+    start_time = time.perf_counter()
+    function()
+    return time.perf_counter() - start_time
+
+
+def push_pop_heapq(values):
+    heap = []
+    for value in values:
+        heapq.heappush(heap, (value, value))
+    while heap:
+        heapq.heappop(heap)
+
+
+def push_pop_recursive(heap_class, push_name, values):
+    heap = heap_class()
+    push = getattr(heap, push_name)
+    for value in values:
+        push((value, value))
+    for _ in values:
+        heap.pop()
+
+
+def push_pop_indexed(values):
+    heap = IndexedMinHeap()
+    for node, value in enumerate(values):
+        heap.push(node, value)
+    while heap.nodes:
+        heap.pop()
+
+
+def heapify_indexed(values):
+    heap = IndexedMinHeap()
+    heap.heapify(enumerate(values))
+    while heap.nodes:
+        heap.pop()
+
+
+def decrease_heapq(values, updates):
+    # decrease-key 가 없으므로 같은 노드를 더 작은 값으로 한 번 더 넣고, 꺼낼 때 오래된 항목을 버립니다.
+    heap = [(value, node) for node, value in enumerate(values)]
+    heapq.heapify(heap)
+    best = list(values)
+    for node, value in updates:
+        if value < best[node]:
+            best[node] = value
+            heapq.heappush(heap, (value, node))
+    done = bytearray(len(values))
+    while heap:
+        value, node = heapq.heappop(heap)
+        if done[node] or value != best[node]:
+            continue
+        done[node] = 1
+
+
+def decrease_indexed(values, updates):
+    heap = IndexedMinHeap()
+    heap.heapify(enumerate(values))
+    for node, value in updates:
+        heap.push_or_decrease(node, value)
+    while heap.nodes:
+        heap.pop()
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [10 ** 4, 10 ** 5]
+    binary_heap = load_script("이진힙.py").MinHeap
+    final_heap = load_legacy_astar().MinHeap
+    sys.setrecursionlimit(10000)
+
+    for count in counts:
+        rng = random.Random(count)
+        values = [rng.random() for _ in range(count)]
+        updates = [(rng.randrange(count), rng.random() * 0.5) for _ in range(count)]
+
+        print(f"{count} 개 push + pop")
+        print(f"  heapq                    : {timed(lambda: push_pop_heapq(values)):8.3f}s")
+        print(f"  이진힙.MinHeap (재귀)      : {timed(lambda: push_pop_recursive(binary_heap, 'insert', values)):8.3f}s")
+        print(f"  최종본 MinHeap (재귀)      : {timed(lambda: push_pop_recursive(final_heap, 'push', values)):8.3f}s")
+        print(f"  IndexedMinHeap           : {timed(lambda: push_pop_indexed(values)):8.3f}s")
+        print(f"  IndexedMinHeap (heapify) : {timed(lambda: heapify_indexed(values)):8.3f}s")
+        print(f"{count} 개 + decrease-key {count} 회")
+        print(f"  heapq (중복 push)         : {timed(lambda: decrease_heapq(values, updates)):8.3f}s")
+        print(f"  IndexedMinHeap           : {timed(lambda: decrease_indexed(values, updates)):8.3f}s")
+
+    # A* 열린 목록으로 썼을 때 (열린 지도에서는 heapq 쪽 열린 목록이 중복 항목으로 커집니다)
+    side = 256
+    grid_map = make_grid_map(side, side, wall_ratio=0.1, seed=3)
+    points = pick_points(grid_map, side, side, 5, seed=4)
+    grid = GridMap.from_grid_map(grid_map, (side, side))
+    for decrease_key in (False, True):
+        engine = GridAStar(grid, decrease_key=decrease_key)
+        max_open = 0
+        start_time = time.perf_counter()
+        for start, goal in points:
+            engine.find_path(start, goal)
+            max_open = max(max_open, engine.max_open)
+        elapsed = time.perf_counter() - start_time
+        name = "IndexedMinHeap" if decrease_key else "heapq"
+        print(f"GridAStar({name:>14}) {side}x{side}: {elapsed:6.3f}s, 최대 열린 목록 {max_open}")
+
+
+if __name__ == "__main__":
+    main()
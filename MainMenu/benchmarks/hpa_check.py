@@ -0,0 +1,129 @@
+"""
+HPA* 경로가 올바른지, 부분 갱신 결과가 전체 재계산과 같은지,
+경로를 다 꺼내기 전에 맵이 바뀌면 건너뛰는 경로 대신 멈추는지,
+경로 비용이 A* 에 비해 한도 (WORST_COST_RATIO, AVERAGE_COST_RATIO) 안인지 확인하고 A* 와 시간을 비교합니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.hpa_check [맵 개수]
+"""
+import random
+import sys
+import time
+
+from benchmarks.jps_check import check_path, random_grid
+from pathfinding.grid import GridAStar
+from pathfinding.hpa import HierarchicalPathfinder
+
+# HPA* 경로 비용 / A* 경로 비용의 한도 (HierarchicalPathfinder 설명 참고)
+WORST_COST_RATIO = 2.0
+AVERAGE_COST_RATIO = 1.1
+
+
+def same_graph(pathfinder, fresh):
+    inter = {node: edges for node, edges in pathfinder.inter.items() if edges}
+    fresh_inter = {node: edges for node, edges in fresh.inter.items() if edges}
+    return (
+        pathfinder.borders == fresh.borders
+        and pathfinder.cluster_nodes == fresh.cluster_nodes
+        and pathfinder.intra == fresh.intra
+        and inter == fresh_inter
+    )
+
+
+def is_connected(path):
+    return all(max(abs(x2 - x1), abs(y2 - y1)) == 1 for (x1, y1), (x2, y2) in zip(path, path[1:]))
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    rng = random.Random(3)
+    failures = 0
+    worst_ratio = 1.0
+    ratios = []
+
+    for map_number in range(map_count):
+        width = rng.randint(5, 60)
+        height = rng.randint(5, 60)
+        grid = random_grid(rng, width, height, rng.choice((0.0, 0.1, 0.2, 0.3)))
+        pathfinder = HierarchicalPathfinder(grid, cluster_size=rng.choice((4, 8, 10)))
+        a_star = GridAStar(grid)
+        for _ in range(20):
+            start = (rng.randrange(width), rng.randrange(height))
+            goal = (rng.randrange(width), rng.randrange(height))
+            path = a_star.find_path(start, goal)
+            hpa_path = list(pathfinder.find_path(start, goal))
+            if bool(path) != bool(hpa_path):
+                failures += 1
+                print(f"맵 {map_number} {start}->{goal}: 도달 가능 여부가 다릅니다")
+                continue
+            if hpa_path:
+                problem = check_path(grid, hpa_path, start, goal)
+                if problem:
+                    failures += 1
+                    print(f"맵 {map_number} {start}->{goal}: {problem}")
+                ratios.append(a_star.path_cost(hpa_path) / max(1, a_star.path_cost(path)))
+                worst_ratio = max(worst_ratio, ratios[-1])
+
+        # 첫 구간만 꺼낸 뒤 맵을 바꿉니다. 나머지는 멈추거나 (다시 찾기) 이어져 있어야 합니다.
+        start = (rng.randrange(width), rng.randrange(height))
+        goal = (rng.randrange(width), rng.randrange(height))
+        stale_path = pathfinder.find_path(start, goal)
+        if stale_path:
+            stale_path[0]
+            x, y = rng.randrange(width), rng.randrange(height)
+            grid.set_wall(x, y, not grid.walls[grid.index(x, y)])
+            pathfinder.update_cells([(x, y)])
+            cells = list(stale_path)
+            if not is_connected(cells):
+                failures += 1
+                print(f"맵 {map_number} {start}->{goal}: 맵이 바뀐 뒤 경로가 건너뜁니다")
+
+        for _ in range(5):
+            x, y = rng.randrange(width), rng.randrange(height)
+            grid.set_wall(x, y, rng.random() < 0.5)
+            pathfinder.update_cells([(x, y)])
+        if not same_graph(pathfinder, HierarchicalPathfinder(grid, pathfinder.cluster_size)):
+            failures += 1
+            print(f"맵 {map_number}: 부분 갱신 결과가 전체 재계산과 다릅니다")
+
+    average_ratio = sum(ratios) / len(ratios) if ratios else 1.0
+    print(
+        f"무작위 맵 {map_count}개, 경로 비용 비율 평균 {average_ratio:.3f} (한도 {AVERAGE_COST_RATIO}), "
+        f"최악 {worst_ratio:.2f} (한도 {WORST_COST_RATIO})"
+    )
+    if worst_ratio > WORST_COST_RATIO or average_ratio > AVERAGE_COST_RATIO:
+        failures += 1
+    print("  실패 없음" if not failures else f"  실패 {failures}건")
+
+    grid = random_grid(random.Random(1), 512, 512, 0.2)
+    build_start = time.perf_counter()
+    pathfinder = HierarchicalPathfinder(grid, cluster_size=16)
+    print(f"512x512, 벽 20%, 클러스터 16: 준비 {time.perf_counter() - build_start:.3f}s")
+    a_star = GridAStar(grid)
+    for start, goal in (((3, 3), (500, 500)), ((10, 400), (480, 20))):
+        grid.set_wall(*start, wall=False)
+        grid.set_wall(*goal, wall=False)
+        update_start = time.perf_counter()
+        pathfinder.update_cells([start, goal])
+        update_time = time.perf_counter() - update_start
+
+        search_start = time.perf_counter()
+        path = a_star.find_path(start, goal)
+        a_star_time = time.perf_counter() - search_start
+
+        search_start = time.perf_counter()
+        hpa_path = pathfinder.find_path(start, goal)
+        hpa_path[0]
+        first_step_time = time.perf_counter() - search_start
+        cells = list(hpa_path)
+        full_time = time.perf_counter() - search_start
+        print(
+            f"  {start}->{goal}: A* {a_star_time:.3f}s (비용 {a_star.path_cost(path)}), "
+            f"HPA* 첫 구간 {first_step_time:.3f}s / 전체 {full_time:.3f}s (비용 {a_star.path_cost(cells)}), "
+            f"타일 갱신 {update_time * 1000:.1f}ms"
+        )
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,105 @@
+"""
+무작위 맵에서 JPS / JPS+ 의 경로 비용이 GridAStar 와 같은지 (JPS 는 decrease_key=True 로도) 확인하고 시간을 비교합니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.jps_check [맵 개수]
+"""
+import random
+import sys
+import time
+
+from pathfinding.grid import GridMap, GridAStar
+from pathfinding.jps import JumpPointSearch, JumpPointSearchPlus
+
+
+def random_grid(rng, width, height, wall_ratio):
+    grid = GridMap(width, height)
+    for y in range(height):
+        for x in range(width):
+            if rng.random() < wall_ratio:
+                grid.set_wall(x, y)
+    return grid
+
+
+def check_path(grid, path, start, goal):
+    """
+    경로가 시작점과 목표점을 잇고, 한 칸씩 움직이며, 벽을 지나거나 모서리를 끼고 돌지 않는지 확인합니다.
+    """
+    if path[0] != start or path[-1] != goal:
+        return "시작점/목표점이 다릅니다"
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        if max(abs(x2 - x1), abs(y2 - y1)) != 1:
+            return f"{(x1, y1)} -> {(x2, y2)} 는 한 칸 이동이 아닙니다"
+        if not grid.is_walkable(x2, y2):
+            return f"{(x2, y2)} 는 벽입니다"
+        if x1 != x2 and y1 != y2 and not (grid.is_walkable(x2, y1) and grid.is_walkable(x1, y2)):
+            return f"{(x1, y1)} -> {(x2, y2)} 에서 모서리를 끼고 돕니다"
+    return None
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(0)
+    engines = {
+        "A*": GridAStar,
+        "JPS": JumpPointSearch,
+        "JPS/i": lambda grid: JumpPointSearch(grid, decrease_key=True),  # 열린 목록이 IndexedMinHeap
+        "JPS+": JumpPointSearchPlus,
+    }
+    times = dict.fromkeys(engines, 0.0)
+    expanded = dict.fromkeys(engines, 0)
+    failures = 0
+
+    for map_number in range(map_count):
+        width = rng.randint(2, 64)
+        height = rng.randint(2, 64)
+        grid = random_grid(rng, width, height, rng.choice((0.0, 0.1, 0.2, 0.3, 0.4)))
+        searchers = {name: engine(grid) for name, engine in engines.items()}
+        for _ in range(10):
+            start = (rng.randrange(width), rng.randrange(height))
+            goal = (rng.randrange(width), rng.randrange(height))
+            grid.set_wall(*start, wall=False)
+            grid.set_wall(*goal, wall=False)
+            searchers["JPS+"].rebuild()
+
+            costs = {}
+            for name, searcher in searchers.items():
+                start_time = time.perf_counter()
+                path = searcher.find_path(start, goal)
+                times[name] += time.perf_counter() - start_time
+                expanded[name] += searcher.expanded
+                costs[name] = searcher.path_cost(path) if path else None
+                if path:
+                    problem = check_path(grid, path, start, goal)
+                    if problem:
+                        failures += 1
+                        print(f"맵 {map_number} {name} {start}->{goal}: {problem}")
+
+            if len(set(costs.values())) != 1:
+                failures += 1
+                print(f"맵 {map_number} {width}x{height} {start}->{goal}: 비용이 다릅니다 {costs}")
+
+    print(f"무작위 맵 {map_count}개")
+    for name in engines:
+        print(f"  {name:>5}: {times[name]:7.3f}s, 확장 {expanded[name]}")
+    print("  실패 없음" if not failures else f"  실패 {failures}건")
+
+    # 긴 벽을 돌아가야 하는 넓은 맵: A* 는 벽 앞의 빈 공간을 전부 열어 보지만 JPS 는 점프 포인트 몇 개만 봅니다.
+    grid = GridMap(512, 512)
+    for y in range(480):
+        grid.set_wall(256, y)
+    start, goal = (10, 10), (500, 10)
+    print("512x512, 가운데 긴 벽을 돌아가는 경로")
+    for name, engine in engines.items():
+        build_start = time.perf_counter()
+        searcher = engine(grid)
+        build_time = time.perf_counter() - build_start
+        start_time = time.perf_counter()
+        path = searcher.find_path(start, goal)
+        elapsed = time.perf_counter() - start_time
+        print(f"  {name:>5}: {elapsed:7.3f}s (준비 {build_time:.3f}s), 확장 {searcher.expanded}, 비용 {searcher.path_cost(path)}")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
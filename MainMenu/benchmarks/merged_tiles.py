@@ -0,0 +1,126 @@
+"""
+TileMap(merge_tiles=True) 로 벽 칸을 합쳤을 때 Player.update_position 의 결과가 칸마다 검사할 때와 같은지
+무작위 입력으로 플레이어들을 움직여 매 프레임 비교하고, 그리기와 충돌 검사에서 다루는 Rect 수를 비교합니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.merged_tiles [플레이어 수] [프레임 수]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.tile_collision import random_rows
+from entities.player import Player
+from entities.tilemap import TileMap
+
+TILE_SIZE = 50
+PLAYER_TYPES = ("basic", "speedy", "strong")
+
+
+class CountingPlayer(Player):
+    # update_position 안에서 check_collision 이 돌려준 Rect 수를 셉니다.
+    checked = 0
+
+    def check_collision(self):
+        collisions = super().check_collision()
+        CountingPlayer.checked += len(collisions)
+        return collisions
+
+
+def platform_rows(rng, width, height):
+    # 두꺼운 바닥, 긴 발판, 벽 기둥으로 된 가로로 긴 스테이지
+    rows = [["."] * width for _ in range(height)]
+    for y in range(height - 3, height):
+        rows[y] = ["#"] * width
+    for y in range(4, height - 4, 3):
+        x = rng.randrange(4)
+        while x < width:
+            length = rng.randint(3, 12)
+            for col in range(x, min(width, x + length)):
+                rows[y][col] = "#"
+            x += length + rng.randint(2, 6)
+    for x in range(0, width, 20):
+        for y in range(height - 8, height - 3):
+            rows[y][x] = "#"
+    return ["".join(row) for row in rows]
+
+
+def spawn_points(rng, tile_map, count):
+    points = []
+    while len(points) < count:
+        x = rng.randrange(len(tile_map.tile_map[0]) * TILE_SIZE - 60)
+        y = rng.randrange(len(tile_map.tile_map) * TILE_SIZE - 70)
+        if not tile_map.colliding_tiles(pygame.Rect(x, y, 60, 70)):
+            points.append((x, y, rng.choice(PLAYER_TYPES)))
+    return points
+
+
+def random_keys(rng):
+    direction = rng.random()
+    return {
+        pygame.K_LEFT: direction < 0.4,
+        pygame.K_RIGHT: direction > 0.6,
+        pygame.K_SPACE: rng.random() < 0.1,
+    }
+
+
+def simulate(rows, player_count, frames, seed):
+    """
+    같은 입력으로 두 맵의 플레이어들을 움직입니다. (다른 프레임 수, 충돌 Rect 수, 걸린 시간) 을 돌려줍니다.
+    """
+    rng = random.Random(seed)
+    maps = (TileMap(TILE_SIZE, None, rows), TileMap(TILE_SIZE, None, rows, merge_tiles=True))
+    points = spawn_points(rng, maps[0], player_count)
+    players = [[CountingPlayer(x, y, player_type, tile_map) for x, y, player_type in points] for tile_map in maps]
+    mismatches = 0
+    counts = [0, 0]
+    times = [0.0, 0.0]
+
+    for _ in range(frames):
+        inputs = [random_keys(rng) for _ in range(player_count)]
+        for which in (0, 1):
+            CountingPlayer.checked = 0
+            start_time = time.perf_counter()
+            for player, keys in zip(players[which], inputs):
+                player.move(keys)
+            times[which] += time.perf_counter() - start_time
+            counts[which] += CountingPlayer.checked
+        for tile_player, merged_player in zip(*players):
+            if (tile_player.rect, tile_player.on_ground, tile_player.velocity_y) != (
+                merged_player.rect,
+                merged_player.on_ground,
+                merged_player.velocity_y,
+            ):
+                mismatches += 1
+    return maps, mismatches, counts, times
+
+
+def main():
+    player_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 600
+    rng = random.Random(5)
+    cases = [("basic", TileMap(TILE_SIZE, "basic").tile_map)]
+    cases.append(("400x40 발판", platform_rows(rng, 400, 40)))
+    for size, wall_ratio in ((32, 0.15), (200, 0.3)):
+        cases.append((f"{size}x{size} 무작위", random_rows(rng, size, size, wall_ratio)))
+
+    failures = 0
+    for name, rows in cases:
+        maps, mismatches, counts, times = simulate(rows, player_count, frames, seed=len(rows))
+        failures += mismatches
+        print(
+            f"{name}: 그리는 Rect {len(maps[0].tiles)} -> {len(maps[1].tiles)}, "
+            f"충돌 검사 Rect {counts[0]} -> {counts[1]}, "
+            f"이동 {times[0]:.3f}s -> {times[1]:.3f}s, 다른 프레임 {mismatches}"
+        )
+    print("결과 확인: 모두 같음" if not failures else f"결과 확인: 다른 프레임 {failures}개")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,73 @@
+"""
+Enemy.move() 처럼 적들이 매 프레임 (현재 칸, 플레이어 칸) 경로를 다시 물을 때,
+PathCache 가 없을 때와 있을 때의 탐색 횟수와 시간을 비교하고 캐시 크기별 적중률을 보여 줍니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.path_cache [적 수] [프레임 수]
+"""
+import random
+import sys
+import time
+
+from benchmarks.jps_check import check_path, random_grid
+from pathfinding.grid import GridAStar
+from pathfinding.path_cache import PathCache
+
+
+def simulate(grid, enemy_count, frames, cache=None, validate=False, seed=0):
+    rng = random.Random(seed)
+    a_star = GridAStar(grid)
+    open_cells = [(x, y) for y in range(grid.height) for x in range(grid.width) if grid.is_walkable(x, y)]
+    enemies = rng.sample(open_cells, enemy_count)
+    player = rng.choice(open_cells)
+    searches = 0
+    failures = 0
+
+    for frame in range(frames):
+        if frame % 30 == 0:
+            # 플레이어가 가끔 이웃 칸으로 옮겨 갑니다.
+            path = a_star.find_path(player, rng.choice(open_cells))
+            player = path[min(3, len(path) - 1)] if path else player
+        for number, enemy in enumerate(enemies):
+            path = cache.get(enemy, player) if cache is not None else None
+            if path is None:
+                path = a_star.find_path(enemy, player)
+                searches += 1
+                if cache is not None:
+                    cache.put(enemy, player, path)
+            elif validate and path and check_path(grid, path, enemy, player):
+                failures += 1
+            if frame % 4 == 0 and len(path) > 1:
+                enemies[number] = path[1]
+    return searches, failures
+
+
+def main():
+    enemy_count = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 240
+    grid = random_grid(random.Random(7), 96, 96, 0.2)
+
+    # 캐시가 작아 자주 밀려날 때도 돌려준 경로가 올바른지 먼저 확인합니다.
+    _, failures = simulate(grid, enemy_count, frames, PathCache(16), validate=True)
+
+    start_time = time.perf_counter()
+    searches, _ = simulate(grid, enemy_count, frames)
+    print(f"96x96, 적 {enemy_count}마리, {frames}프레임")
+    print(f"  캐시 없음 : {time.perf_counter() - start_time:.3f}s, 탐색 {searches}회")
+
+    for capacity in (16, 64, 256):
+        cache = PathCache(capacity)
+        start_time = time.perf_counter()
+        searches, _ = simulate(grid, enemy_count, frames, cache)
+        stats = cache.stats()
+        print(
+            f"  캐시 {capacity:>3} : {time.perf_counter() - start_time:.3f}s, 탐색 {searches}회, "
+            f"적중 {stats['hits']} + 뒷부분 적중 {stats['suffix_hits']} / 실패 {stats['misses']} "
+            f"(적중률 {stats['hit_rate']:.0%}), 밀려남 {stats['evictions']}"
+        )
+    print("  캐시 경로 확인: 실패 없음" if not failures else f"  캐시 경로 확인: 잘못된 경로 {failures}개")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
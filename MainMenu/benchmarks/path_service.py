@@ -0,0 +1,90 @@
+"""
+PathfindingService 를 화면 없이 돌려 봅니다. 적들이 요청을 보내고 프레임마다 poll() 하는 동안 메인 루프에서 쓰는 시간,
+결과가 도착하기까지의 프레임 수, 중복 제거/취소 횟수를 보여 주고 경로 비용이 GridAStar 와 같은지,
+취소한 작업까지 세어 풀에 보낸 작업이 max_in_flight 를 넘지 않는지 확인합니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.path_service [적 수] [작업 프로세스 수]
+"""
+import random
+import sys
+import time
+
+from benchmarks.jps_check import check_path, random_grid
+from pathfinding.grid import GridAStar
+from pathfinding.service import PathfindingService
+
+FRAME_TIME = 1 / 60
+
+
+def main():
+    enemy_count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    rng = random.Random(10)
+    grid = random_grid(rng, 200, 200, 0.2)
+    open_cells = [(x, y) for y in range(200) for x in range(200) if grid.is_walkable(x, y)]
+    starts = rng.sample(open_cells, enemy_count)
+    # 적 여러 마리가 같은 칸에 몰려 있는 경우 (중복 요청)
+    starts[enemy_count // 2:] = starts[:enemy_count - enemy_count // 2]
+    goal = rng.choice(open_cells)
+    moved_goal = rng.choice(open_cells)
+
+    a_star = GridAStar(grid)
+    start_time = time.perf_counter()
+    expected = {start: a_star.path_cost(a_star.find_path(start, moved_goal)) for start in set(starts)}
+    print(f"200x200, 적 {enemy_count}마리, 작업 프로세스 {workers}개")
+    print(f"  메인 루프에서 바로 A*: {(time.perf_counter() - start_time) * 1000:.1f}ms (한 프레임)")
+
+    failures = 0
+    with PathfindingService(grid, workers) as service:
+        agents = [service.agent_pathfinder() for _ in starts]
+        for agent, start in zip(agents, starts):
+            agent.find_path(start, goal)
+        service.poll()
+        # 첫 결과가 오기 전에 플레이어가 다른 칸으로 옮겨 가서 요청을 모두 바꿉니다. (예전 요청 취소, 이미 보낸 것도 있음)
+        for agent, start in zip(agents, starts):
+            agent.find_path(start, moved_goal)
+
+        frames = 0
+        main_time = 0.0
+        worst_frame = 0.0
+        most_in_flight = 0
+        while any(not agent.find_path(start, moved_goal) for agent, start in zip(agents, starts)):
+            frame_start = time.perf_counter()
+            service.poll()
+            most_in_flight = max(most_in_flight, service.in_flight())
+            for agent, start in zip(agents, starts):
+                agent.find_path(start, moved_goal)
+            spent = time.perf_counter() - frame_start
+            main_time += spent
+            worst_frame = max(worst_frame, spent)
+            frames += 1
+            time.sleep(max(0.0, FRAME_TIME - spent))
+            if frames > 6000:
+                print("  시간 초과")
+                failures += 1
+                break
+
+        for agent, start in zip(agents, starts):
+            path = agent.find_path(start, moved_goal)
+            if path and (a_star.path_cost(path) != expected[start] or check_path(grid, path, start, moved_goal)):
+                failures += 1
+        stats = service.stats
+        max_in_flight = service.max_in_flight
+        if most_in_flight > max_in_flight:
+            failures += 1
+
+    print(
+        f"  PathfindingService: {frames}프레임 뒤 모두 도착, 메인 루프에서 쓴 시간 합계 {main_time * 1000:.1f}ms, "
+        f"가장 긴 프레임 {worst_frame * 1000:.2f}ms"
+    )
+    print(
+        f"  요청 {stats['requests']}, 중복 제거 {stats['deduplicated']}, 취소 {stats['cancelled']}, "
+        f"완료한 작업 {stats['completed']}, 풀에 보낸 작업 최대 {most_in_flight}개 (한도 {max_in_flight})"
+    )
+    print("  경로 확인: 실패 없음" if not failures else f"  경로 확인: 실패 {failures}건")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
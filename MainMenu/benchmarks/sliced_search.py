@@ -0,0 +1,81 @@
+"""
+적 여러 마리가 같은 프레임에 긴 경로를 요청할 때, 한 프레임에 모두 탐색하는 경우와
+SearchScheduler 로 프레임마다 정해진 확장 수만 쓰는 경우의 프레임 시간을 비교합니다.
+탐색 중에 사라진 적의 탐색이 release 없이도 줄과 searches 에서 빠지는지 확인합니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.sliced_search [적 수] [프레임당 확장 수]
+"""
+import random
+import sys
+import time
+
+from benchmarks.jps_check import check_path, random_grid
+from pathfinding.grid import GridAStar
+from pathfinding.sliced import SearchScheduler, SlicedAStar
+
+
+def main():
+    enemy_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    budget = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    rng = random.Random(8)
+    grid = random_grid(rng, 256, 256, 0.2)
+    goal = (250, 250)
+    grid.set_wall(*goal, wall=False)
+    starts = []
+    while len(starts) < enemy_count:
+        start = (rng.randrange(40), rng.randrange(40))
+        if grid.is_walkable(*start):
+            starts.append(start)
+
+    a_star = GridAStar(grid)
+    start_time = time.perf_counter()
+    costs = [a_star.path_cost(a_star.find_path(start, goal)) for start in starts]
+    print(f"256x256, 적 {enemy_count}마리가 같은 프레임에 길찾기 요청")
+    print(f"  한 프레임에 모두 탐색: {(time.perf_counter() - start_time) * 1000:.1f}ms")
+
+    scheduler = SearchScheduler(grid, budget)
+    agents = [scheduler.agent_pathfinder() for _ in starts]
+    for agent, start in zip(agents, starts):
+        agent.find_path(start, goal)
+    # 마지막 적은 첫 프레임 뒤에 사라집니다. (release 를 부르지 않음)
+    dead = scheduler.agent_pathfinder()
+    dead.find_path(starts[0], goal)
+    scheduler.update()
+    del dead
+    failures = 0
+    frame_times = []
+    while scheduler.active:
+        start_time = time.perf_counter()
+        scheduler.update()
+        for agent, start in zip(agents, starts):
+            # 적은 탐색이 끝나기 전에도 매 프레임 부분 경로를 받아 갑니다.
+            agent.find_path(start, goal)
+        frame_times.append((time.perf_counter() - start_time) * 1000)
+    if len(scheduler.searches) != len(agents):
+        failures += 1
+        print(f"  사라진 적의 탐색이 남아 있습니다 (searches {len(scheduler.searches)}개)")
+    for agent, start, cost in zip(agents, starts, costs):
+        search = scheduler.searches[agent]
+        path = search.path()
+        if not search.found or search.path_cost(path) != cost or check_path(grid, path, start, goal):
+            failures += 1
+    print(
+        f"  SearchScheduler (프레임당 {budget}개 확장): {len(frame_times)}프레임에 걸쳐 완료, "
+        f"가장 긴 프레임 {max(frame_times):.1f}ms, 평균 {sum(frame_times) / len(frame_times):.1f}ms"
+    )
+
+    search = SlicedAStar(grid)
+    search.reset(starts[0], goal)
+    overruns = []
+    while not search.done:
+        start_time = time.perf_counter()
+        search.step(time_budget_ms=4)
+        overruns.append((time.perf_counter() - start_time) * 1000)
+    print(f"  step(time_budget_ms=4) 한 마리: {len(overruns)}번에 나눠 완료, 가장 긴 한 번 {max(overruns):.2f}ms")
+    print("  경로 확인: 실패 없음" if not failures else f"  경로 확인: 실패 {failures}건")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,139 @@
+"""
+Player.check_collision 처럼 "이 rect 와 겹치는 벽 타일" 을 물을 때,
+tiles 를 모두 훑는 방식과 TileMap.colliding_tiles (덮는 칸 범위만 읽기) 의 결과가 같은지 확인하고 시간을 비교합니다.
+맵이 커져도 colliding_tiles 의 시간은 그대로인지 봅니다. (merge_tiles 도)
+set_tile 뒤에도 tiles / tile_rects 가 벽 칸을 빠짐없이 한 번씩 덮는지 확인하고, 타일 하나 바꾸는 시간을 봅니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.tile_collision [질문 수]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from entities.tilemap import TileMap
+
+TILE_SIZE = 50
+MAP_SIZES = (32, 100, 200, 400)
+EDIT_MAP_SIZE = 512
+
+
+def random_rows(rng, width, height, wall_ratio):
+    return ["".join("#" if rng.random() < wall_ratio else "." for _ in range(width)) for _ in range(height)]
+
+
+def random_rects(rng, tile_map, count):
+    # 플레이어 크기쯤의 rect 를 맵 안팎 아무 데나 둡니다. (픽셀 단위로 칸 경계에 걸치는 경우 포함)
+    width = len(tile_map.tile_map[0]) * TILE_SIZE
+    height = len(tile_map.tile_map) * TILE_SIZE
+    rects = []
+    for _ in range(count):
+        rect_width = rng.randint(1, TILE_SIZE * 2)
+        rect_height = rng.randint(1, TILE_SIZE * 3)
+        rects.append(pygame.Rect(rng.randint(-TILE_SIZE * 3, width), rng.randint(-TILE_SIZE * 3, height), rect_width, rect_height))
+    return rects
+
+
+def linear_collisions(tile_map, rect):
+    # 비교용: 예전 check_collision
+    return [tile for tile in tile_map.tiles if rect.colliderect(tile)]
+
+
+def compare(tile_map, rects):
+    # tiles 의 순서는 set_tile 때 바뀌므로 순서는 보지 않습니다.
+    for rect in rects:
+        if sorted(map(tuple, tile_map.colliding_tiles(rect))) != sorted(map(tuple, linear_collisions(tile_map, rect))):
+            return f"{rect} 의 결과가 다릅니다"
+    return None
+
+
+def check_cover(tile_map):
+    """
+    tiles 의 Rect 들이 벽 칸을 겹치지 않고 한 번씩 덮고, tile_rects / tile_slots 가 그것과 맞는지 확인합니다.
+    """
+    tile_size = tile_map.tile_size
+    if len(tile_map.tile_slots) != len(tile_map.tiles):
+        return "tile_slots 수가 다릅니다"
+    covered = {}
+    for index, tile in enumerate(tile_map.tiles):
+        if tile_map.tile_slots.get(id(tile)) != index:
+            return f"{tile} 의 tile_slots 위치가 다릅니다"
+        for y in range(tile.top // tile_size, tile.bottom // tile_size):
+            for x in range(tile.left // tile_size, tile.right // tile_size):
+                if (x, y) in covered:
+                    return f"칸 {(x, y)} 를 두 Rect 가 덮습니다"
+                covered[(x, y)] = tile
+    for y, row in enumerate(tile_map.tile_map):
+        for x, col in enumerate(row):
+            if (col == "#") != ((x, y) in covered):
+                return f"칸 {(x, y)} 의 벽과 Rect 가 맞지 않습니다"
+            if tile_map.tile_rects[y][x] is not covered.get((x, y)):
+                return f"칸 {(x, y)} 의 tile_rects 가 다릅니다"
+    return None
+
+
+def main():
+    query_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(11)
+    failures = 0
+
+    for size, merge_tiles in [(size, merge_tiles) for size in MAP_SIZES for merge_tiles in (False, True)]:
+        tile_map = TileMap(TILE_SIZE, None, random_rows(rng, size, size, 0.3), merge_tiles=merge_tiles)
+        rects = random_rects(rng, tile_map, query_count)
+
+        error = compare(tile_map, rects)
+        # 타일을 바꾼 뒤에도 표가 tiles 와 같게 고쳐지는지 확인합니다.
+        for _ in range(50):
+            tile_map.set_tile(rng.randrange(size), rng.randrange(size), rng.choice("#."))
+        error = error or check_cover(tile_map) or compare(tile_map, rects)
+        if error:
+            failures += 1
+
+        start_time = time.perf_counter()
+        for rect in rects:
+            linear_collisions(tile_map, rect)
+        linear_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for rect in rects:
+            tile_map.colliding_tiles(rect)
+        indexed_time = time.perf_counter() - start_time
+
+        print(
+            f"{size}x{size}{' (합침)' if merge_tiles else ''}, 벽 Rect {len(tile_map.tiles)}개: "
+            f"전체 훑기 {linear_time / query_count * 1e6:9.1f}us, "
+            f"칸 범위 {indexed_time / query_count * 1e6:5.2f}us / 질문 "
+            f"({linear_time / indexed_time:.0f}배)"
+            + (f"  결과 다름: {error}" if error else "")
+        )
+
+    rows = random_rows(rng, EDIT_MAP_SIZE, EDIT_MAP_SIZE, 0.3)
+    edits = [(rng.randrange(EDIT_MAP_SIZE), rng.randrange(EDIT_MAP_SIZE), rng.choice("#.")) for _ in range(200)]
+    for merge_tiles in (False, True):
+        tile_map = TileMap(TILE_SIZE, None, rows, merge_tiles=merge_tiles)
+        slowest = 0.0
+        start_time = time.perf_counter()
+        for x, y, tile in edits:
+            edit_start = time.perf_counter()
+            tile_map.set_tile(x, y, tile)
+            slowest = max(slowest, time.perf_counter() - edit_start)
+        edit_time = (time.perf_counter() - start_time) / len(edits)
+        error = check_cover(tile_map)
+        if error:
+            failures += 1
+        print(
+            f"{EDIT_MAP_SIZE}x{EDIT_MAP_SIZE}{' (합침)' if merge_tiles else ''} set_tile: "
+            f"평균 {edit_time * 1000:.3f}ms, 가장 느린 {slowest * 1000:.3f}ms / 번, 벽 Rect {len(tile_map.tiles)}개"
+            + (f"  {error}" if error else "")
+        )
+    print("결과 확인: 모두 같음" if not failures else f"결과 확인: 다른 맵 {failures}개")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
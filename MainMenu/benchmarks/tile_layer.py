@@ -0,0 +1,80 @@
+"""
+TileMap.draw 를 예전 방식 (벽 타일마다 pygame.draw.rect) 과 미리 그려 둔 청크를 붙이는 방식으로 그려
+같은 그림인지 (set_tile 로 바꾼 뒤에도) 확인하고, 한 프레임 그리는 시간과 그리기 호출 수를 비교합니다.
+
+MainMenu 폴더에서 실행합니다:
+    python -m benchmarks.tile_layer [프레임 수]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.tile_collision import TILE_SIZE, random_rows
+from entities.tilemap import TileMap
+
+MAP_SIZES = (16, 32, 100, 200)
+SCREEN_SIZE = (800, 750)
+
+
+def draw_per_tile(tile_map, surface):
+    # 비교용: 예전 TileMap.draw
+    for tile in tile_map.tiles:
+        pygame.draw.rect(surface, tile_map.color, tile)
+
+
+def same_picture(tile_map, size):
+    expected = pygame.Surface(size)
+    actual = pygame.Surface(size)
+    draw_per_tile(tile_map, expected)
+    tile_map.draw(actual)
+    return pygame.image.tobytes(expected, "RGB") == pygame.image.tobytes(actual, "RGB")
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pygame.display.set_mode((1, 1))
+    rng = random.Random(21)
+    failures = 0
+
+    for size in MAP_SIZES:
+        for merge_tiles in (False, True):
+            tile_map = TileMap(TILE_SIZE, None, random_rows(rng, size, size, 0.3), merge_tiles=merge_tiles)
+            # 맵 전체 (작은 맵) 와 화면 크기 모두 같은 그림이어야 합니다. 타일을 바꾼 뒤에도 다시 봅니다.
+            check_size = (min(size * TILE_SIZE, 1600), min(size * TILE_SIZE, 1600))
+            same = same_picture(tile_map, check_size)
+            for _ in range(20):
+                tile_map.set_tile(rng.randrange(size), rng.randrange(size), rng.choice("#."))
+            same = same and same_picture(tile_map, check_size)
+            if not same:
+                failures += 1
+
+            screen = pygame.Surface(SCREEN_SIZE)
+            start_time = time.perf_counter()
+            for _ in range(frames):
+                draw_per_tile(tile_map, screen)
+            per_tile_time = (time.perf_counter() - start_time) / frames
+
+            tile_map.draw(screen)  # 보이는 청크를 미리 그려 둡니다.
+            start_time = time.perf_counter()
+            for _ in range(frames):
+                tile_map.draw(screen)
+            chunk_time = (time.perf_counter() - start_time) / frames
+
+            chunks = sum(chunk is not None for chunk in tile_map.layer_chunks.values())
+            print(
+                f"{size}x{size}{' (합침)' if merge_tiles else '       '}: "
+                f"타일마다 {len(tile_map.tiles):6}번 {per_tile_time * 1000:7.2f}ms, "
+                f"청크 {chunks:3}장 {chunk_time * 1000:5.2f}ms / 프레임"
+                + ("" if same else "  그림 다름")
+            )
+    print("그림 확인: 모두 같음" if not failures else f"그림 확인: 다른 맵 {failures}개")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,135 @@
+import numpy as np
+import pygame
+
+
+def round_like_rect(values):
+    # pygame.Rect 에 실수를 넣으면 0.5 는 0 에서 먼 쪽으로 반올림합니다. (np.round 는 짝수 쪽)
+    return (np.sign(values) * np.floor(np.abs(values) + 0.5)).astype(np.int64)
+
+
+class BodyBatch:
+    """
+    Player 처럼 움직이는 몸 여러 개를 NumPy 배열 하나씩에 모아 두고 한 번에 움직입니다.
+    위치, 크기, 속도, on_ground 를 몸마다 따로 들고 Rect 를 하나씩 고치는 대신,
+    중력과 타일 충돌 (가로 먼저, 세로 나중) 을 모든 몸에 대해 배열 연산으로 계산합니다.
+    결과는 Player.move / update_position 과 같습니다. (tiles 를 하나씩 볼 때와 같은 순서 규칙까지)
+    - 가로: 겹친 타일마다 밀어내므로 tiles 순서(행 우선)로 마지막에 겹친 타일이 위치를 정합니다.
+    - 세로: 첫 타일에서 velocity_y 가 0 이 되어 다음 타일들은 무시되므로, 처음 겹친 타일이 정합니다.
+    """
+
+    def __init__(self, tile_map, bodies=()):
+        self.tile_map = tile_map
+        self.tile_size = tile_map.tile_size
+        bodies = list(bodies)  # (x, y, width, height, speed, gravity, jump_power)
+        columns = list(zip(*bodies)) if bodies else [()] * 7
+        self.x = np.array(columns[0], dtype=np.int64)
+        self.y = np.array(columns[1], dtype=np.int64)
+        self.width = np.array(columns[2], dtype=np.int64)
+        self.height = np.array(columns[3], dtype=np.int64)
+        self.speed = np.array(columns[4], dtype=np.float64)
+        self.gravity = np.array(columns[5], dtype=np.float64)
+        self.jump_power = np.array(columns[6], dtype=np.float64)
+        self.velocity_x = np.zeros(len(bodies))
+        self.velocity_y = np.zeros(len(bodies))
+        self.on_ground = np.zeros(len(bodies), dtype=bool)
+        self.refresh_tiles()
+
+    @classmethod
+    def from_players(cls, players, tile_map=None):
+        batch = cls(
+            tile_map or players[0].tile_map,
+            [(p.rect.x, p.rect.y, p.rect.width, p.rect.height, p.speed, p.gravity, p.jump_power) for p in players],
+        )
+        batch.velocity_x[:] = [p.velocity_x for p in players]
+        batch.velocity_y[:] = [p.velocity_y for p in players]
+        batch.on_ground[:] = [p.on_ground for p in players]
+        return batch
+
+    def refresh_tiles(self):
+        """
+        타일맵을 벽 여부 배열로 다시 읽습니다. tile_map.set_tile 로 타일을 바꾼 뒤에 부릅니다.
+        """
+        rows = self.tile_map.tile_map
+        self.solid = np.array([[char == "#" for char in row] for row in rows], dtype=bool)
+
+    def __len__(self):
+        return len(self.x)
+
+    def move(self, directions, jumps):
+        """
+        Player.move 를 모든 몸에 한 번에 합니다. directions 는 몸마다 -1, 0, 1 (왼쪽, 멈춤, 오른쪽),
+        jumps 는 몸마다 점프 키를 눌렀는지입니다.
+        """
+        self.velocity_x = np.asarray(directions) * self.speed
+        jumping = np.asarray(jumps, dtype=bool) & self.on_ground
+        self.velocity_y = np.where(jumping, self.jump_power, self.velocity_y)
+        self.velocity_y += self.gravity
+        self.update_position()
+
+    def update_position(self):
+        tile_size = self.tile_size
+
+        # 수평 이동
+        self.x = round_like_rect(self.x + self.velocity_x)
+        hit, row, col = self._collision(last=True)
+        right = hit & (self.velocity_x > 0)  # 오른쪽 이동 중
+        left = hit & (self.velocity_x < 0)  # 왼쪽 이동 중
+        self.x = np.where(right, col * tile_size - self.width, self.x)
+        self.x = np.where(left, (col + 1) * tile_size, self.x)
+
+        # 수직 이동
+        self.y = round_like_rect(self.y + self.velocity_y)
+        hit, row, col = self._collision(last=False)
+        falling = hit & (self.velocity_y > 0)  # 아래로 떨어지는 중
+        rising = hit & (self.velocity_y < 0)  # 위로 점프 중
+        self.y = np.where(falling, row * tile_size - self.height, self.y)
+        self.y = np.where(rising, (row + 1) * tile_size, self.y)
+        self.velocity_y = np.where(falling | rising, 0.0, self.velocity_y)
+        self.on_ground = falling
+
+    def _collision(self, last):
+        """
+        몸마다 겹치는 벽 칸 중 행 우선 순서로 마지막(last=True) 또는 처음 칸을 찾습니다.
+        (겹침 여부, 칸 y, 칸 x) 배열을 돌려줍니다. 몸이 덮는 칸 수만큼만 반복하고, 각 반복은 모든 몸을 한 번에 봅니다.
+        """
+        tile_size = self.tile_size
+        map_height, map_width = self.solid.shape
+        left = self.x // tile_size
+        top = self.y // tile_size
+        right = (self.x + self.width - 1) // tile_size
+        bottom = (self.y + self.height - 1) // tile_size
+        max_cols = int((right - left).max(initial=0)) + 1
+        max_rows = int((bottom - top).max(initial=0)) + 1
+
+        best = np.full(len(self.x), -1 if last else max_rows * max_cols, dtype=np.int64)
+        for dy in range(max_rows):
+            cell_y = top + dy
+            row_valid = (cell_y <= bottom) & (cell_y >= 0) & (cell_y < map_height)
+            safe_y = np.clip(cell_y, 0, map_height - 1)
+            for dx in range(max_cols):
+                cell_x = left + dx
+                valid = row_valid & (cell_x <= right) & (cell_x >= 0) & (cell_x < map_width)
+                solid = valid & self.solid[safe_y, np.clip(cell_x, 0, map_width - 1)]
+                order = dy * max_cols + dx
+                if last:
+                    best = np.where(solid, order, best)
+                else:
+                    best = np.where(solid & (best > order), order, best)
+
+        hit = (best >= 0) & (best < max_rows * max_cols)
+        return hit, top + best // max_cols, left + best % max_cols
+
+    def rects(self):
+        return [pygame.Rect(x, y, width, height) for x, y, width, height in zip(self.x, self.y, self.width, self.height)]
+
+    def write_to(self, players):
+        # 배열의 상태를 Player 객체들에 옮깁니다. (그리기나 다른 로직이 Player 를 쓸 때)
+        for index, player in enumerate(players):
+            player.rect.topleft = (int(self.x[index]), int(self.y[index]))
+            player.velocity_x = float(self.velocity_x[index])
+            player.velocity_y = float(self.velocity_y[index])
+            player.on_ground = bool(self.on_ground[index])
+
+    def draw(self, surface, color):
+        for rect in self.rects():
+            pygame.draw.rect(surface, color, rect)
@@ -1,6 +1,7 @@
 import pygame
 import heapq
 from utils import manhattan_distance, can_move_diagonal
+from pathfinding.clearance import ClearanceMap
 
 # 색상 정의
 RED = (255, 0, 0)
@@ -8,7 +9,7 @@ YELLOW = (255, 255, 0)
 PURPLE = (128, 0, 128)
 
 class Enemy:
-    def __init__(self, x, y, enemy_type, tile_map):
+    def __init__(self, x, y, enemy_type, tile_map, pathfinder=None, path_cache=None):
         if enemy_type == 'basic':
             self.rect = pygame.Rect(x, y, 50, 100)
             self.color = RED
@@ -23,6 +24,9 @@ class Enemy:
             self.speed = 1
 
         self.tile_map = tile_map
+        self.pathfinder = pathfinder  # 있으면 (예: FlowField, HierarchicalPathfinder) 직접 A* 를 돌리지 않고 맡깁니다.
+        self.path_cache = path_cache  # 있으면 (PathCache) 여러 적이 구한 경로를 함께 다시 씁니다.
+        self.footprint = (1, 2)  # 길찾기에 쓰는 몸 크기 (타일 단위 가로, 세로)
         self.path = []
 
     def move(self, player):
@@ -56,6 +60,26 @@ class Enemy:
         return ((self.rect.centerx - player.rect.centerx) ** 2 + (self.rect.centery - player.rect.centery) ** 2) ** 0.5
 
     def astar(self, start, goal):
+        if self.path_cache is None:
+            path = self.find_path(start, goal)
+        else:
+            version = self.tile_map.version
+            path = self.path_cache.get(start, goal, self.footprint, version)
+            if path is None:
+                path = list(self.find_path(start, goal))
+                self.path_cache.put(start, goal, path, self.footprint, version)
+        if path:
+            path.pop(0)  # 시작 칸은 빼고 다음 칸부터 따라갑니다.
+        return path
+
+    def find_path(self, start, goal):
+        """
+        시작 칸을 포함한 경로를 돌려줍니다. 도달할 수 없으면 빈 리스트입니다.
+        """
+        if self.pathfinder is not None:
+            return self.pathfinder.find_path(start, goal)
+
+        clearance = ClearanceMap.for_tile_map(self.tile_map)
         open_list = []
         heapq.heappush(open_list, (0, start))
         came_from = {}
@@ -66,10 +90,10 @@ class Enemy:
             _, current = heapq.heappop(open_list)
 
             if current == goal:
-                path = []
+                path = [current]
                 while current in came_from:
-                    path.append(current)
                     current = came_from[current]
+                    path.append(current)
                 path.reverse()
                 return path
 
@@ -80,17 +104,16 @@ class Enemy:
             ]
 
             for nx, ny in neighbors:
-                if 0 <= nx < len(self.tile_map.tile_map[0]) and 0 <= ny < len(self.tile_map.tile_map):
-                    if (ny + 1 < len(self.tile_map.tile_map) and not self.tile_map.is_obstacle(nx, ny) and not self.tile_map.is_obstacle(nx, ny+1)):
-                        if (abs(nx - x) == 1 and abs(ny - y) == 1):  # 대각선 이동 체크
-                            if not can_move_diagonal(self.tile_map, current, ny - y, nx - x):
-                                continue
-                        tentative_g_score = g_score[current] + 1
-                        if (nx, ny) not in g_score or tentative_g_score < g_score[(nx, ny)]:
-                            came_from[(nx, ny)] = current
-                            g_score[(nx, ny)] = tentative_g_score
-                            f_score[(nx, ny)] = tentative_g_score + manhattan_distance((nx, ny), goal)
-                            heapq.heappush(open_list, (f_score[(nx, ny)], (nx, ny)))
+                if clearance.fits(nx, ny, 1, 2):  # 1x2 몸이 들어가는지
+                    if (abs(nx - x) == 1 and abs(ny - y) == 1):  # 대각선 이동 체크
+                        if not can_move_diagonal(self.tile_map, current, ny - y, nx - x):
+                            continue
+                    tentative_g_score = g_score[current] + 1
+                    if (nx, ny) not in g_score or tentative_g_score < g_score[(nx, ny)]:
+                        came_from[(nx, ny)] = current
+                        g_score[(nx, ny)] = tentative_g_score
+                        f_score[(nx, ny)] = tentative_g_score + manhattan_distance((nx, ny), goal)
+                        heapq.heappush(open_list, (f_score[(nx, ny)], (nx, ny)))
 
         return []
 
@@ -69,7 +69,7 @@ class Player:
                 self.velocity_y = 0
 
     def check_collision(self):
-        return [tile for tile in self.tile_map.tiles if self.rect.colliderect(tile)]
+        return self.tile_map.colliding_tiles(self.rect)
 
     def draw(self, surface):
         pygame.draw.rect(surface, self.color, self.rect)
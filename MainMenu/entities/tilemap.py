@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import pygame
 
 # 색상 정의
@@ -5,9 +7,16 @@ GREEN = (0, 255, 0)
 BROWN = (139, 69, 19)
 GREY = (128, 128, 128)
 
+LAYER_CHUNK_TILES = 16  # 미리 그려 두는 Surface 한 장이 덮는 칸 수 (가로, 세로)
+LAYER_COLORKEY = (255, 0, 255)  # 미리 그린 Surface 에서 빈칸을 투명하게 할 색 (타일 색과 겹치지 않게)
+LAYER_CHUNK_CACHE = 64  # 미리 그려 둔 청크를 최대 몇 장까지 들고 있을지 (넘치면 가장 오래 안 보인 것부터 버립니다)
+
 class TileMap:
-    def __init__(self, tile_size, map_type):
-        if map_type == 'basic':
+    def __init__(self, tile_size, map_type, tile_map=None, merge_tiles=False):
+        if tile_map is not None:  # 문자열 리스트로 직접 만든 맵 (벤치마크, 에디터 등)
+            self.tile_map = list(tile_map)
+            self.color = GREY
+        elif map_type == 'basic':
             self.tile_map = [
                 "################",
                 "#..............#",
@@ -66,20 +75,223 @@ class TileMap:
             self.color = GREY
 
         self.tile_size = tile_size
+        # True 면 이웃한 벽 칸들을 큰 직사각형으로 합쳐서 충돌 검사와 그리기에 씁니다. (tiles 수가 크게 줄어듭니다)
+        self.merge_tiles = merge_tiles
         self.tiles = self.create_tiles()
+        self.version = 0  # 타일이 바뀔 때마다 1씩 증가
+        self.listeners = []  # 타일이 바뀌면 listener(x, y) 로 알려 줍니다.
+        self.clearance = None  # ClearanceMap.for_tile_map 이 처음 불릴 때 만들어 둡니다.
+        self.layer_chunks = OrderedDict()  # (청크 x, 청크 y) -> 벽을 미리 그려 둔 Surface (벽이 없으면 None), 오래 안 쓴 순서
+        self.max_layer_chunks = LAYER_CHUNK_CACHE
 
     def create_tiles(self):
+        # 칸 (x, y) 의 Rect 를 tile_rects[y][x] 에 두고 (빈칸은 None), 충돌 검사 때 다시 만들지 않고 꺼내 씁니다.
+        tiles = self.create_merged_tiles() if self.merge_tiles else self.create_cell_tiles()
+        # id(Rect) -> tiles 에서의 위치. set_tile 이 tiles 를 모두 훑지 않고 Rect 하나만 넣고 뺄 수 있게 합니다.
+        self.tile_slots = {id(tile): index for index, tile in enumerate(tiles)}
+        return tiles
+
+    def create_cell_tiles(self):
         tiles = []
+        self.tile_rects = []
         for row_index, row in enumerate(self.tile_map):
+            rect_row = []
             for col_index, col in enumerate(row):
                 if col == "#":
                     tile = pygame.Rect(col_index * self.tile_size, row_index * self.tile_size, self.tile_size, self.tile_size)
                     tiles.append(tile)
+                    rect_row.append(tile)
+                else:
+                    rect_row.append(None)
+            self.tile_rects.append(rect_row)
         return tiles
 
-    def draw(self, surface):
-        for tile in self.tiles:
-            pygame.draw.rect(surface, self.color, tile)
+    def create_merged_tiles(self):
+        """
+        벽 칸들을 욕심쟁이 방식으로 합친 직사각형 목록을 만듭니다.
+        왼쪽 위부터 아직 합쳐지지 않은 벽 칸을 찾아 오른쪽으로 최대한 늘리고, 그 너비 그대로 아래로 최대한 늘립니다.
+        tile_rects[y][x] 에는 그 칸을 덮는 합친 Rect 가 들어갑니다. (여러 칸이 같은 Rect 를 가리킵니다)
+        """
+        width = len(self.tile_map[0])
+        height = len(self.tile_map)
+        self.tile_rects = [[None] * width for _ in range(height)]
+        return self.merge_region(0, 0, width, height)
+
+    def merge_region(self, left, top, right, bottom):
+        """
+        (left, top) ~ (right, bottom) 칸 범위 (끝은 포함하지 않음) 안에서 아직 Rect 가 없는 벽 칸만 합칩니다.
+        새로 만든 Rect 들을 돌려줍니다. 범위 밖이나 이미 다른 Rect 가 덮은 칸으로는 늘리지 않습니다.
+        """
+        tile_size = self.tile_size
+        tiles = []
+        for y in range(top, bottom):
+            row = self.tile_map[y]
+            rect_row = self.tile_rects[y]
+            x = left
+            while x < right:
+                if row[x] != "#" or rect_row[x] is not None:
+                    x += 1
+                    continue
+                end = x + 1
+                while end < right and row[end] == "#" and rect_row[end] is None:
+                    end += 1
+                below_end = y + 1
+                while below_end < bottom:
+                    below = self.tile_map[below_end]
+                    below_rects = self.tile_rects[below_end]
+                    if any(below[col] != "#" or below_rects[col] is not None for col in range(x, end)):
+                        break
+                    below_end += 1
+                tile = pygame.Rect(x * tile_size, y * tile_size, (end - x) * tile_size, (below_end - y) * tile_size)
+                tiles.append(tile)
+                for rect_row_below in self.tile_rects[y:below_end]:
+                    rect_row_below[x:end] = [tile] * (end - x)
+                x = end
+        return tiles
+
+    def _add_tile(self, tile):
+        self.tile_slots[id(tile)] = len(self.tiles)
+        self.tiles.append(tile)
+
+    def _remove_tile(self, tile):
+        # 마지막 Rect 를 빈자리로 옮겨 O(1) 에 뺍니다. (tiles 의 순서는 바뀝니다)
+        index = self.tile_slots.pop(id(tile))
+        last = self.tiles.pop()
+        if last is not tile:
+            self.tiles[index] = last
+            self.tile_slots[id(last)] = index
+
+    def colliding_tiles(self, rect):
+        """
+        rect 와 겹치는 벽 타일 Rect 들을 칸 순서 (위 행부터, 행 안에서는 왼쪽부터) 로 돌려줍니다.
+        rect 가 덮는 칸 범위만 읽으므로 맵 크기와 상관없이 rect 크기에만 비례합니다.
+        merge_tiles 일 때는 합친 Rect 를 한 번씩만 돌려줍니다. 벽 밖에서 출발해 한 축으로 한 칸 이하 움직인 몸은
+        겹치는 칸이 모두 같은 열(또는 행)에 있고 그 칸을 덮는 합친 Rect 도 같은 변에서 시작하므로,
+        update_position 의 밀어내기 결과가 칸마다 검사할 때와 같습니다. (benchmarks/merged_tiles.py)
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        tile_size = self.tile_size
+        left = max(0, rect.left // tile_size)
+        right = min(len(self.tile_map[0]) - 1, (rect.right - 1) // tile_size)
+        top = max(0, rect.top // tile_size)
+        bottom = min(len(self.tile_map) - 1, (rect.bottom - 1) // tile_size)
+        if left > right or top > bottom:
+            return []  # 맵 밖 (음수 끝값이 슬라이스에서 뒤에서부터 세는 값으로 바뀌지 않게)
+        collisions = []
+        if not self.merge_tiles:
+            # 칸마다 다른 Rect 라서 겹칠 일이 없습니다.
+            for rect_row in self.tile_rects[top:bottom + 1]:
+                collisions.extend(tile for tile in rect_row[left:right + 1] if tile is not None)
+            return collisions
+        seen = set()  # 여러 칸이 같은 합친 Rect 를 가리키므로 한 번씩만 (id 로 비교)
+        for rect_row in self.tile_rects[top:bottom + 1]:
+            for tile in rect_row[left:right + 1]:
+                if tile is not None and id(tile) not in seen:
+                    seen.add(id(tile))
+                    collisions.append(tile)
+        return collisions
+
+    def layer_chunk(self, chunk_x, chunk_y):
+        """
+        청크 (LAYER_CHUNK_TILES x LAYER_CHUNK_TILES 칸) 의 벽을 한 번만 Surface 에 그려 두고 돌려줍니다.
+        빈칸은 LAYER_COLORKEY 로 투명하게 둡니다. 칸마다 칠하므로 합친 Rect 를 그릴 때와 같은 그림입니다.
+        """
+        key = (chunk_x, chunk_y)
+        if key in self.layer_chunks:
+            self.layer_chunks.move_to_end(key)
+            return self.layer_chunks[key]
+        tile_size = self.tile_size
+        left = chunk_x * LAYER_CHUNK_TILES
+        top = chunk_y * LAYER_CHUNK_TILES
+        rows = [row[left:left + LAYER_CHUNK_TILES] for row in self.tile_map[top:top + LAYER_CHUNK_TILES]]
+        chunk = None
+        if any("#" in row for row in rows):
+            chunk = pygame.Surface((len(rows[0]) * tile_size, len(rows) * tile_size))
+            chunk.fill(LAYER_COLORKEY)
+            chunk.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+            for y, row in enumerate(rows):
+                for x, col in enumerate(row):
+                    if col == "#":
+                        chunk.fill(self.color, (x * tile_size, y * tile_size, tile_size, tile_size))
+        self.layer_chunks[key] = chunk
+        return chunk
+
+    def draw(self, surface, camera_position=(0, 0)):
+        """
+        타일마다 그리는 대신 미리 그려 둔 청크 중 화면에 보이는 것만 한 번에 붙입니다.
+        camera_position 은 surface 의 왼쪽 위에 오는 맵 좌표입니다. 보이는 청크만 (처음 보일 때) 그리고,
+        max_layer_chunks 장이 넘으면 가장 오래 안 보인 청크부터 버리므로 맵이 아무리 길어도 메모리가 늘지 않습니다.
+        이번 프레임에 보인 청크는 한도보다 많아도 버리지 않습니다. (버리면 다음 프레임에 또 그려야 합니다)
+        """
+        chunk_pixels = self.tile_size * LAYER_CHUNK_TILES
+        camera_x, camera_y = (int(value) for value in camera_position)
+        clip = surface.get_clip().move(camera_x, camera_y)
+        left = max(0, clip.left // chunk_pixels)
+        right = min((len(self.tile_map[0]) - 1) // LAYER_CHUNK_TILES, (clip.right - 1) // chunk_pixels)
+        top = max(0, clip.top // chunk_pixels)
+        bottom = min((len(self.tile_map) - 1) // LAYER_CHUNK_TILES, (clip.bottom - 1) // chunk_pixels)
+        blits = []
+        for chunk_y in range(top, bottom + 1):
+            for chunk_x in range(left, right + 1):
+                chunk = self.layer_chunk(chunk_x, chunk_y)
+                if chunk is not None:
+                    blits.append((chunk, (chunk_x * chunk_pixels - camera_x, chunk_y * chunk_pixels - camera_y)))
+        surface.blits(blits, False)
+        # 보인 청크는 모두 뒤쪽으로 옮겨졌으므로 앞쪽 (보이지 않은 것) 부터 버립니다.
+        keep = max(self.max_layer_chunks, (right - left + 1) * (bottom - top + 1))
+        while len(self.layer_chunks) > keep:
+            self.layer_chunks.popitem(last=False)
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def set_tile(self, x, y, tile):
+        """
+        (x, y) 타일을 바꾸고 ("#" 또는 "."), 등록된 listener 들에게 알립니다.
+        tiles 는 바뀐 Rect 만 넣고 빼므로 맵 크기와 상관없습니다. merge_tiles 면 이 칸과 상하좌우 칸을 덮던
+        합친 Rect 들만 풀어서 그 범위 안에서 다시 합칩니다. (맵 전체를 다시 합친 모양과는 다를 수 있습니다)
+        """
+        row = self.tile_map[y]
+        if row[x] == tile:
+            return
+        self.tile_map[y] = row[:x] + tile + row[x + 1:]
+        if self.merge_tiles:
+            self.remerge_around(x, y)
+        elif tile == "#":
+            self.tile_rects[y][x] = pygame.Rect(x * self.tile_size, y * self.tile_size, self.tile_size, self.tile_size)
+            self._add_tile(self.tile_rects[y][x])
+        else:
+            self._remove_tile(self.tile_rects[y][x])
+            self.tile_rects[y][x] = None
+        self.layer_chunks.pop((x // LAYER_CHUNK_TILES, y // LAYER_CHUNK_TILES), None)  # 다음 draw 때 다시 그립니다.
+        self.version += 1
+        for listener in self.listeners:
+            listener(x, y)
+
+    def remerge_around(self, x, y):
+        tile_size = self.tile_size
+        width = len(self.tile_map[0])
+        height = len(self.tile_map)
+        affected = {}
+        for cell_x, cell_y in ((x, y), (x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if 0 <= cell_x < width and 0 <= cell_y < height and self.tile_rects[cell_y][cell_x] is not None:
+                tile = self.tile_rects[cell_y][cell_x]
+                affected[id(tile)] = tile
+        left, top, right, bottom = x, y, x + 1, y + 1
+        for tile in affected.values():
+            self._remove_tile(tile)
+            tile_left, tile_top = tile.left // tile_size, tile.top // tile_size
+            tile_right, tile_bottom = tile.right // tile_size, tile.bottom // tile_size
+            for rect_row in self.tile_rects[tile_top:tile_bottom]:
+                rect_row[tile_left:tile_right] = [None] * (tile_right - tile_left)
+            left, top = min(left, tile_left), min(top, tile_top)
+            right, bottom = max(right, tile_right), max(bottom, tile_bottom)
+        for tile in self.merge_region(left, top, right, bottom):
+            self._add_tile(tile)
 
     def is_obstacle(self, x, y):
         """
@@ -2,6 +2,7 @@ from entities.player import Player
 from entities.enemy import Enemy
 from entities.tilemap import TileMap
 from ui.button import Button
+from pathfinding.flow_field import FlowField
 import pygame
 
 # Pygame 초기화
@@ -23,9 +24,11 @@ FPS = 60
 
 class Game:
     def __init__(self):
-        self.tile_map = TileMap(TILE_SIZE, 'basic')  # 'basic' 맵 사용
+        self.tile_map = TileMap(TILE_SIZE, 'basic', merge_tiles=True)  # 'basic' 맵 사용, 벽 칸은 합쳐서 충돌 검사와 그리기
+        # 플레이어를 쫓는 적들이 함께 쓰는 흐름장 (적의 몸은 1x2 타일). 넓은 맵에서 적마다 목표가 다르면 HierarchicalPathfinder 를 씁니다.
+        self.pathfinder = FlowField.from_tile_map(self.tile_map, agent_height=2)
         self.player = Player(100, SCREEN_HEIGHT - 60 - 10, 'basic', self.tile_map)  # 'basic' 플레이어 사용
-        self.enemy = Enemy(200, 200, 'basic', self.tile_map)  # 'basic' 적 사용
+        self.enemy = Enemy(200, 200, 'basic', self.tile_map, self.pathfinder)  # 'basic' 적 사용
         self.current_scene = "menu"  # 초기 화면은 메뉴로 설정
         self.play_button = Button("Play", (350, 300), font=50)
         self.options_button = Button("Options", (350, 400), font=50)
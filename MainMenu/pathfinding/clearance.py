@@ -0,0 +1,95 @@
+from array import array
+
+
+class ClearanceMap:
+    """
+    칸마다 "이 칸을 몸의 왼쪽 위로 해서 들어갈 수 있는 가장 넓은 몸의 너비" 를 몸 높이별로 미리 계산해 둡니다.
+    w x h 몸이 (x, y) 에 설 수 있는지는 widths(h)[index] >= w 비교 한 번이면 됩니다.
+    칸 번호는 GridMap 과 같이 맵 바깥을 한 칸씩 감싼 (y + 1) * stride + (x + 1) 입니다.
+    타일이 바뀌면 그 줄의 빈칸 길이와, 그 타일을 몸으로 덮을 수 있는 줄들만 다시 계산합니다.
+    """
+
+    def __init__(self, rows, wall_char="#"):
+        self.rows = rows  # TileMap.tile_map 처럼 문자열 리스트 (바뀐 줄은 같은 리스트에서 다시 읽습니다)
+        self.wall_char = wall_char
+        self.width = len(rows[0])
+        self.height = len(rows)
+        self.stride = self.width + 2
+        self.size = self.stride * (self.height + 2)
+        # 칸에서 오른쪽으로 이어지는 빈칸 수 (자기 자신 포함, 벽이면 0)
+        self.free_right = array("i", [0]) * self.size
+        self.layers = {}  # 몸 높이 -> 칸마다 들어갈 수 있는 가장 넓은 몸의 너비
+        for y in range(self.height):
+            self._update_row(y)
+
+    @classmethod
+    def for_tile_map(cls, tile_map, wall_char="#"):
+        """
+        TileMap 하나에 하나만 만들어 tile_map.clearance 에 두고, 여러 길찾기가 함께 씁니다.
+        다른 listener 들이 바뀐 값을 읽을 수 있도록 listener 목록의 맨 앞에 등록합니다.
+        """
+        if tile_map.clearance is None:
+            tile_map.clearance = cls(tile_map.tile_map, wall_char)
+            tile_map.listeners.insert(0, tile_map.clearance.on_tile_changed)
+        return tile_map.clearance
+
+    def index(self, x, y):
+        return (y + 1) * self.stride + (x + 1)
+
+    def _update_row(self, y):
+        free_right = self.free_right
+        wall_char = self.wall_char
+        index = self.index(self.width - 1, y)
+        run = 0
+        for char in reversed(self.rows[y]):
+            run = 0 if char == wall_char else run + 1
+            free_right[index] = run
+            index -= 1
+
+    def _update_layer(self, layer, height, first_y, last_y):
+        # 몸 높이 height 인 몸이 맵 안에 들어가는 줄만 계산하고, 나머지 줄은 0 으로 둡니다.
+        free_right = self.free_right
+        width = self.width
+        stride = self.stride
+        for y in range(max(0, first_y), min(last_y, self.height - height) + 1):
+            start = self.index(0, y)
+            widths = free_right[start:start + width]
+            for below in range(1, height):
+                row_start = start + below * stride
+                widths = array("i", map(min, widths, free_right[row_start:row_start + width]))
+            layer[start:start + width] = widths
+
+    def widths(self, height):
+        """
+        몸 높이 height 에 대해 칸마다 들어갈 수 있는 가장 넓은 몸의 너비 배열을 돌려줍니다. 처음 물을 때 한 번 만듭니다.
+        """
+        layer = self.layers.get(height)
+        if layer is None:
+            layer = array("i", [0]) * self.size
+            self._update_layer(layer, height, 0, self.height - 1)
+            self.layers[height] = layer
+        return layer
+
+    def fits(self, x, y, width=1, height=1):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return self.widths(height)[self.index(x, y)] >= width
+
+    def can_move_diagonal(self, x, y, dx, dy, width=1, height=1):
+        """
+        (x, y) 에서 (x + dx, y + dy) 로 대각선 이동할 때 가로로 한 칸, 세로로 한 칸 옮긴 자리에도 몸이 들어가는지 봅니다.
+        (몸이 모서리에 걸리지 않는지)
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        if not (0 <= x + dx < self.width and 0 <= y + dy < self.height):
+            return False
+        layer = self.widths(height)
+        index = self.index(x, y)
+        vertical = dy * self.stride
+        return layer[index + dx] >= width and layer[index + vertical] >= width and layer[index + dx + vertical] >= width
+
+    def on_tile_changed(self, x, y):
+        self._update_row(y)
+        for height, layer in self.layers.items():
+            self._update_layer(layer, height, y - height + 1, y)
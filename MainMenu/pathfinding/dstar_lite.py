@@ -0,0 +1,267 @@
+import heapq
+from array import array
+
+from pathfinding.grid import DIAGONAL_COST, STRAIGHT_COST, GridMap, octile_distance
+
+INFINITY = 2 ** 31 - 1
+
+
+class DStarLite:
+    """
+    적 한 마리용 D* Lite 입니다. 목표(플레이어)에서 거꾸로 탐색한 트리를 남겨 두고 다음 번 계획 때 다시 씁니다.
+    - 적(시작점)이 움직이면 km 만 늘리고 트리는 그대로 씁니다.
+    - 타일이 바뀌면 그 칸과 이웃 칸의 rhs 만 다시 계산해서 영향을 받는 노드만 고칩니다.
+    - 목표가 지난 경로 위의 칸으로 옮겨 가면 새 목표를 뿌리로, 예전 목표를 보통 칸으로 바꿔서 (Moving Target D* Lite 의 기본형) 고칩니다.
+      경로 밖으로 옮겨 가면 새로 탐색합니다.
+    g/rhs 는 목표까지의 거리이고, 비용과 대각선 규칙은 GridAStar 와 같습니다.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.g = array("i", [INFINITY]) * grid.size
+        self.rhs = array("i", [INFINITY]) * grid.size
+        self._unknown = array("i", [INFINITY]) * grid.size
+        self.neighbors = grid.neighbor_offsets()
+        self.queue = []  # (k1, k2, 칸) 힙. queued 와 값이 다른 항목은 버려진 항목입니다.
+        self.queued = {}  # 칸 -> 지금 유효한 키
+        self.start = -1
+        self.goal = -1
+        self.last_start = -1
+        self.km = 0
+        self.changed_cells = []  # 다음 계획 때 반영할, 지나갈 수 있는지가 바뀐 셀
+        self.path_cells = set()  # 마지막으로 돌려준 경로의 칸들
+        self.expanded = 0  # 마지막 계획에서 꺼내 처리한 노드 수
+        self.tile_map = None
+
+    @classmethod
+    def from_tile_map(cls, tile_map, agent_width=1, agent_height=1):
+        planner = cls(GridMap.from_tile_map(tile_map, agent_width, agent_height))
+        planner.tile_map = tile_map
+        tile_map.add_listener(planner.on_tile_changed)
+        return planner
+
+    def on_tile_changed(self, x, y):
+        self.changed_cells.extend(self.grid.refresh_cells(x, y))
+
+    def heuristic(self, index):
+        stride = self.grid.stride
+        y, x = divmod(index, stride)
+        start_y, start_x = divmod(self.start, stride)
+        return octile_distance(abs(x - start_x), abs(y - start_y))
+
+    def calculate_key(self, index):
+        g = min(self.g[index], self.rhs[index])
+        if g == INFINITY:
+            return (INFINITY, INFINITY)
+        return (g + self.heuristic(index) + self.km, g)
+
+    def update_vertex(self, index):
+        if self.g[index] != self.rhs[index]:
+            key = self.calculate_key(index)
+            if self.queued.get(index) != key:
+                self.queued[index] = key
+                heapq.heappush(self.queue, (key[0], key[1], index))
+        elif index in self.queued:
+            del self.queued[index]
+
+    def successors(self, index):
+        # (이웃 칸, 비용). 벽 칸에서는 어디로도 갈 수 없습니다.
+        walls = self.grid.walls
+        if walls[index]:
+            return
+        for offset, cost, side_a, side_b in self.neighbors:
+            neighbor = index + offset
+            if walls[neighbor]:
+                continue
+            if side_a and (walls[index + side_a] or walls[index + side_b]):
+                continue
+            yield neighbor, cost
+
+    def best_rhs(self, index):
+        g = self.g
+        best = INFINITY
+        for neighbor, cost in self.successors(index):
+            if g[neighbor] != INFINITY and g[neighbor] + cost < best:
+                best = g[neighbor] + cost
+        return best
+
+    def reset(self, start, goal):
+        self.g[:] = self._unknown
+        self.rhs[:] = self._unknown
+        self.queue = []
+        self.queued = {}
+        self.km = 0
+        self.changed_cells = []
+        self.start = self.last_start = start
+        self.goal = goal
+        self.rhs[goal] = 0
+        self.update_vertex(goal)
+
+    def compute_shortest_path(self):
+        # 한 번 계획할 때 가장 많이 도는 부분이라 키 계산과 이웃 보기를 메서드 호출 없이 풀어 씁니다.
+        walls = self.grid.walls
+        stride = self.grid.stride
+        neighbors = self.neighbors
+        g = self.g
+        rhs = self.rhs
+        queue = self.queue
+        queued = self.queued
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        start = self.start
+        goal = self.goal
+        km = self.km
+        start_y, start_x = divmod(start, stride)
+        straight = STRAIGHT_COST
+        diagonal_extra = DIAGONAL_COST - 2 * STRAIGHT_COST
+        expanded = 0
+
+        def update_vertex(index):
+            value = g[index]
+            other = rhs[index]
+            if value != other:
+                if other < value:
+                    value = other
+                y, x = divmod(index, stride)
+                dx = abs(x - start_x)
+                dy = abs(y - start_y)
+                key = (value + straight * (dx + dy) + diagonal_extra * (dx if dx < dy else dy) + km, value)
+                if queued.get(index) != key:
+                    queued[index] = key
+                    heappush(queue, (key[0], key[1], index))
+            elif index in queued:
+                del queued[index]
+
+        def best_rhs(index):
+            best = INFINITY
+            if walls[index]:
+                return best
+            for offset, cost, side_a, side_b in neighbors:
+                neighbor = index + offset
+                if walls[neighbor] or g[neighbor] == INFINITY:
+                    continue
+                if side_a and (walls[index + side_a] or walls[index + side_b]):
+                    continue
+                if g[neighbor] + cost < best:
+                    best = g[neighbor] + cost
+            return best
+
+        while queue:
+            k1, k2, index = queue[0]
+            if queued.get(index) != (k1, k2):
+                heappop(queue)  # 버려진 항목
+                continue
+            start_value = g[start] if g[start] < rhs[start] else rhs[start]
+            if not ((k1, k2) < (start_value + km, start_value) or rhs[start] != g[start]):
+                break
+            heappop(queue)
+            new_key = self.calculate_key(index)
+            if (k1, k2) < new_key:
+                # km 이 늘어나기 전에 넣은 키이므로 새 키로 다시 넣습니다.
+                queued[index] = new_key
+                heappush(queue, (new_key[0], new_key[1], index))
+                continue
+            del queued[index]
+            expanded += 1
+            if walls[index]:
+                successors = ()
+            else:
+                successors = [
+                    (index + offset, cost)
+                    for offset, cost, side_a, side_b in neighbors
+                    if not walls[index + offset]
+                    and not (side_a and (walls[index + side_a] or walls[index + side_b]))
+                ]
+            if g[index] > rhs[index]:
+                value = g[index] = rhs[index]
+                for neighbor, cost in successors:
+                    if neighbor != goal and value + cost < rhs[neighbor]:
+                        rhs[neighbor] = value + cost
+                        update_vertex(neighbor)
+            else:
+                old_g = g[index]
+                g[index] = INFINITY
+                if index != goal:
+                    rhs[index] = best_rhs(index)
+                update_vertex(index)
+                for neighbor, cost in successors:
+                    if neighbor != goal and rhs[neighbor] == old_g + cost:
+                        rhs[neighbor] = best_rhs(neighbor)
+                        update_vertex(neighbor)
+        self.expanded = expanded
+
+    def _move_goal(self, goal):
+        old_goal = self.goal
+        self.goal = goal
+        # 새 목표의 값을 0 이 아니라 지금 값으로 두면, 새 목표를 거쳐 예전 목표로 가던 칸들(새 목표 아래의 가지)은
+        # 모든 값이 같은 만큼 차이 나는 그대로 맞는 값이라 고칠 필요가 없습니다. 값이 늘어나는 칸들만 다시 계산됩니다.
+        if self.g[goal] == INFINITY:
+            self.rhs[goal] = 0
+        else:
+            self.rhs[goal] = self.g[goal]
+        self.update_vertex(goal)
+        self.rhs[old_goal] = self.best_rhs(old_goal)
+        self.update_vertex(old_goal)
+
+    def _apply_changed_cells(self):
+        # 칸이 막히거나 열리면 그 칸과 이웃 칸에서 나가는 간선(대각선 옆칸 규칙 포함)이 바뀝니다.
+        stride = self.grid.stride
+        touched = set()
+        for x, y in self.changed_cells:
+            index = self.grid.index(x, y)
+            for offset in (0, -1, 1, -stride, stride, -stride - 1, -stride + 1, stride - 1, stride + 1):
+                touched.add(index + offset)
+        self.changed_cells = []
+        for index in touched:
+            if 0 <= index < self.grid.size and index != self.goal:
+                self.rhs[index] = self.best_rhs(index)
+                self.update_vertex(index)
+
+    def find_path(self, start, goal):
+        """
+        start 에서 goal 까지의 경로를 (x, y) 리스트로 돌려줍니다. 시작점과 목표점을 모두 포함하고, 없으면 빈 리스트입니다.
+        같은 객체로 다시 부르면 앞의 탐색 결과를 고쳐서 씁니다.
+        """
+        grid = self.grid
+        self.expanded = 0
+        if not grid.is_walkable(*start) or not grid.is_walkable(*goal):
+            return []
+        start_index = grid.index(*start)
+        goal_index = grid.index(*goal)
+
+        if self.goal == -1 or (goal_index != self.goal and goal_index not in self.path_cells):
+            # 목표가 지난 경로 밖으로 옮겨 가면 예전 트리의 거의 모든 값이 늘어나야 해서,
+            # 고치는 것보다 새로 탐색하는 쪽이 확장 수가 적습니다. (benchmarks/dstar_chase.py)
+            self.reset(start_index, goal_index)
+        else:
+            if start_index != self.start:
+                self.start = start_index
+                self.km += self.heuristic(self.last_start)
+                self.last_start = start_index
+            if goal_index != self.goal:
+                self._move_goal(goal_index)
+            if self.changed_cells:
+                self._apply_changed_cells()
+        self.compute_shortest_path()
+        return self.build_path()
+
+    def build_path(self):
+        g = self.g
+        self.path_cells = set()
+        if g[self.start] == INFINITY:
+            return []
+        position = self.grid.position
+        current = self.start
+        path = [position(current)]
+        while current != self.goal:
+            best = INFINITY
+            for neighbor, cost in self.successors(current):
+                if g[neighbor] != INFINITY and g[neighbor] + cost < best:
+                    best = g[neighbor] + cost
+                    next_index = neighbor
+            if best == INFINITY:
+                return []
+            current = next_index
+            path.append(position(current))
+            self.path_cells.add(current)
+        return path
@@ -0,0 +1,131 @@
+import heapq
+from array import array
+
+from pathfinding.grid import GridMap
+from pathfinding.lazy_path import LazyPath
+
+
+class FlowField:
+    """
+    플레이어 칸에서 거꾸로 한 번 Dijkstra 를 돌려, 모든 칸에 대해 "다음에 갈 칸" 을 기록해 두는 흐름장입니다.
+    같은 플레이어를 쫓는 적이 여러 마리여도 탐색은 한 번이고, 적마다 다음 칸은 배열을 한 번 읽으면 됩니다.
+    플레이어의 그리드 칸이 바뀌거나 타일이 바뀌었을 때만 다시 계산합니다.
+    """
+
+    def __init__(self, grid, max_distance=None):
+        self.grid = grid
+        self.max_distance = max_distance  # 이 비용보다 먼 칸은 계산하지 않습니다. (None 이면 맵 전체)
+        self.distance = array("i", [-1]) * grid.size
+        self.next_cell = array("i", [-1]) * grid.size
+        self._unreached = array("i", [-1]) * grid.size
+        self.neighbors = grid.neighbor_offsets()
+        self.goal = None  # 마지막으로 계산한 목표 칸
+        self.anchor = -1  # 목표 칸에 몸이 들어가지 않을 때 대신 쓴 칸
+        self.dirty = True
+        self.recomputed = 0  # 다시 계산한 횟수
+        self.tile_map = None
+
+    @classmethod
+    def from_tile_map(cls, tile_map, agent_width=1, agent_height=1, max_distance=None):
+        """
+        TileMap 에서 만들고, 타일이 바뀌면 다음 update 때 다시 계산하도록 표시합니다.
+        적처럼 1x2 몸이면 agent_height=2 로 만들면 is_obstacle(nx, ny) 와 is_obstacle(nx, ny+1) 규칙이 그대로 적용됩니다.
+        """
+        field = cls(GridMap.from_tile_map(tile_map, agent_width, agent_height), max_distance)
+        field.tile_map = tile_map
+        tile_map.add_listener(field.on_tile_changed)
+        return field
+
+    def on_tile_changed(self, x, y):
+        if self.grid.refresh_cells(x, y):
+            self.dirty = True
+
+    def _anchor_for(self, goal):
+        # 목표 칸에 몸이 안 들어가면 (바닥에 닿은 플레이어의 발 칸 등) 몸 높이만큼 위쪽 칸을 대신 씁니다.
+        grid = self.grid
+        x, y = goal
+        for anchor_y in range(y, y - grid.agent_height, -1):
+            if grid.is_walkable(x, anchor_y):
+                return grid.index(x, anchor_y)
+        return -1
+
+    def update(self, goal):
+        """
+        목표 칸이 바뀌었거나 타일이 바뀌었으면 흐름장을 다시 계산합니다. 다시 계산했으면 True 를 돌려줍니다.
+        """
+        if goal == self.goal and not self.dirty:
+            return False
+        self.goal = goal
+        self.dirty = False
+        self.recomputed += 1
+
+        distance = self.distance
+        next_cell = self.next_cell
+        distance[:] = self._unreached
+        self.anchor = self._anchor_for(goal)
+        if self.anchor == -1:
+            return True
+
+        walls = self.grid.walls
+        max_distance = self.max_distance
+        distance[self.anchor] = 0
+        next_cell[self.anchor] = -1
+        open_heap = [(0, self.anchor)]
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        while open_heap:
+            current_distance, current = heappop(open_heap)
+            if current_distance != distance[current]:
+                continue  # 더 짧은 거리로 다시 들어간 예전 항목
+            for offset, cost, side_a, side_b in self.neighbors:
+                neighbor = current + offset
+                if walls[neighbor]:
+                    continue
+                if side_a and (walls[current + side_a] or walls[current + side_b]):
+                    continue
+                new_distance = current_distance + cost
+                if max_distance is not None and new_distance > max_distance:
+                    continue
+                old_distance = distance[neighbor]
+                if old_distance == -1 or new_distance < old_distance:
+                    distance[neighbor] = new_distance
+                    # 이동 규칙이 대칭이므로 neighbor 에서 목표로 가려면 current 로 가면 됩니다.
+                    next_cell[neighbor] = current
+                    heappush(open_heap, (new_distance, neighbor))
+        return True
+
+    def next_step(self, cell):
+        """
+        cell 에서 목표 쪽으로 다음에 갈 칸을 돌려줍니다. 도달할 수 없거나 이미 목표면 None 입니다.
+        """
+        if not self.grid.in_bounds(*cell):
+            return None
+        index = self.grid.index(*cell)
+        if self.distance[index] <= 0:
+            return None
+        return self.grid.position(self.next_cell[index])
+
+    def distance_to_goal(self, cell):
+        if not self.grid.in_bounds(*cell):
+            return -1
+        return self.distance[self.grid.index(*cell)]
+
+    def _walk(self, index):
+        position = self.grid.position
+        next_cell = self.next_cell
+        while index != -1:
+            yield (position(index),)
+            index = next_cell[index]
+
+    def find_path(self, start, goal):
+        """
+        Enemy 가 쓰는 pathfinder 인터페이스입니다. 흐름장을 따라가는 LazyPath 를 돌려주며, 한 칸마다 O(1) 입니다.
+        """
+        self.update(goal)
+        if not self.grid.in_bounds(*start):
+            return LazyPath((), goal)
+        start_index = self.grid.index(*start)
+        if self.distance[start_index] == -1:
+            return LazyPath((), goal)
+        return LazyPath(self._walk(start_index), self.grid.position(self.anchor))
@@ -0,0 +1,306 @@
+import heapq
+from array import array
+
+from pathfinding.clearance import ClearanceMap
+from pathfinding.heap import IndexedMinHeap
+
+# 이동 비용 (astar알고리즘_최종본.py 와 같은 정수 비용)
+STRAIGHT_COST = 10
+DIAGONAL_COST = 14
+
+# 수직/수평 4방향 다음에 대각선 4방향 (astar알고리즘_최종본.py 의 DIRECTIONS 와 같은 순서)
+DIRECTIONS = [
+    (0, 1), (1, 0), (0, -1), (-1, 0),
+    (1, 1), (-1, -1), (1, -1), (-1, 1),
+]
+
+
+class GridMap:
+    """
+    벽 정보를 평평한 bytearray 하나에 저장하는 그리드입니다.
+    셀 (x, y) 는 (y + 1) * stride + (x + 1) 번째 칸에 들어 있고, stride 는 width + 2 입니다.
+    맵 바깥을 한 칸 두께의 벽으로 감싸 두었기 때문에 이웃을 볼 때 경계 검사를 하지 않아도 됩니다.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.size = self.stride * (height + 2)
+        self.walls = bytearray(b"\x01") * self.size
+        # from_rows 로 만들었을 때 몸 크기 (셀 하나가 몸의 왼쪽 위 칸을 뜻합니다)
+        self.agent_width = 1
+        self.agent_height = 1
+        self.clearance = None  # from_rows / from_tile_map 으로 만들었을 때의 ClearanceMap
+        empty_row = bytes(width)
+        for y in range(height):
+            start = self.index(0, y)
+            self.walls[start:start + width] = empty_row
+
+    @classmethod
+    def from_grid_map(cls, grid_map, size=None):
+        """
+        astar알고리즘_최종본.py 의 {(x, y): {"wall": bool}} 형식을 한 번만 변환합니다.
+        size 를 주지 않으면 키 중 가장 큰 좌표로 크기를 정합니다.
+        """
+        if size is None:
+            width = max(x for x, _ in grid_map) + 1
+            height = max(y for _, y in grid_map) + 1
+        else:
+            width, height = size
+        grid = cls(width, height)
+        for (x, y), cell in grid_map.items():
+            if cell["wall"] and 0 <= x < width and 0 <= y < height:
+                grid.walls[grid.index(x, y)] = 1
+        return grid
+
+    @classmethod
+    def from_rows(cls, rows, wall_char="#", agent_width=1, agent_height=1):
+        """
+        TileMap.tile_map 처럼 문자열 리스트로 된 맵을 변환합니다.
+        agent_width x agent_height 크기의 몸을 가진 캐릭터용으로 만들면, 몸의 왼쪽 위 칸이 (x, y) 일 때
+        몸 전체가 맵 안의 빈칸에 들어가야 그 셀을 지나갈 수 있습니다. (Enemy 는 1x2 입니다)
+        """
+        return cls.from_clearance(ClearanceMap(rows, wall_char), agent_width, agent_height)
+
+    @classmethod
+    def from_tile_map(cls, tile_map, agent_width=1, agent_height=1):
+        """
+        TileMap 의 ClearanceMap 을 함께 쓰므로, 몸 크기가 다른 그리드를 여러 개 만들어도 빈칸 계산은 한 번입니다.
+        """
+        return cls.from_clearance(ClearanceMap.for_tile_map(tile_map), agent_width, agent_height)
+
+    @classmethod
+    def from_clearance(cls, clearance, agent_width=1, agent_height=1):
+        grid = cls(clearance.width, clearance.height)
+        grid.agent_width = agent_width
+        grid.agent_height = agent_height
+        grid.clearance = clearance
+        # 몸이 들어가는지는 너비 비교 한 번입니다. (맵 바깥 칸은 너비가 0 이라 그대로 벽이 됩니다)
+        grid.walls = bytearray(width < agent_width for width in clearance.widths(agent_height))
+        return grid
+
+    def refresh_cells(self, x, y):
+        """
+        타일 (x, y) 가 바뀐 뒤 (ClearanceMap 이 먼저 갱신된 다음), 그 타일을 몸으로 덮을 수 있는 셀들만 다시 읽습니다.
+        지나갈 수 있는지가 바뀐 셀 목록을 돌려줍니다.
+        """
+        layer = self.clearance.widths(self.agent_height)
+        changed = []
+        for cell_y in range(max(0, y - self.agent_height + 1), y + 1):
+            for cell_x in range(max(0, x - self.agent_width + 1), x + 1):
+                index = self.index(cell_x, cell_y)
+                wall = 1 if layer[index] < self.agent_width else 0
+                if self.walls[index] != wall:
+                    self.walls[index] = wall
+                    changed.append((cell_x, cell_y))
+        return changed
+
+    def index(self, x, y):
+        return (y + 1) * self.stride + (x + 1)
+
+    def position(self, index):
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_walkable(self, x, y):
+        return self.in_bounds(x, y) and not self.walls[self.index(x, y)]
+
+    def set_wall(self, x, y, wall=True):
+        self.walls[self.index(x, y)] = 1 if wall else 0
+
+    def neighbor_offsets(self):
+        """
+        (인덱스 차이, 이동 비용, 옆칸1, 옆칸2) 목록을 돌려줍니다.
+        대각선은 옆칸 두 곳이 모두 비어 있어야 이동할 수 있고 (모서리 끼기 방지), 직선 이동은 옆칸이 0 입니다.
+        """
+        offsets = []
+        for dx, dy in DIRECTIONS:
+            offset = dy * self.stride + dx
+            if dx and dy:
+                offsets.append((offset, DIAGONAL_COST, dx, dy * self.stride))
+            else:
+                offsets.append((offset, STRAIGHT_COST, 0, 0))
+        return offsets
+
+
+def octile_distance(dx, dy):
+    # astar알고리즘_최종본.py 의 heuristic() 과 같은 식입니다.
+    return STRAIGHT_COST * (dx + dy) + (DIAGONAL_COST - 2 * STRAIGHT_COST) * min(dx, dy)
+
+
+class GridAStar:
+    """
+    GridMap 위에서 8방향 A* 를 수행합니다.
+    g 값, 부모, 열림/닫힘 표시를 그리드 크기만큼 미리 잡아 둔 배열에 담고 탐색마다 다시 씁니다.
+    decrease_key=True 이면 heapq 대신 IndexedMinHeap 을 열린 목록으로 써서 같은 노드를 중복으로 넣지 않습니다.
+    """
+
+    def __init__(self, grid, decrease_key=False):
+        self.grid = grid
+        self.decrease_key = decrease_key
+        self.g_score = array("i", [0]) * grid.size
+        self.came_from = array("i", [-1]) * grid.size
+        self.seen = bytearray(grid.size)
+        self.closed = bytearray(grid.size)
+        self._empty = bytes(grid.size)
+        self.neighbors = grid.neighbor_offsets()
+        self.open_set = IndexedMinHeap()
+        self.expanded = 0  # 마지막 탐색에서 닫힌 노드 수
+        self.max_open = 0  # 마지막 탐색에서 열린 목록이 가장 컸을 때의 크기
+
+    def find_path(self, start, goal):
+        """
+        start 에서 goal 까지의 경로를 (x, y) 리스트로 돌려줍니다. 시작점과 목표점을 모두 포함합니다.
+        목표점에 도달할 수 없으면 빈 리스트를 돌려줍니다.
+        """
+        grid = self.grid
+        self.expanded = 0
+        self.max_open = 0
+        if not grid.is_walkable(*start) or not grid.is_walkable(*goal):
+            return []
+
+        self.seen[:] = self._empty
+        self.closed[:] = self._empty
+        start_index = grid.index(*start)
+        goal_index = grid.index(*goal)
+        self.g_score[start_index] = 0
+        self.came_from[start_index] = -1
+        self.seen[start_index] = 1
+
+        if self.decrease_key:
+            found = self._search_indexed(start_index, goal_index)
+        else:
+            found = self._search_heapq(start_index, goal_index)
+        return self.build_path(goal_index) if found else []
+
+    def _search_heapq(self, start_index, goal_index):
+        walls = self.grid.walls
+        stride = self.grid.stride
+        g_score = self.g_score
+        came_from = self.came_from
+        seen = self.seen
+        closed = self.closed
+        goal_y, goal_x = divmod(goal_index, stride)
+        start_y, start_x = divmod(start_index, stride)
+
+        h = octile_distance(abs(start_x - goal_x), abs(start_y - goal_y))
+        open_heap = [(h, h, start_index)]
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        expanded = 0
+        max_open = 1
+
+        while open_heap:
+            current = heappop(open_heap)[2]
+            if closed[current]:
+                continue  # 더 좋은 경로로 다시 들어간 예전 항목
+            if current == goal_index:
+                break
+            closed[current] = 1
+            expanded += 1
+            current_g = g_score[current]
+
+            for offset, cost, side_a, side_b in self.neighbors:
+                neighbor = current + offset
+                if walls[neighbor] or closed[neighbor]:
+                    continue
+                if side_a and (walls[current + side_a] or walls[current + side_b]):
+                    continue
+                tentative_g_score = current_g + cost
+                if seen[neighbor] and tentative_g_score >= g_score[neighbor]:
+                    continue
+                seen[neighbor] = 1
+                g_score[neighbor] = tentative_g_score
+                came_from[neighbor] = current
+                y, x = divmod(neighbor, stride)
+                dx = abs(x - goal_x)
+                dy = abs(y - goal_y)
+                h = STRAIGHT_COST * (dx + dy) + (DIAGONAL_COST - 2 * STRAIGHT_COST) * (dx if dx < dy else dy)
+                # f 가 같으면 h 가 작은(목표에 가까운) 노드를 먼저 꺼냅니다.
+                heappush(open_heap, (tentative_g_score + h, h, neighbor))
+            if len(open_heap) > max_open:
+                max_open = len(open_heap)
+        else:
+            current = -1
+
+        self.expanded = expanded
+        self.max_open = max_open
+        return current == goal_index
+
+    def _search_indexed(self, start_index, goal_index):
+        walls = self.grid.walls
+        stride = self.grid.stride
+        g_score = self.g_score
+        came_from = self.came_from
+        seen = self.seen
+        closed = self.closed
+        goal_y, goal_x = divmod(goal_index, stride)
+        start_y, start_x = divmod(start_index, stride)
+
+        open_set = self.open_set
+        open_set.clear()
+        h = octile_distance(abs(start_x - goal_x), abs(start_y - goal_y))
+        open_set.push(start_index, (h, h))
+        expanded = 0
+        max_open = 1
+        current = -1
+
+        while open_set.nodes:
+            current = open_set.pop()[1]
+            if current == goal_index:
+                break
+            closed[current] = 1
+            expanded += 1
+            current_g = g_score[current]
+
+            for offset, cost, side_a, side_b in self.neighbors:
+                neighbor = current + offset
+                if walls[neighbor] or closed[neighbor]:
+                    continue
+                if side_a and (walls[current + side_a] or walls[current + side_b]):
+                    continue
+                tentative_g_score = current_g + cost
+                if seen[neighbor]:
+                    if tentative_g_score >= g_score[neighbor]:
+                        continue
+                    g_score[neighbor] = tentative_g_score
+                    came_from[neighbor] = current
+                    h = open_set.priority(neighbor)[1]
+                    open_set.decrease_key(neighbor, (tentative_g_score + h, h))
+                    continue
+                seen[neighbor] = 1
+                g_score[neighbor] = tentative_g_score
+                came_from[neighbor] = current
+                y, x = divmod(neighbor, stride)
+                dx = abs(x - goal_x)
+                dy = abs(y - goal_y)
+                h = STRAIGHT_COST * (dx + dy) + (DIAGONAL_COST - 2 * STRAIGHT_COST) * (dx if dx < dy else dy)
+                open_set.push(neighbor, (tentative_g_score + h, h))
+            if len(open_set) > max_open:
+                max_open = len(open_set)
+        else:
+            current = -1
+
+        self.expanded = expanded
+        self.max_open = max_open
+        return current == goal_index
+
+    def build_path(self, index):
+        came_from = self.came_from
+        position = self.grid.position
+        path = []
+        while index != -1:
+            path.append(position(index))
+            index = came_from[index]
+        path.reverse()
+        return path
+
+    def path_cost(self, path):
+        cost = 0
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            cost += DIAGONAL_COST if x1 != x2 and y1 != y2 else STRAIGHT_COST
+        return cost
@@ -0,0 +1,148 @@
+class IndexedMinHeap:
+    """
+    노드 id 마다 힙 안의 위치를 기억하는 최소 힙입니다.
+    이미 들어 있는 노드의 우선순위를 낮출 수 있어서 (decrease_key) A* 의 열린 목록에 같은 노드가 두 번 들어가지 않습니다.
+    우선순위는 비교 가능한 값이면 무엇이든 되고 (예: (f, h) 튜플), 노드 id 는 해시 가능한 값이면 됩니다.
+    """
+
+    def __init__(self):
+        self.priorities = []  # 힙 자리마다의 우선순위
+        self.nodes = []  # 힙 자리마다의 노드 id
+        self.position = {}  # 노드 id -> 힙 자리
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, node):
+        return node in self.position
+
+    def contains(self, node):
+        return node in self.position
+
+    def is_empty(self):
+        return not self.nodes
+
+    def clear(self):
+        self.priorities.clear()
+        self.nodes.clear()
+        self.position.clear()
+
+    def priority(self, node):
+        return self.priorities[self.position[node]]
+
+    def peek(self):
+        if not self.nodes:
+            raise IndexError("Heap is empty")
+        return self.priorities[0], self.nodes[0]
+
+    def push(self, node, priority):
+        if node in self.position:
+            raise KeyError(f"{node!r} is already in the heap")
+        index = len(self.nodes)
+        self.priorities.append(priority)
+        self.nodes.append(node)
+        self.position[node] = index
+        self._sift_up(index)
+
+    def pop(self):
+        """
+        가장 작은 우선순위를 가진 (priority, node) 를 꺼냅니다.
+        """
+        if not self.nodes:
+            raise IndexError("Heap is empty")
+        priorities = self.priorities
+        nodes = self.nodes
+        top_priority = priorities[0]
+        top_node = nodes[0]
+        del self.position[top_node]
+
+        last_priority = priorities.pop()
+        last_node = nodes.pop()
+        if nodes:
+            priorities[0] = last_priority
+            nodes[0] = last_node
+            self.position[last_node] = 0
+            self._sift_down(0)
+        return top_priority, top_node
+
+    def decrease_key(self, node, priority):
+        index = self.position[node]
+        if priority > self.priorities[index]:
+            raise ValueError("new priority is larger than the current one")
+        self.priorities[index] = priority
+        self._sift_up(index)
+
+    def push_or_decrease(self, node, priority):
+        """
+        노드가 없으면 넣고, 있으면 더 작은 우선순위일 때만 갱신합니다. 값이 바뀌었으면 True 를 돌려줍니다.
+        """
+        index = self.position.get(node)
+        if index is None:
+            self.push(node, priority)
+            return True
+        if priority < self.priorities[index]:
+            self.priorities[index] = priority
+            self._sift_up(index)
+            return True
+        return False
+
+    def heapify(self, items):
+        """
+        (node, priority) 묶음으로 힙을 한 번에 다시 만듭니다. O(n) 입니다.
+        """
+        self.clear()
+        for node, priority in items:
+            if node in self.position:
+                raise KeyError(f"{node!r} is given more than once")
+            self.position[node] = len(self.nodes)
+            self.nodes.append(node)
+            self.priorities.append(priority)
+        for index in range(len(self.nodes) // 2 - 1, -1, -1):
+            self._sift_down(index)
+
+    def _sift_up(self, index):
+        # 바꿔치기 대신 빈자리를 위로 옮기고 마지막에 한 번만 씁니다.
+        priorities = self.priorities
+        nodes = self.nodes
+        position = self.position
+        priority = priorities[index]
+        node = nodes[index]
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent_priority = priorities[parent_index]
+            if not priority < parent_priority:
+                break
+            parent_node = nodes[parent_index]
+            priorities[index] = parent_priority
+            nodes[index] = parent_node
+            position[parent_node] = index
+            index = parent_index
+        priorities[index] = priority
+        nodes[index] = node
+        position[node] = index
+
+    def _sift_down(self, index):
+        priorities = self.priorities
+        nodes = self.nodes
+        position = self.position
+        size = len(nodes)
+        priority = priorities[index]
+        node = nodes[index]
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+            right_index = child_index + 1
+            if right_index < size and priorities[right_index] < priorities[child_index]:
+                child_index = right_index
+            child_priority = priorities[child_index]
+            if not child_priority < priority:
+                break
+            child_node = nodes[child_index]
+            priorities[index] = child_priority
+            nodes[index] = child_node
+            position[child_node] = index
+            index = child_index
+        priorities[index] = priority
+        nodes[index] = node
+        position[node] = index
@@ -0,0 +1,365 @@
+import heapq
+
+from pathfinding.grid import GridMap, STRAIGHT_COST, octile_distance
+from pathfinding.lazy_path import LazyPath
+
+# 입구 구간이 이 길이 이상이면 양 끝에 두 개, 짧으면 가운데에 하나의 전이 노드를 둡니다.
+LONG_ENTRANCE = 6
+
+
+class HierarchicalPathfinder:
+    """
+    HPA* 입니다. 맵을 cluster_size 크기의 클러스터로 나누고, 클러스터 경계의 입구마다 전이 노드를 둡니다.
+    클러스터 안의 전이 노드끼리의 비용을 미리 계산해 두면 긴 경로도 작은 추상 그래프만 탐색하면 됩니다.
+    타일이 바뀌면 그 타일이 속한 클러스터 (그리고 입구가 바뀐 이웃 클러스터) 만 다시 계산합니다.
+    find_path 가 돌려준 LazyPath 는 그 뒤에 맵이 바뀌면 남은 구간을 만들지 않고 멈추므로, 쓰는 쪽이 다시 찾게 됩니다.
+    경로는 최단이 아닙니다. 전이 노드를 거쳐 가므로 무작위 맵에서 A* 보다 평균 4% 쯤 길고, 클러스터 몇 개 거리의
+    짧은 경로는 1.5 ~ 1.7 배까지 길어질 수 있습니다. (benchmarks/hpa_check.py 가 한도를 확인합니다)
+    """
+
+    def __init__(self, grid, cluster_size=10):
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.clusters_x = (grid.width + cluster_size - 1) // cluster_size
+        self.clusters_y = (grid.height + cluster_size - 1) // cluster_size
+        self.neighbors = grid.neighbor_offsets()
+        self.borders = {}  # (클러스터 a, 클러스터 b) -> [(a 쪽 셀, b 쪽 셀), ...]
+        self.cluster_nodes = {}  # 클러스터 -> 전이 노드 집합
+        self.intra = {}  # 클러스터 -> {노드: {같은 클러스터의 노드: 비용}}
+        self.inter = {}  # 노드 -> {다른 클러스터의 노드: 비용}
+        self.tile_map = None
+        self.version = 0  # 맵이 바뀔 때마다 (rebuild, update_cells) 1씩 증가
+        self.rebuild()
+
+    @classmethod
+    def from_tile_map(cls, tile_map, cluster_size=10, agent_width=1, agent_height=1):
+        """
+        TileMap 에서 만들고, TileMap.set_tile 로 타일이 바뀌면 자동으로 해당 클러스터만 다시 계산합니다.
+        """
+        grid = GridMap.from_tile_map(tile_map, agent_width, agent_height)
+        pathfinder = cls(grid, cluster_size)
+        pathfinder.tile_map = tile_map
+        tile_map.add_listener(pathfinder.on_tile_changed)
+        return pathfinder
+
+    def cluster_of(self, index):
+        x, y = self.grid.position(index)
+        return x // self.cluster_size, y // self.cluster_size
+
+    def cluster_bounds(self, cluster):
+        left = cluster[0] * self.cluster_size
+        top = cluster[1] * self.cluster_size
+        right = min(left + self.cluster_size, self.grid.width)
+        bottom = min(top + self.cluster_size, self.grid.height)
+        return left, top, right, bottom
+
+    def rebuild(self):
+        self.version += 1
+        self.borders.clear()
+        self.cluster_nodes = {
+            (cluster_x, cluster_y): set()
+            for cluster_x in range(self.clusters_x)
+            for cluster_y in range(self.clusters_y)
+        }
+        self.intra.clear()
+        self.inter.clear()
+        for cluster in self.cluster_nodes:
+            for other in ((cluster[0] + 1, cluster[1]), (cluster[0], cluster[1] + 1)):
+                if other in self.cluster_nodes:
+                    self._set_border(cluster, other, self._find_entrances(cluster, other))
+        for cluster in self.cluster_nodes:
+            self._build_intra_edges(cluster)
+
+    def on_tile_changed(self, x, y):
+        changed = self.grid.refresh_cells(x, y)
+        if changed:
+            self.update_cells(changed)
+
+    def update_cells(self, cells):
+        """
+        지나갈 수 있는지가 바뀐 셀들이 속한 클러스터만 다시 계산합니다.
+        """
+        self.version += 1
+        dirty = set()
+        for x, y in cells:
+            dirty.add((x // self.cluster_size, y // self.cluster_size))
+
+        rebuild = set(dirty)
+        for cluster in dirty:
+            cluster_x, cluster_y = cluster
+            for other in ((cluster_x - 1, cluster_y), (cluster_x + 1, cluster_y), (cluster_x, cluster_y - 1), (cluster_x, cluster_y + 1)):
+                if other not in self.cluster_nodes:
+                    continue
+                pair = (cluster, other) if cluster < other else (other, cluster)
+                entrances = self._find_entrances(*pair)
+                if entrances != self.borders.get(pair, []):
+                    self._set_border(pair[0], pair[1], entrances)
+                    rebuild.add(other)
+        for cluster in rebuild:
+            self._build_intra_edges(cluster)
+        return rebuild
+
+    def _find_entrances(self, cluster, other):
+        """
+        두 클러스터 사이 경계에서 양쪽이 모두 비어 있는 연속 구간을 찾아 전이 노드 쌍을 만듭니다.
+        """
+        grid = self.grid
+        walls = grid.walls
+        left, top, right, bottom = self.cluster_bounds(cluster)
+        if other[0] != cluster[0]:
+            # 세로 경계: cluster 의 오른쪽 열과 other 의 왼쪽 열
+            step = grid.stride
+            first = grid.index(right - 1, top)
+            length = bottom - top
+            across = 1
+        else:
+            # 가로 경계: cluster 의 아래쪽 행과 other 의 위쪽 행
+            step = 1
+            first = grid.index(left, bottom - 1)
+            length = right - left
+            across = grid.stride
+
+        entrances = []
+        run = []
+        for offset in range(length + 1):
+            index = first + offset * step
+            if offset < length and not walls[index] and not walls[index + across]:
+                run.append(index)
+                continue
+            if run:
+                if len(run) >= LONG_ENTRANCE:
+                    chosen = (run[0], run[-1])
+                else:
+                    chosen = (run[len(run) // 2],)
+                entrances.extend((index_a, index_a + across) for index_a in chosen)
+                run = []
+        return entrances
+
+    def _set_border(self, cluster, other, entrances):
+        for index_a, index_b in self.borders.get((cluster, other), []):
+            self.inter.get(index_a, {}).pop(index_b, None)
+            self.inter.get(index_b, {}).pop(index_a, None)
+        self.borders[(cluster, other)] = entrances
+        for index_a, index_b in entrances:
+            self.inter.setdefault(index_a, {})[index_b] = STRAIGHT_COST
+            self.inter.setdefault(index_b, {})[index_a] = STRAIGHT_COST
+
+        # 전이 노드 집합은 클러스터의 네 경계에서 다시 모읍니다.
+        for target in (cluster, other):
+            target_x, target_y = target
+            nodes = set()
+            for before in ((target_x - 1, target_y), (target_x, target_y - 1)):
+                nodes.update(index_b for _, index_b in self.borders.get((before, target), ()))
+            for after in ((target_x + 1, target_y), (target_x, target_y + 1)):
+                nodes.update(index_a for index_a, _ in self.borders.get((target, after), ()))
+            for node in self.cluster_nodes[target] - nodes:
+                if not self.inter.get(node):
+                    self.inter.pop(node, None)
+            self.cluster_nodes[target] = nodes
+
+    def _build_intra_edges(self, cluster):
+        # 비용은 대칭이므로 각 노드에서는 아직 비용을 모르는 뒤쪽 노드들까지만 찾습니다.
+        nodes = sorted(self.cluster_nodes[cluster])
+        bounds = self.cluster_bounds(cluster)
+        local_walls = self._local_walls(bounds)
+        edges = {node: {} for node in nodes}
+        for number, node in enumerate(nodes[:-1]):
+            targets = set(nodes[number + 1:])
+            for other, cost in self._search_in_bounds(node, targets, bounds, local_walls=local_walls)[0].items():
+                edges[node][other] = cost
+                edges[other][node] = cost
+        self.intra[cluster] = edges
+
+    def _local_walls(self, bounds):
+        """
+        bounds 사각형만 잘라 낸 벽 배열을 만듭니다. GridMap 처럼 한 칸 두께의 벽으로 감싸서 경계 검사가 필요 없습니다.
+        """
+        grid = self.grid
+        left, top, right, bottom = bounds
+        stride = right - left + 2
+        walls = bytearray(b"\x01") * (stride * (bottom - top + 2))
+        for y in range(top, bottom):
+            start = grid.index(left, y)
+            local_start = (y - top + 1) * stride + 1
+            walls[local_start:local_start + right - left] = grid.walls[start:start + right - left]
+        return walls
+
+    def _search_in_bounds(self, source, targets, bounds, path_to=None, local_walls=None):
+        """
+        bounds 사각형 안에서만 움직이는 Dijkstra 입니다. path_to 를 주면 그 셀에서 멈추고 경로도 돌려줍니다.
+        (targets 중 찾은 셀까지의 비용, 경로) 를 돌려줍니다.
+        """
+        grid = self.grid
+        left, top, right, bottom = bounds
+        stride = right - left + 2
+        walls = local_walls if local_walls is not None else self._local_walls(bounds)
+        # 전체 그리드 인덱스와 잘라 낸 배열의 인덱스 사이의 변환
+        global_stride = grid.stride
+
+        def to_local(index):
+            y, x = divmod(index, global_stride)
+            return (y - top) * stride + (x - left)
+
+        def to_global(local):
+            y, x = divmod(local, stride)
+            return (y + top) * global_stride + (x + left)
+
+        neighbors = []
+        for offset, cost, side_a, side_b in self.neighbors:
+            dy, dx = divmod(offset + global_stride + 1, global_stride)
+            neighbors.append((
+                (dy - 1) * stride + (dx - 1),
+                cost,
+                side_a,
+                (side_b // global_stride) * stride,
+            ))
+
+        local_source = to_local(source)
+        local_targets = {to_local(target): target for target in targets}
+        local_goal = to_local(path_to) if path_to is not None else -1
+        g_score = [-1] * len(walls)
+        came_from = {local_source: -1}
+        closed = bytearray(len(walls))
+        g_score[local_source] = 0
+        found = {}
+        remaining = len(local_targets)
+        open_heap = [(0, local_source)]
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        while open_heap:
+            current_g, current = heappop(open_heap)
+            if closed[current]:
+                continue
+            closed[current] = 1
+            if current == local_goal:
+                path = []
+                while current != -1:
+                    path.append(grid.position(to_global(current)))
+                    current = came_from[current]
+                path.reverse()
+                return found, path
+            if current in local_targets:
+                found[local_targets[current]] = current_g
+                remaining -= 1
+                if remaining == 0 and path_to is None:
+                    break
+            for offset, cost, side_a, side_b in neighbors:
+                neighbor = current + offset
+                if walls[neighbor] or closed[neighbor]:
+                    continue
+                if side_a and (walls[current + side_a] or walls[current + side_b]):
+                    continue
+                tentative_g_score = current_g + cost
+                old_g_score = g_score[neighbor]
+                if old_g_score == -1 or tentative_g_score < old_g_score:
+                    g_score[neighbor] = tentative_g_score
+                    came_from[neighbor] = current
+                    heappush(open_heap, (tentative_g_score, neighbor))
+        return found, None
+
+    def find_abstract_path(self, start, goal):
+        """
+        추상 그래프 위의 경로 (셀 인덱스 리스트) 를 찾습니다. 시작점과 목표점을 임시로 연결해서 탐색합니다.
+        """
+        grid = self.grid
+        start_index = grid.index(*start)
+        goal_index = grid.index(*goal)
+        start_cluster = self.cluster_of(start_index)
+        goal_cluster = self.cluster_of(goal_index)
+
+        start_edges = self._search_in_bounds(start_index, self.cluster_nodes[start_cluster], self.cluster_bounds(start_cluster))[0]
+        goal_edges = self._search_in_bounds(goal_index, self.cluster_nodes[goal_cluster], self.cluster_bounds(goal_cluster))[0]
+        if start_cluster == goal_cluster:
+            # 클러스터 안에서 바로 가는 길과 클러스터 밖으로 돌아가는 길 중 싼 쪽을 고릅니다.
+            local_cost = self._search_in_bounds(start_index, {goal_index}, self.cluster_bounds(start_cluster))[0]
+            start_edges.update(local_cost)
+
+        stride = grid.stride
+        goal_y, goal_x = divmod(goal_index, stride)
+        g_score = {start_index: 0}
+        came_from = {start_index: -1}
+        closed = set()
+        open_heap = [(0, start_index)]
+
+        while open_heap:
+            current = heapq.heappop(open_heap)[1]
+            if current in closed:
+                continue
+            if current == goal_index:
+                path = []
+                while current != -1:
+                    path.append(current)
+                    current = came_from[current]
+                path.reverse()
+                return path
+            closed.add(current)
+
+            edges = list(self.intra[self.cluster_of(current)].get(current, {}).items())
+            edges.extend(self.inter.get(current, {}).items())
+            if current == start_index:
+                edges.extend(start_edges.items())
+            if current in goal_edges:
+                edges.append((goal_index, goal_edges[current]))
+            for neighbor, cost in edges:
+                if neighbor in closed:
+                    continue
+                tentative_g_score = g_score[current] + cost
+                if tentative_g_score < g_score.get(neighbor, tentative_g_score + 1):
+                    g_score[neighbor] = tentative_g_score
+                    came_from[neighbor] = current
+                    y, x = divmod(neighbor, stride)
+                    h = octile_distance(abs(x - goal_x), abs(y - goal_y))
+                    heapq.heappush(open_heap, (tentative_g_score + h, neighbor))
+        return []
+
+    def refine(self, abstract_path, version):
+        """
+        추상 경로를 노드 두 칸씩 묶어 실제 셀 경로로 만들어 내보냅니다. 첫 구간에만 시작점이 포함됩니다.
+        묶은 노드들의 클러스터를 모두 덮는 사각형 안에서 찾으므로 가운데 전이 노드를 꼭 지나지 않아도 되고,
+        그 사각형에는 노드를 차례로 지나는 길도 들어 있어서 노드마다 나눠 찾을 때보다 길어지지 않습니다.
+        version (추상 경로를 찾을 때의 self.version) 뒤로 맵이 바뀌었거나 구간을 이을 수 없으면
+        건너뛴 경로를 내보내지 않고 멈춥니다.
+        """
+        last = len(abstract_path) - 1
+        for number, first in enumerate(range(0, last, 2)):
+            if self.version != version:
+                return
+            nodes = abstract_path[first:first + 3]
+            bounds = [self.cluster_bounds(self.cluster_of(node)) for node in nodes]
+            window = (
+                min(bound[0] for bound in bounds),
+                min(bound[1] for bound in bounds),
+                max(bound[2] for bound in bounds),
+                max(bound[3] for bound in bounds),
+            )
+            segment = self._search_in_bounds(nodes[0], (), window, path_to=nodes[-1])[1]
+            if not segment:
+                return
+            yield segment if number == 0 else segment[1:]
+
+    def find_path(self, start, goal):
+        """
+        start 에서 goal 까지의 경로를 LazyPath 로 돌려줍니다. 시작점과 목표점을 모두 포함합니다.
+        """
+        grid = self.grid
+        if not grid.is_walkable(*start) or not grid.is_walkable(*goal):
+            return LazyPath((), goal)
+        if start == goal:
+            return LazyPath(([start],), goal)
+        if max(abs(start[0] - goal[0]), abs(start[1] - goal[1])) <= self.cluster_size:
+            # 가까운 목표는 클러스터 경계 때문에 돌아가지 않도록 주변 사각형 안에서 바로 찾습니다.
+            margin = self.cluster_size
+            bounds = (
+                max(0, min(start[0], goal[0]) - margin),
+                max(0, min(start[1], goal[1]) - margin),
+                min(grid.width, max(start[0], goal[0]) + margin + 1),
+                min(grid.height, max(start[1], goal[1]) + margin + 1),
+            )
+            local_path = self._search_in_bounds(grid.index(*start), (), bounds, path_to=grid.index(*goal))[1]
+            if local_path:
+                return LazyPath((local_path,), goal)
+        abstract_path = self.find_abstract_path(start, goal)
+        if not abstract_path:
+            return LazyPath((), goal)
+        return LazyPath(self.refine(abstract_path, self.version), goal)
@@ -0,0 +1,274 @@
+import heapq
+from array import array
+
+from pathfinding.grid import DIRECTIONS, GridAStar, octile_distance
+
+
+def sign(value):
+    return (value > 0) - (value < 0)
+
+
+class JumpPointSearch(GridAStar):
+    """
+    대각선 모서리 끼기를 막는 (옆칸 두 곳이 모두 비어 있어야 대각선 이동) 8방향 그리드용 Jump Point Search 입니다.
+    GridAStar 와 같은 비용(10/14)의 최단 경로를 돌려주지만, 대칭인 경로들을 건너뛰고 점프 포인트만 열린 목록에 넣습니다.
+    decrease_key=True 이면 GridAStar 처럼 열린 목록으로 IndexedMinHeap 을 씁니다.
+    """
+
+    def _directions(self, current, parent):
+        """
+        부모에서 온 방향을 보고 살펴볼 방향만 남깁니다. 시작점은 8방향을 모두 봅니다.
+        """
+        if parent == -1:
+            return DIRECTIONS
+        stride = self.grid.stride
+        current_y, current_x = divmod(current, stride)
+        parent_y, parent_x = divmod(parent, stride)
+        dx = sign(current_x - parent_x)
+        dy = sign(current_y - parent_y)
+        if dx and dy:
+            return ((0, dy), (dx, 0), (dx, dy))
+        if dx:
+            return ((dx, 0), (0, 1), (0, -1), (dx, 1), (dx, -1))
+        return ((0, dy), (1, 0), (-1, 0), (1, dy), (-1, dy))
+
+    def _jump_straight(self, index, offset, side, goal_index):
+        # index 에서 offset 방향으로 한 칸씩 가다가 강제 이웃(옆은 비었는데 바로 뒤의 옆은 막힘)이 생기면 멈춥니다.
+        walls = self.grid.walls
+        while True:
+            index += offset
+            if walls[index]:
+                return -1
+            if index == goal_index:
+                return index
+            if (not walls[index + side] and walls[index - offset + side]) or (
+                not walls[index - side] and walls[index - offset - side]
+            ):
+                return index
+
+    def _jump(self, index, dx, dy, goal_index):
+        walls = self.grid.walls
+        stride = self.grid.stride
+        if not dy:
+            return self._jump_straight(index, dx, stride, goal_index)
+        if not dx:
+            return self._jump_straight(index, dy * stride, 1, goal_index)
+
+        vertical = dy * stride
+        offset = dx + vertical
+        while True:
+            if walls[index + dx] or walls[index + vertical]:
+                return -1  # 모서리 끼기 방지
+            index += offset
+            if walls[index]:
+                return -1
+            if index == goal_index:
+                return index
+            # 대각선으로 가는 중에는 가로/세로 방향에 점프 포인트가 있는지 확인합니다.
+            if self._jump_straight(index, dx, stride, goal_index) != -1:
+                return index
+            if self._jump_straight(index, vertical, 1, goal_index) != -1:
+                return index
+
+    def _successors(self, current, dx, dy, goal_index):
+        return self._jump(current, dx, dy, goal_index)
+
+    def _search_heapq(self, start_index, goal_index):
+        stride = self.grid.stride
+        g_score = self.g_score
+        came_from = self.came_from
+        seen = self.seen
+        closed = self.closed
+        goal_y, goal_x = divmod(goal_index, stride)
+        start_y, start_x = divmod(start_index, stride)
+
+        h = octile_distance(abs(start_x - goal_x), abs(start_y - goal_y))
+        open_heap = [(h, h, start_index)]
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        expanded = 0
+        max_open = 1
+
+        while open_heap:
+            current = heappop(open_heap)[2]
+            if closed[current]:
+                continue
+            if current == goal_index:
+                break
+            closed[current] = 1
+            expanded += 1
+            current_g = g_score[current]
+            current_y, current_x = divmod(current, stride)
+
+            for dx, dy in self._directions(current, came_from[current]):
+                jump_point = self._successors(current, dx, dy, goal_index)
+                if jump_point == -1 or closed[jump_point]:
+                    continue
+                y, x = divmod(jump_point, stride)
+                tentative_g_score = current_g + octile_distance(abs(x - current_x), abs(y - current_y))
+                if seen[jump_point] and tentative_g_score >= g_score[jump_point]:
+                    continue
+                seen[jump_point] = 1
+                g_score[jump_point] = tentative_g_score
+                came_from[jump_point] = current
+                h = octile_distance(abs(x - goal_x), abs(y - goal_y))
+                heappush(open_heap, (tentative_g_score + h, h, jump_point))
+            if len(open_heap) > max_open:
+                max_open = len(open_heap)
+        else:
+            current = -1
+
+        self.expanded = expanded
+        self.max_open = max_open
+        return current == goal_index
+
+    def _search_indexed(self, start_index, goal_index):
+        stride = self.grid.stride
+        g_score = self.g_score
+        came_from = self.came_from
+        seen = self.seen
+        closed = self.closed
+        goal_y, goal_x = divmod(goal_index, stride)
+        start_y, start_x = divmod(start_index, stride)
+
+        open_set = self.open_set
+        open_set.clear()
+        h = octile_distance(abs(start_x - goal_x), abs(start_y - goal_y))
+        open_set.push(start_index, (h, h))
+        expanded = 0
+        max_open = 1
+        current = -1
+
+        while open_set.nodes:
+            current = open_set.pop()[1]
+            if current == goal_index:
+                break
+            closed[current] = 1
+            expanded += 1
+            current_g = g_score[current]
+            current_y, current_x = divmod(current, stride)
+
+            for dx, dy in self._directions(current, came_from[current]):
+                jump_point = self._successors(current, dx, dy, goal_index)
+                if jump_point == -1 or closed[jump_point]:
+                    continue
+                y, x = divmod(jump_point, stride)
+                tentative_g_score = current_g + octile_distance(abs(x - current_x), abs(y - current_y))
+                if seen[jump_point]:
+                    if tentative_g_score >= g_score[jump_point]:
+                        continue
+                    g_score[jump_point] = tentative_g_score
+                    came_from[jump_point] = current
+                    h = open_set.priority(jump_point)[1]
+                    open_set.decrease_key(jump_point, (tentative_g_score + h, h))
+                    continue
+                seen[jump_point] = 1
+                g_score[jump_point] = tentative_g_score
+                came_from[jump_point] = current
+                h = octile_distance(abs(x - goal_x), abs(y - goal_y))
+                open_set.push(jump_point, (tentative_g_score + h, h))
+            if len(open_set) > max_open:
+                max_open = len(open_set)
+        else:
+            current = -1
+
+        self.expanded = expanded
+        self.max_open = max_open
+        return current == goal_index
+
+    def build_path(self, index):
+        # 점프 포인트 사이는 직선이나 대각선이므로 그 사이 칸들을 채워 넣습니다.
+        jump_points = super().build_path(index)
+        if not jump_points:
+            return jump_points
+        path = [jump_points[0]]
+        for x2, y2 in jump_points[1:]:
+            x, y = path[-1]
+            dx = sign(x2 - x)
+            dy = sign(y2 - y)
+            while (x, y) != (x2, y2):
+                x += dx
+                y += dy
+                path.append((x, y))
+        return path
+
+
+class JumpPointSearchPlus(JumpPointSearch):
+    """
+    JPS+ 입니다. 칸마다 8방향으로 다음 점프 포인트까지의 거리(양수) 또는 벽까지 갈 수 있는 칸 수(0 이하)를 미리 계산해 두고,
+    탐색할 때는 칸을 하나씩 훑지 않고 표만 읽습니다. 벽이 바뀌면 rebuild() 를 다시 불러야 합니다.
+    """
+
+    def __init__(self, grid, decrease_key=False):
+        super().__init__(grid, decrease_key)
+        self.distances = {direction: array("i", [0]) * grid.size for direction in DIRECTIONS}
+        self.rebuild()
+
+    def rebuild(self):
+        walls = self.grid.walls
+        stride = self.grid.stride
+        size = self.grid.size
+
+        # 가로/세로 방향 먼저 (대각선 계산에 필요)
+        for dx, dy in DIRECTIONS[:4]:
+            distance = self.distances[(dx, dy)]
+            offset = dx + dy * stride
+            side = stride if dx else 1
+            order = range(size - 1, -1, -1) if offset > 0 else range(size)
+            for index in order:
+                if walls[index]:
+                    continue
+                next_index = index + offset
+                if walls[next_index]:
+                    distance[index] = 0
+                elif (not walls[next_index + side] and walls[index + side]) or (
+                    not walls[next_index - side] and walls[index - side]
+                ):
+                    distance[index] = 1
+                else:
+                    next_distance = distance[next_index]
+                    distance[index] = next_distance + 1 if next_distance > 0 else next_distance - 1
+
+        for dx, dy in DIRECTIONS[4:]:
+            distance = self.distances[(dx, dy)]
+            horizontal = self.distances[(dx, 0)]
+            vertical = self.distances[(0, dy)]
+            vertical_offset = dy * stride
+            offset = dx + vertical_offset
+            order = range(size - 1, -1, -1) if offset > 0 else range(size)
+            for index in order:
+                if walls[index]:
+                    continue
+                next_index = index + offset
+                if walls[index + dx] or walls[index + vertical_offset] or walls[next_index]:
+                    distance[index] = 0
+                elif horizontal[next_index] > 0 or vertical[next_index] > 0:
+                    distance[index] = 1
+                else:
+                    next_distance = distance[next_index]
+                    distance[index] = next_distance + 1 if next_distance > 0 else next_distance - 1
+
+    def _successors(self, current, dx, dy, goal_index):
+        stride = self.grid.stride
+        distance = self.distances[(dx, dy)][current]
+        reach = distance if distance > 0 else -distance
+        current_y, current_x = divmod(current, stride)
+        goal_y, goal_x = divmod(goal_index, stride)
+        diff_x = goal_x - current_x
+        diff_y = goal_y - current_y
+        offset = dx + dy * stride
+
+        if dx and dy:
+            # 목표점의 행이나 열을 지나가면 그 교차점에서 멈춥니다.
+            if sign(diff_x) == dx and sign(diff_y) == dy:
+                steps = min(abs(diff_x), abs(diff_y))
+                if steps <= reach:
+                    return current + steps * offset
+        elif (dx and diff_y == 0 and sign(diff_x) == dx and abs(diff_x) <= reach) or (
+            dy and diff_x == 0 and sign(diff_y) == dy and abs(diff_y) <= reach
+        ):
+            return goal_index
+
+        if distance > 0:
+            return current + distance * offset
+        return -1
@@ -0,0 +1,49 @@
+from collections import deque
+
+
+class LazyPath:
+    """
+    경로를 구간 단위로, 필요해질 때 만들어 내는 경로입니다. (HPA* 의 구간 세밀화, 흐름장의 한 칸씩 따라가기)
+    Enemy 가 경로 리스트에 쓰는 연산 (bool, [0], [-1], pop(0), len) 만 흉내 냅니다. len 을 부르면 전체를 세밀화합니다.
+    """
+
+    def __init__(self, segments, goal):
+        self.cells = deque()
+        self.segments = iter(segments)
+        self.goal = goal
+
+    def _fill(self):
+        while not self.cells:
+            segment = next(self.segments, None)
+            if segment is None:
+                return False
+            self.cells.extend(segment)
+        return True
+
+    def __bool__(self):
+        return self._fill()
+
+    def __getitem__(self, index):
+        if not self._fill():
+            raise IndexError("path is empty")
+        if index == 0:
+            return self.cells[0]
+        if index == -1:
+            return self.goal
+        raise IndexError("LazyPath only supports [0] and [-1]")
+
+    def pop(self, index=-1):
+        if index != 0:
+            raise IndexError("LazyPath only supports pop(0)")
+        if not self._fill():
+            raise IndexError("pop from empty path")
+        return self.cells.popleft()
+
+    def __iter__(self):
+        while self._fill():
+            yield self.cells.popleft()
+
+    def __len__(self):
+        for segment in self.segments:
+            self.cells.extend(segment)
+        return len(self.cells)
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+
+
+class PathCache:
+    """
+    여러 적이 함께 쓰는 LRU 경로 캐시입니다.
+    키는 (시작 칸, 목표 칸, 몸 크기, TileMap.version) 이고, 경로는 시작 칸을 포함한 튜플로 저장합니다.
+    A 에서 G 로 가는 경로를 저장해 두면 그 경로 위의 어느 칸에서 G 로 가는 질문에도 경로의 뒷부분으로 답합니다.
+    맵 버전이 바뀌면 예전 경로는 다시 쓸 수 없으므로 모두 지웁니다.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.paths = OrderedDict()  # (start, goal, footprint, version) -> 경로 튜플 (오래 안 쓴 것부터)
+        self.suffixes = {}  # (칸, goal, footprint, version) -> (그 칸을 지나는 경로의 키, 경로에서 칸의 위치)
+        self.version = None
+        self.hits = 0
+        self.suffix_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _check_version(self, version):
+        if version != self.version:
+            if self.paths:
+                self.invalidations += 1
+            self.paths.clear()
+            self.suffixes.clear()
+            self.version = version
+
+    def get(self, start, goal, footprint=(1, 1), version=0):
+        """
+        start 에서 goal 까지의 경로(시작 칸 포함 리스트)를 돌려줍니다. 없으면 None 입니다.
+        """
+        self._check_version(version)
+        key = (start, goal, footprint, version)
+        path = self.paths.get(key)
+        if path is not None:
+            self.paths.move_to_end(key)
+            self.hits += 1
+            return list(path)
+
+        suffix = self.suffixes.get(key)
+        if suffix is not None:
+            owner, offset = suffix
+            self.paths.move_to_end(owner)
+            self.suffix_hits += 1
+            return list(self.paths[owner][offset:])
+
+        self.misses += 1
+        return None
+
+    def put(self, start, goal, path, footprint=(1, 1), version=0):
+        """
+        시작 칸을 포함한 경로를 저장합니다. 빈 경로(도달할 수 없음)도 저장해 같은 질문을 다시 탐색하지 않게 합니다.
+        """
+        self._check_version(version)
+        key = (start, goal, footprint, version)
+        if key in self.paths:
+            self.paths.move_to_end(key)
+            return
+        path = tuple(path)
+        self.paths[key] = path
+        for offset, cell in enumerate(path[1:], 1):
+            # 이미 다른 경로가 이 칸을 덮고 있어도 새 경로로 바꿉니다. (최근 경로일수록 오래 남습니다)
+            self.suffixes[(cell, goal, footprint, version)] = (key, offset)
+        while len(self.paths) > self.capacity:
+            self._evict()
+
+    def _evict(self):
+        key, path = self.paths.popitem(last=False)
+        _, goal, footprint, version = key
+        for cell in path[1:]:
+            suffix_key = (cell, goal, footprint, version)
+            if self.suffixes.get(suffix_key, (None,))[0] == key:
+                del self.suffixes[suffix_key]
+        self.evictions += 1
+
+    def clear(self):
+        self.paths.clear()
+        self.suffixes.clear()
+
+    def stats(self):
+        lookups = self.hits + self.suffix_hits + self.misses
+        return {
+            "size": len(self.paths),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "suffix_hits": self.suffix_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": (self.hits + self.suffix_hits) / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,188 @@
+import multiprocessing
+from collections import deque
+from multiprocessing import shared_memory
+
+from pathfinding.grid import GridAStar, GridMap
+
+# 작업 프로세스마다 한 번 만들어 두는 (공유 메모리, 탐색기)
+_worker = None
+
+
+def _init_worker(memory_name, width, height):
+    global _worker
+    memory = shared_memory.SharedMemory(name=memory_name)
+    grid = GridMap(width, height)
+    grid.walls = memory.buf  # 메인 프로세스가 쓰고 작업 프로세스는 읽기만 합니다.
+    _worker = (memory, GridAStar(grid))
+
+
+def _find_path(job_id, version, start, goal):
+    searcher = _worker[1]
+    path = searcher.find_path(start, goal)
+    return job_id, version, path, searcher.expanded
+
+
+class PathfindingService:
+    """
+    길찾기를 프로세스 풀에서 돌리는 서비스입니다. pygame 이나 화면이 없어도 동작합니다.
+    - 그리드 벽 정보는 공유 메모리에 한 벌만 두고, 작업 프로세스들은 읽기만 합니다. 타일이 바뀌면 메인 프로세스가 고쳐 씁니다.
+    - request() 는 요청을 줄에 넣기만 하고, 결과는 게임 루프가 프레임마다 부르는 poll() 에서 (다음 프레임 이후에) 전달됩니다.
+    - 같은 (시작, 목표) 요청이 이미 진행 중이면 새로 보내지 않고 결과를 함께 받습니다.
+    - 적의 목표 칸이 바뀌면 예전 요청은 취소합니다. 아직 보내지 않은 요청은 줄에서 빼고, 이미 보낸 요청은 결과를 버립니다.
+      이미 보낸 요청은 작업 프로세스가 실제로 끝낼 때까지 max_in_flight 자리를 차지합니다. (orphans)
+    """
+
+    def __init__(self, grid, workers=2, max_in_flight=None):
+        self.grid = grid
+        self.memory = shared_memory.SharedMemory(create=True, size=grid.size)
+        self.memory.buf[:grid.size] = grid.walls
+        self.pool = multiprocessing.Pool(workers, _init_worker, (self.memory.name, grid.width, grid.height))
+        self.max_in_flight = max_in_flight or workers * 2  # 한꺼번에 풀에 보내 둘 작업 수
+        self.version = 0  # 타일이 바뀔 때마다 증가. 예전 버전으로 계산한 결과는 버립니다.
+        self.next_job_id = 0
+        self.jobs = {}  # 작업 번호 -> {"key": (start, goal), "agents": set(), "result": AsyncResult 또는 None}
+        self.job_for_key = {}  # (start, goal) -> 진행 중인 작업 번호
+        self.job_for_agent = {}  # 적 -> 기다리는 작업 번호
+        self.pending = deque()  # 아직 풀에 보내지 않은 작업 번호
+        self.orphans = set()  # 풀에 보냈지만 기다리는 적이 없어진 AsyncResult. 끝날 때까지 자리를 차지합니다.
+        self.results = {}  # 적 -> 전달된 (goal, path)
+        self.stats = {"requests": 0, "deduplicated": 0, "cancelled": 0, "discarded": 0, "completed": 0}
+        self.tile_map = None
+
+    @classmethod
+    def from_tile_map(cls, tile_map, workers=2, agent_width=1, agent_height=1):
+        service = cls(GridMap.from_tile_map(tile_map, agent_width, agent_height), workers)
+        service.tile_map = tile_map
+        tile_map.add_listener(service.on_tile_changed)
+        return service
+
+    def on_tile_changed(self, x, y):
+        changed = self.grid.refresh_cells(x, y)
+        if not changed:
+            return
+        for cell_x, cell_y in changed:
+            index = self.grid.index(cell_x, cell_y)
+            self.memory.buf[index] = self.grid.walls[index]
+        self.version += 1
+        # 이미 전달한 경로도 예전 맵 기준이므로 다음 request 때 다시 요청하게 합니다.
+        self.results.clear()
+
+    def request(self, agent, start, goal):
+        """
+        agent 의 경로를 요청합니다. 같은 목표로 이미 기다리고 있으면 아무것도 하지 않습니다.
+        """
+        job_id = self.job_for_agent.get(agent)
+        if job_id is not None:
+            if self.jobs[job_id]["key"][1] == goal:
+                return
+            self._detach(agent, job_id)
+            self.stats["cancelled"] += 1
+
+        self.stats["requests"] += 1
+        key = (start, goal)
+        job_id = self.job_for_key.get(key)
+        if job_id is None:
+            job_id = self.next_job_id
+            self.next_job_id += 1
+            self.jobs[job_id] = {"key": key, "agents": set(), "result": None}
+            self.job_for_key[key] = job_id
+            self.pending.append(job_id)
+        else:
+            self.stats["deduplicated"] += 1
+        self.jobs[job_id]["agents"].add(agent)
+        self.job_for_agent[agent] = job_id
+
+    def _detach(self, agent, job_id):
+        del self.job_for_agent[agent]
+        job = self.jobs[job_id]
+        job["agents"].discard(agent)
+        if not job["agents"]:
+            # 기다리는 적이 없으면 작업을 잊습니다. 아직 보내지 않았으면 줄에서도 뺍니다.
+            del self.jobs[job_id]
+            del self.job_for_key[job["key"]]
+            if job["result"] is None:
+                self.pending.remove(job_id)
+            else:
+                self.orphans.add(job["result"])
+
+    def release(self, agent):
+        job_id = self.job_for_agent.get(agent)
+        if job_id is not None:
+            self._detach(agent, job_id)
+        self.results.pop(agent, None)
+
+    def in_flight(self):
+        return sum(1 for job in self.jobs.values() if job["result"] is not None) + len(self.orphans)
+
+    def poll(self):
+        """
+        끝난 작업의 결과를 적들에게 전달하고, 빈 자리만큼 기다리던 작업을 풀에 보냅니다. 전달한 경로 수를 돌려줍니다.
+        """
+        delivered = 0
+        self.orphans = {result for result in self.orphans if not result.ready()}
+        for job_id, job in list(self.jobs.items()):
+            result = job["result"]
+            if result is None or not result.ready():
+                continue
+            _, version, path, _ = result.get()
+            if version != self.version:
+                # 계산하는 동안 맵이 바뀌었으면 같은 요청을 다시 보냅니다.
+                self.stats["discarded"] += 1
+                job["result"] = None
+                self.pending.appendleft(job_id)
+                continue
+            del self.jobs[job_id]
+            del self.job_for_key[job["key"]]
+            for agent in job["agents"]:
+                del self.job_for_agent[agent]
+                self.results[agent] = (job["key"][1], path)
+                delivered += 1
+            self.stats["completed"] += 1
+
+        running = self.in_flight()
+        while self.pending and running < self.max_in_flight:
+            job_id = self.pending.popleft()
+            start, goal = self.jobs[job_id]["key"]
+            self.jobs[job_id]["result"] = self.pool.apply_async(_find_path, (job_id, self.version, start, goal))
+            running += 1
+        return delivered
+
+    def result_for(self, agent):
+        return self.results.get(agent)
+
+    def agent_pathfinder(self):
+        return ServicePathfinder(self)
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
+        self.memory.close()
+        self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ServicePathfinder:
+    """
+    Enemy 가 쓰는 pathfinder 인터페이스입니다. 적 한 마리에 하나씩 만듭니다.
+    결과가 도착하기 전에는 빈 경로를 돌려주고 (적은 그 자리에서 기다립니다), 도착한 뒤에는 현재 칸부터의 경로를 돌려줍니다.
+    """
+
+    def __init__(self, service):
+        self.service = service
+
+    def find_path(self, start, goal):
+        result = self.service.result_for(self)
+        if result is not None:
+            result_goal, path = result
+            if result_goal == goal:
+                if not path:
+                    return []  # 도달할 수 없는 목표는 목표나 맵이 바뀔 때까지 다시 묻지 않습니다.
+                if start in path:
+                    return path[path.index(start):]
+        self.service.request(self, start, goal)
+        return []
@@ -0,0 +1,240 @@
+import heapq
+import time
+import weakref
+from collections import deque
+
+from pathfinding.grid import DIAGONAL_COST, STRAIGHT_COST, GridAStar, GridMap, octile_distance
+
+
+class SlicedAStar(GridAStar):
+    """
+    여러 프레임에 나눠서 돌릴 수 있는 A* 입니다.
+    열린 목록과 닫힘 표시를 객체에 남겨 두고, step() 을 부를 때마다 정해진 수(또는 시간)만큼만 노드를 닫습니다.
+    탐색이 끝나기 전에도 path() 는 지금까지 목표에 가장 가까이 간 노드까지의 경로를 돌려줍니다.
+    경로는 그 노드가 바뀔 때만 다시 만들고, 칸 -> 경로에서의 위치도 함께 들고 있습니다. (path_position)
+    """
+
+    def __init__(self, grid):
+        super().__init__(grid)
+        self.start = None
+        self.goal = None
+        self.open_heap = []
+        self.goal_index = -1
+        self.best = -1  # 지금까지 닫은 노드 중 h 가 가장 작은 노드
+        self.best_h = 0
+        self.done = True
+        self.found = False
+        self._path = None  # path() 가 만든 경로 (best 가 바뀌면 None)
+        self._path_positions = {}
+
+    def reset(self, start, goal):
+        grid = self.grid
+        self._path = None
+        self.start = start
+        self.goal = goal
+        self.expanded = 0
+        self.max_open = 0
+        self.open_heap = []
+        self.found = False
+        self.best = -1
+        if not grid.is_walkable(*start) or not grid.is_walkable(*goal):
+            self.done = True
+            return
+
+        self.seen[:] = self._empty
+        self.closed[:] = self._empty
+        start_index = grid.index(*start)
+        self.goal_index = grid.index(*goal)
+        self.g_score[start_index] = 0
+        self.came_from[start_index] = -1
+        self.seen[start_index] = 1
+        h = octile_distance(abs(start[0] - goal[0]), abs(start[1] - goal[1]))
+        self.open_heap.append((h, h, start_index))
+        self.best = start_index
+        self.best_h = h
+        self.done = False
+
+    def step(self, max_expansions=None, time_budget_ms=None):
+        """
+        노드를 최대 max_expansions 개 닫거나 time_budget_ms 밀리초가 지날 때까지 탐색을 이어 갑니다.
+        둘 다 주지 않으면 끝까지 돌립니다. 이번에 닫은 노드 수를 돌려줍니다.
+        """
+        if self.done:
+            return 0
+        walls = self.grid.walls
+        stride = self.grid.stride
+        g_score = self.g_score
+        came_from = self.came_from
+        seen = self.seen
+        closed = self.closed
+        open_heap = self.open_heap
+        goal_index = self.goal_index
+        goal_y, goal_x = divmod(goal_index, stride)
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        if max_expansions is None:
+            max_expansions = -1
+        deadline = None if time_budget_ms is None else time.perf_counter() + time_budget_ms / 1000
+        expanded = 0
+        best = self.best
+
+        while open_heap and expanded != max_expansions:
+            # 시간을 재는 것도 비용이므로 32개마다 한 번만 확인합니다.
+            if deadline is not None and expanded and (expanded & 31) == 0 and time.perf_counter() >= deadline:
+                break
+            _, h, current = heappop(open_heap)
+            if closed[current]:
+                continue
+            if current == goal_index:
+                self.found = True
+                self.best = current
+                self.best_h = 0
+                break
+            closed[current] = 1
+            expanded += 1
+            if h < self.best_h:
+                self.best = current
+                self.best_h = h
+            current_g = g_score[current]
+
+            for offset, cost, side_a, side_b in self.neighbors:
+                neighbor = current + offset
+                if walls[neighbor] or closed[neighbor]:
+                    continue
+                if side_a and (walls[current + side_a] or walls[current + side_b]):
+                    continue
+                tentative_g_score = current_g + cost
+                if seen[neighbor] and tentative_g_score >= g_score[neighbor]:
+                    continue
+                seen[neighbor] = 1
+                g_score[neighbor] = tentative_g_score
+                came_from[neighbor] = current
+                y, x = divmod(neighbor, stride)
+                dx = abs(x - goal_x)
+                dy = abs(y - goal_y)
+                h = STRAIGHT_COST * (dx + dy) + (DIAGONAL_COST - 2 * STRAIGHT_COST) * (dx if dx < dy else dy)
+                heappush(open_heap, (tentative_g_score + h, h, neighbor))
+            if len(open_heap) > self.max_open:
+                self.max_open = len(open_heap)
+
+        if self.found or not open_heap:
+            self.done = True
+        if self.best != best:
+            # 닫힌 노드의 부모는 바뀌지 않으므로 best 가 그대로면 경로도 그대로입니다.
+            self._path = None
+        self.expanded += expanded
+        return expanded
+
+    def path(self):
+        """
+        탐색이 끝났으면 목표까지의 경로, 아직이면 지금까지 가장 가까이 간 노드까지의 경로입니다. (시작 칸 포함)
+        돌려준 리스트는 다음 path() 에서도 같은 것이므로 고치지 않습니다.
+        """
+        if self._path is None:
+            self._path = self.build_path(self.best) if self.best != -1 else []
+            self._path_positions = {cell: number for number, cell in enumerate(self._path)}
+        return self._path
+
+    def path_position(self, cell):
+        # path() 에서 cell 의 위치, 없으면 -1
+        self.path()
+        return self._path_positions.get(cell, -1)
+
+    def find_path(self, start, goal):
+        # 한 번에 끝까지 돌리는 GridAStar 와 같은 사용법
+        self.reset(start, goal)
+        self.step()
+        return list(self.path()) if self.found else []
+
+
+class SearchScheduler:
+    """
+    한 프레임에 쓸 수 있는 전체 노드 확장 수(budget)를 길찾기를 기다리는 적들에게 나눠 줍니다.
+    게임 루프에서 프레임마다 update() 를 한 번 부르고, 적마다 agent_pathfinder() 로 받은 객체를 Enemy 의 pathfinder 로 씁니다.
+    searches 는 그 객체를 약하게 들고 있으므로, 적이 사라지면 (release 를 부르지 않아도) 탐색도 줄에서 빠지고 잊힙니다.
+    """
+
+    def __init__(self, grid, budget=1000):
+        self.grid = grid
+        self.budget = budget
+        self.searches = weakref.WeakKeyDictionary()  # 적 (SlicedPathfinder) -> SlicedAStar
+        self.active = deque()  # 아직 끝나지 않은 탐색 (앞에서부터 차례로 나눠 받습니다)
+        self.expanded_last_frame = 0
+        self.tile_map = None
+
+    @classmethod
+    def from_tile_map(cls, tile_map, budget=1000, agent_width=1, agent_height=1):
+        scheduler = cls(GridMap.from_tile_map(tile_map, agent_width, agent_height), budget)
+        scheduler.tile_map = tile_map
+        tile_map.add_listener(scheduler.on_tile_changed)
+        return scheduler
+
+    def on_tile_changed(self, x, y):
+        if self.grid.refresh_cells(x, y):
+            # 진행 중이거나 끝난 탐색 모두 예전 맵 기준이므로, 다음 request 때 현재 칸에서 다시 시작합니다.
+            for search in self.searches.values():
+                search.goal = None
+                search.done = True
+            self.active.clear()
+
+    def agent_pathfinder(self):
+        return SlicedPathfinder(self)
+
+    def request(self, agent, start, goal):
+        """
+        agent 의 탐색을 돌려줍니다. 목표가 바뀌었거나, 끝난 경로에서 벗어났으면 start 에서 새로 시작합니다.
+        """
+        search = self.searches.get(agent)
+        if search is None:
+            search = self.searches[agent] = SlicedAStar(self.grid)
+            weakref.finalize(agent, self._forget, search)
+        if search.goal != goal or (search.done and search.path_position(start) == -1):
+            search.reset(start, goal)
+            if not search.done and search not in self.active:
+                self.active.append(search)
+        return search
+
+    def release(self, agent):
+        search = self.searches.pop(agent, None)
+        if search is not None:
+            self._forget(search)
+
+    def _forget(self, search):
+        # 끝난 것으로 표시하면 update() 가 다음에 꺼낼 때 확장하지 않고 줄에서 뺍니다.
+        search.goal = None
+        search.done = True
+
+    def update(self):
+        """
+        이번 프레임의 확장 수를 나눠 줍니다. 먼저 끝난 탐색이 남긴 몫은 뒤의 탐색이 받고,
+        받은 탐색은 줄의 뒤로 가므로 적이 많아 한 프레임에 모두 못 받아도 다음 프레임에 차례가 옵니다.
+        """
+        active = self.active
+        remaining = self.budget
+        waiting = len(active)
+        while waiting and remaining > 0:
+            search = active.popleft()
+            share = max(1, remaining // waiting)
+            remaining -= search.step(share)
+            if not search.done:
+                active.append(search)
+            waiting -= 1
+        self.expanded_last_frame = self.budget - remaining
+        return self.expanded_last_frame
+
+
+class SlicedPathfinder:
+    """
+    Enemy 가 쓰는 pathfinder 인터페이스입니다. 적 한 마리에 하나씩 만들고, 실제 탐색은 SearchScheduler 가 나눠서 돌립니다.
+    탐색이 끝나기 전에는 지금까지 가장 좋은 부분 경로를 돌려주므로 적은 멈추지 않고 그쪽으로 움직입니다.
+    """
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+
+    def find_path(self, start, goal):
+        search = self.scheduler.request(self, start, goal)
+        position = search.path_position(start)
+        if position == -1:
+            return []  # 부분 경로에서 벗어났으면 탐색이 더 진행될 때까지 기다립니다.
+        return search.path()[position:]
@@ -1,21 +1,9 @@
+from pathfinding.clearance import ClearanceMap
+
 def manhattan_distance(start, goal):
     return abs(start[0] - goal[0]) + abs(start[1] - goal[1])
 
 def can_move_diagonal(tile_map, current, row_offset, col_offset):
-    row_check = current[1] + row_offset
-    col_check = current[0] + col_offset
-
-    if (
-        row_check < 0 or row_check >= len(tile_map.tile_map) - 1 or
-        col_check < 0 or col_check >= len(tile_map.tile_map[0]) - 1
-    ):
-        return False
-
-    if tile_map.is_obstacle(col_check, row_check) or tile_map.is_obstacle(col_check, row_check + 1):
-        return False
-    if tile_map.is_obstacle(current[0], row_check) or tile_map.is_obstacle(current[0], row_check + 1):
-        return False
-    if tile_map.is_obstacle(col_check, current[1]) or tile_map.is_obstacle(col_check, current[1] + 1):
-        return False
-
-    return True
+    # 1x2 몸이 가로/세로로 한 칸 옮긴 자리와 대각선 자리에 모두 들어가는지, 미리 계산한 너비와 비교만 합니다.
+    clearance = ClearanceMap.for_tile_map(tile_map)
+    return clearance.can_move_diagonal(current[0], current[1], col_offset, row_offset, 1, 2)
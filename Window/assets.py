@@ -0,0 +1,117 @@
+import pygame
+
+
+class AssetManager:
+    """
+    이미지와 스프라이트 시트를 경로마다 한 번만 읽어 두고, 쓰는 곳 수(참조 수)를 셉니다.
+    - acquire(path) 로 받고, 다 쓰면 release(path) 합니다. 참조 수가 0 이 되면 그 이미지와 잘라 둔 프레임을 모두 버립니다.
+    - get_frames() 는 (경로, 프레임 수, 좌우 뒤집기, 배율) 마다 프레임 리스트 하나를 만들어 두고 모두에게 같은 리스트를 줍니다.
+      (적이 몇 마리든 같은 Surface 를 나눠 씁니다)
+    - disk_loads 는 실제로 파일을 읽은 횟수, memory_report() 는 경로마다 차지하는 픽셀 메모리입니다.
+    - atlas 에 TextureAtlas (atlas.py) 를 넣어 두면 Animation 이 그 안에 있는 시트를 아틀라스 페이지에서 꺼내 씁니다.
+    """
+
+    def __init__(self):
+        self.images = {}  # 경로 -> Surface
+        self.ref_counts = {}  # 경로 -> 참조 수
+        self.frames = {}  # (경로, 프레임 번호, 좌우 뒤집기, 배율) -> 프레임 Surface
+        self.frame_lists = {}  # (경로, 프레임 수, 좌우 뒤집기, 배율) -> 프레임 리스트
+        self.disk_loads = 0
+        self.atlas = None
+
+    def load(self, path, alpha=True):
+        """
+        참조 수를 바꾸지 않고 이미지를 돌려줍니다. 처음이면 파일을 읽습니다.
+        """
+        image = self.images.get(path)
+        if image is None:
+            image = pygame.image.load(path)
+            image = image.convert_alpha() if alpha else image.convert()
+            self.images[path] = image
+            self.ref_counts.setdefault(path, 0)
+            self.disk_loads += 1
+        return image
+
+    def add(self, path, image):
+        """
+        다른 곳에서 읽어 둔 이미지를 참조 수 0 으로 넣어 둡니다. (Preloader)
+        """
+        self.images[path] = image
+        self.ref_counts.setdefault(path, 0)
+        self.disk_loads += 1
+
+    def acquire(self, path, alpha=True):
+        image = self.load(path, alpha)
+        self.ref_counts[path] += 1
+        return image
+
+    def release(self, path):
+        self.ref_counts[path] -= 1
+        if self.ref_counts[path] <= 0:
+            self.unload(path)
+
+    def unload(self, path):
+        self.images.pop(path, None)
+        self.ref_counts.pop(path, None)
+        for key in [key for key in self.frames if key[0] == path]:
+            del self.frames[key]
+        for key in [key for key in self.frame_lists if key[0] == path]:
+            del self.frame_lists[key]
+
+    def get_frame(self, path, index, num_frames, flip=False, scale=1):
+        """
+        가로로 num_frames 칸이 이어진 시트에서 index 번째 프레임을 돌려줍니다.
+        처음 물을 때만 잘라내고 (배율을 바꾸고, 뒤집고) 그 뒤로는 만들어 둔 Surface 를 그대로 돌려줍니다.
+        """
+        key = (path, index, flip, scale)
+        frame = self.frames.get(key)
+        if frame is not None:
+            return frame
+        if flip:
+            frame = pygame.transform.flip(self.get_frame(path, index, num_frames, False, scale), True, False)
+        elif scale != 1:
+            frame = pygame.transform.scale_by(self.get_frame(path, index, num_frames, False, 1), scale)
+        else:
+            sheet = self.load(path)
+            frame_width = sheet.get_width() // num_frames
+            frame = sheet.subsurface(pygame.Rect(index * frame_width, 0, frame_width, sheet.get_height()))
+        self.frames[key] = frame
+        return frame
+
+    def get_frames(self, path, num_frames, flip=False, scale=1):
+        key = (path, num_frames, flip, scale)
+        frame_list = self.frame_lists.get(key)
+        if frame_list is None:
+            frame_list = [self.get_frame(path, index, num_frames, flip, scale) for index in range(num_frames)]
+            self.frame_lists[key] = frame_list
+        return frame_list
+
+    def memory_usage(self, path):
+        # 원본 이미지 + 따로 픽셀을 가진 프레임 (subsurface 는 원본의 픽셀을 함께 쓰므로 세지 않습니다)
+        image = self.images.get(path)
+        if image is None:
+            return 0
+        total = image.get_width() * image.get_height() * image.get_bytesize()
+        for key, frame in self.frames.items():
+            if key[0] == path and frame.get_parent() is None:
+                total += frame.get_width() * frame.get_height() * frame.get_bytesize()
+        return total
+
+    def memory_report(self):
+        """
+        [(경로, 참조 수, 바이트)] 를 메모리를 많이 쓰는 순서로 돌려줍니다.
+        """
+        report = [(path, self.ref_counts.get(path, 0), self.memory_usage(path)) for path in self.images]
+        report.sort(key=lambda row: row[2], reverse=True)
+        return report
+
+    def clear(self):
+        self.images.clear()
+        self.ref_counts.clear()
+        self.frames.clear()
+        self.frame_lists.clear()
+        self.atlas = None
+
+
+# 게임 전체가 함께 쓰는 AssetManager
+assets = AssetManager()
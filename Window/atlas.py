@@ -0,0 +1,230 @@
+"""
+스프라이트 시트의 프레임들을 큰 Surface (페이지) 몇 장에 모아 두는 텍스처 아틀라스입니다.
+
+만들기 (게임 밖에서 한 번, 시트를 바꿀 때마다). Window 폴더에서 실행합니다:
+    python atlas.py [페이지 최대 크기]
+ATLAS_SHEETS 의 시트를 프레임마다 잘라 투명한 가장자리를 잘라내고, 페이지에 선반(shelf) 방식으로 채워 넣은 뒤
+assets/atlas/atlas_N.png 와 프레임 목록 assets/atlas/atlas.json 을 씁니다.
+
+atlas.json:
+    {
+        "pages": ["atlas_0.png", ...],
+        "animations": {
+            "<원래 시트 경로>": {
+                "size": [프레임 너비, 프레임 높이],   # 잘라내기 전 한 칸의 크기 (Animation.rect 크기)
+                "loop": true,
+                "frames": [
+                    {"page": 0, "rect": [x, y, w, h], "offset": [x, y], "pivot": [x, y], "duration": 0.1},
+                    ...
+                ]
+            }
+        }
+    }
+- rect: 페이지에서 잘라낸 프레임의 자리
+- offset: 잘라낸 프레임이 원래 칸의 왼쪽 위에서 떨어진 거리 (그릴 때 이만큼 옮겨 그립니다)
+- pivot: 잘라낸 프레임 안에서 원래 칸의 midbottom (발밑) 위치
+- duration: 그 프레임을 보여 줄 시간 (초)
+
+쓰기 (게임 안):
+    assets.atlas = TextureAtlas(ATLAS_INDEX)
+그 뒤로 만든 Animation 은 atlas 에 있는 시트를 원래 PNG 대신 페이지의 subsurface 로 그립니다.
+"""
+import json
+import os
+import sys
+
+import pygame
+
+from assets import assets
+
+ATLAS_INDEX = "assets/atlas/atlas.json"
+ATLAS_MAX_SIZE = 2048  # 페이지 한 장의 최대 너비/높이
+ATLAS_PADDING = 1  # 프레임 사이 빈칸 (배율을 바꿔 그릴 때 옆 프레임이 번지지 않게)
+
+# (시트 경로, 프레임 수, 프레임 시간, 반복) - main.py / characters.py 의 Animation 과 같은 값
+ATLAS_SHEETS = (
+    ("assets/player/idle.png", 8, 0.1, True),
+    ("assets/player/attack1.png", 6, 0.1, False),
+    ("assets/player/attack2.png", 4, 0.1, False),
+    ("assets/player/attack3.png", 6, 0.1, False),
+    ("assets/player/Fire_Warrior_FireSwordIdle.png", 8, 0.1, True),
+    ("assets/player/Fire_Warrior_FireSwordRun.png", 8, 0.1, True),
+    ("assets/player/Fire_Warrior_FireSwordDash.png", 4, 0.3 / 7, False),
+    ("assets/player/Fire_Warrior_FireSwordHit.png", 4, 0.2 / 4, False),
+    ("assets/player/Fire_Warrior_FireSwordDeath.png", 11, 0.1, False),
+    ("assets/player/Fire_Warrior_FireSwordAttack1.png", 5, 0.1, False),
+    ("assets/player/Fire_Warrior_FireSwordAttack2.png", 4, 0.1, False),
+    ("assets/player/Fire_Warrior_FireSwordAttack3.png", 8, 0.1, False),
+    ("assets/enemy/idle.png", 10, 0.2, True),
+    ("assets/enemy/run.png", 4, 0.2, True),
+    ("assets/enemy/hurt.png", 2, 0.1, False),
+    ("assets/enemy/attack.png", 7, 0.1, False),
+    ("assets/Knight/tile000.png", 9, 0.1, True),
+    ("assets/Knight/tile001.png", 6, 0.1, True),
+    ("assets/Knight/tile002.png", 12, 0.1, False),
+    ("assets/Knight/tile003.png", 5, 0.05, False),
+)
+
+
+def trim_rect(frame):
+    # 보이는 픽셀만 감싸는 Rect. 완전히 투명한 프레임은 1x1 로 둡니다.
+    bounds = frame.get_bounding_rect()
+    if bounds.width == 0 or bounds.height == 0:
+        return pygame.Rect(0, 0, 1, 1)
+    return bounds
+
+
+def pack_shelves(sizes, max_size=ATLAS_MAX_SIZE, padding=ATLAS_PADDING):
+    """
+    (너비, 높이) 목록을 페이지에 선반 방식으로 채워 넣고, ([(페이지, x, y)], [(페이지 너비, 페이지 높이)]) 를 돌려줍니다.
+    키가 큰 것부터 한 줄(선반)에 왼쪽에서 오른쪽으로 놓고, 줄이 차면 그 아래에 새 줄을, 페이지가 차면 새 페이지를 엽니다.
+    """
+    order = sorted(range(len(sizes)), key=lambda index: (-sizes[index][1], -sizes[index][0]))
+    placements = [None] * len(sizes)
+    pages = []
+    page = -1
+    x = y = shelf_height = page_width = 0
+    for index in order:
+        width, height = sizes[index]
+        if width > max_size or height > max_size:
+            raise ValueError(f"{width}x{height} 프레임은 {max_size}x{max_size} 페이지에 들어가지 않습니다")
+        if page >= 0 and x + width > max_size:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        if page < 0 or y + height > max_size:
+            if page >= 0:
+                pages.append((page_width, y))
+            page += 1
+            x = y = shelf_height = page_width = 0
+        placements[index] = (page, x, y)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+        page_width = max(page_width, x - padding)
+    if page >= 0:
+        pages.append((page_width, y + shelf_height))
+    return placements, pages
+
+
+def build_atlas(sheets=ATLAS_SHEETS, index_path=ATLAS_INDEX, max_size=ATLAS_MAX_SIZE, padding=ATLAS_PADDING):
+    """
+    sheets 의 프레임을 모두 페이지에 채워 넣고 페이지 PNG 와 index_path (JSON) 를 씁니다. 만든 index 를 돌려줍니다.
+    (디스플레이 없이도 돕니다. convert 하지 않은 원래 픽셀을 그대로 옮깁니다)
+    """
+    frames = []  # (시트 경로, 잘라낸 Surface, offset)
+    animations = {}
+    for path, num_frames, frame_length, loop in sheets:
+        sheet = pygame.image.load(path)
+        frame_width = sheet.get_width() // num_frames
+        frame_height = sheet.get_height()
+        animations[path] = {"size": [frame_width, frame_height], "loop": loop, "frames": []}
+        for index in range(num_frames):
+            frame = sheet.subsurface(pygame.Rect(index * frame_width, 0, frame_width, frame_height))
+            bounds = trim_rect(frame)
+            frames.append((path, frame.subsurface(bounds), (bounds.x, bounds.y), frame_length))
+
+    placements, page_sizes = pack_shelves([frame.get_size() for _, frame, _, _ in frames], max_size, padding)
+    pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+    for (path, frame, offset, frame_length), (page, x, y) in zip(frames, placements):
+        pages[page].blit(frame, (x, y))
+        frame_width, frame_height = animations[path]["size"]
+        animations[path]["frames"].append({
+            "page": page,
+            "rect": [x, y, frame.get_width(), frame.get_height()],
+            "offset": list(offset),
+            "pivot": [frame_width // 2 - offset[0], frame_height - offset[1]],
+            "duration": frame_length,
+        })
+
+    directory = os.path.dirname(index_path)
+    os.makedirs(directory, exist_ok=True)
+    base_name = os.path.splitext(os.path.basename(index_path))[0]
+    page_names = []
+    for number, page in enumerate(pages):
+        page_name = f"{base_name}_{number}.png"
+        pygame.image.save(page, os.path.join(directory, page_name))
+        page_names.append(page_name)
+
+    index = {"pages": page_names, "animations": animations}
+    # 다시 만들 때 diff 가 작도록 공백 없이, 애니메이션 하나를 한 줄에 씁니다.
+    lines = [f"{json.dumps(path)}:{json.dumps(animation, separators=(',', ':'))}" for path, animation in animations.items()]
+    with open(index_path, "w") as file:
+        file.write(f'{{"pages":{json.dumps(page_names)},"animations":{{\n' + ",\n".join(lines) + "\n}}\n")
+    return index
+
+
+class TextureAtlas:
+    """
+    build_atlas 가 쓴 JSON 을 읽고 페이지를 assets 로 받아 둡니다. 프레임은 모두 페이지의 subsurface 라서
+    시트가 몇 장이든 Surface (파일) 는 페이지 수만큼입니다. 다 쓰면 release() 로 페이지를 돌려줍니다.
+    """
+
+    def __init__(self, index_path=ATLAS_INDEX):
+        with open(index_path) as file:
+            index = json.load(file)
+        directory = os.path.dirname(index_path)
+        self.page_paths = [os.path.join(directory, page) for page in index["pages"]]
+        self.pages = [assets.acquire(path) for path in self.page_paths]
+        self.animations = index["animations"]
+        self.frame_lists = {}  # (시트 경로, 좌우 뒤집기) -> (프레임 리스트, offset 리스트)
+
+    def __contains__(self, path):
+        return path in self.animations
+
+    def frame_size(self, path):
+        return tuple(self.animations[path]["size"])
+
+    def durations(self, path):
+        return [frame["duration"] for frame in self.animations[path]["frames"]]
+
+    def get_frames(self, path, flip=False):
+        """
+        (프레임 리스트, offset 리스트) 를 돌려줍니다. offset 은 원래 칸 왼쪽 위에서 잘라낸 프레임까지의 거리이고,
+        flip 이면 좌우를 뒤집은 프레임과 뒤집은 칸 기준의 offset 입니다. 같은 (경로, 방향) 은 같은 리스트를 돌려줍니다.
+        """
+        key = (path, flip)
+        cached = self.frame_lists.get(key)
+        if cached is not None:
+            return cached
+        animation = self.animations[path]
+        frame_width = animation["size"][0]
+        if flip:
+            frames = [pygame.transform.flip(frame, True, False) for frame in self.get_frames(path)[0]]
+            offsets = [
+                (frame_width - frame["rect"][2] - frame["offset"][0], frame["offset"][1]) for frame in animation["frames"]
+            ]
+        else:
+            frames = [self.pages[frame["page"]].subsurface(pygame.Rect(frame["rect"])) for frame in animation["frames"]]
+            offsets = [tuple(frame["offset"]) for frame in animation["frames"]]
+        self.frame_lists[key] = (frames, offsets)
+        return frames, offsets
+
+    def release(self):
+        for path in self.page_paths:
+            assets.release(path)
+        self.pages = []
+        self.frame_lists.clear()
+
+
+def main():
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else ATLAS_MAX_SIZE
+    index = build_atlas(max_size=max_size)
+    frame_count = sum(len(animation["frames"]) for animation in index["animations"].values())
+    source_pixels = 0
+    for path, num_frames, _, _ in ATLAS_SHEETS:
+        width, height = index["animations"][path]["size"]
+        source_pixels += width * height * num_frames
+    page_pixels = 0
+    for page in index["pages"]:
+        width, height = pygame.image.load(os.path.join(os.path.dirname(ATLAS_INDEX), page)).get_size()
+        page_pixels += width * height
+        print(f"{page}: {width}x{height}")
+    print(
+        f"시트 {len(index['animations'])}장, 프레임 {frame_count}개 -> 페이지 {len(index['pages'])}장 "
+        f"(픽셀 {source_pixels} -> {page_pixels}, {page_pixels / source_pixels:.0%})"
+    )
+    print(f"{ATLAS_INDEX} 를 썼습니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+적 여러 마리가 Animation 을 그릴 때, 예전 방식 (Animation 마다 시트를 읽고, 그릴 때마다 flip 으로 새 Surface 를 만듦) 과
+assets (미리 뒤집어 둔 프레임을 모든 Animation 이 함께 씀) 의 만들기/그리기 시간과 프레임 Surface 수를 비교합니다.
+
+Window 폴더에서 실행합니다:
+    python -m benchmarks.animation_frames [적 수] [프레임 수]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from assets import assets
+
+# main.py 의 Enemy 가 쓰는 시트
+ENEMY_SHEETS = (
+    ("assets/enemy/idle.png", 10),
+    ("assets/enemy/run.png", 4),
+    ("assets/enemy/hurt.png", 2),
+    ("assets/enemy/attack.png", 7),
+)
+
+
+def load_frames_per_animation(path, num_frames):
+    # 비교용: 예전 Animation.__init__ / load_frames
+    sheet = pygame.image.load(path).convert_alpha()
+    width = sheet.get_width() // num_frames
+    return [sheet.subsurface(pygame.Rect(i * width, 0, width, sheet.get_height())) for i in range(num_frames)]
+
+
+def run(enemy_count, frames, cached):
+    start_time = time.perf_counter()
+    enemies = []
+    for _ in range(enemy_count):
+        if cached:
+            enemies.append([(assets.get_frames(path, n), assets.get_frames(path, n, flip=True)) for path, n in ENEMY_SHEETS])
+        else:
+            enemies.append([(load_frames_per_animation(path, n), None) for path, n in ENEMY_SHEETS])
+    build_time = time.perf_counter() - start_time
+
+    surface = pygame.Surface((2000, 300), pygame.SRCALPHA)
+    start_time = time.perf_counter()
+    for frame in range(frames):
+        for number, animations in enumerate(enemies):
+            right_frames, left_frames = animations[frame % len(animations)]
+            flip = number % 2 == 1  # 절반은 왼쪽을 봅니다.
+            image = right_frames[frame % len(right_frames)]
+            if cached:
+                if flip:
+                    image = left_frames[frame % len(left_frames)]
+            else:
+                image = pygame.transform.flip(image, flip, False)
+            surface.blit(image, (number * 7 % 1950, 100))
+    draw_time = time.perf_counter() - start_time
+
+    unique = {id(frame) for animations in enemies for pair in animations for frame_list in pair if frame_list for frame in frame_list}
+    return build_time, draw_time, len(unique)
+
+
+def main():
+    enemy_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 120
+    pygame.display.set_mode((1, 1))
+
+    build_time, draw_time, surfaces = run(enemy_count, frames, cached=False)
+    print(f"적 {enemy_count}마리, {frames}프레임")
+    print(f"  예전       : 만들기 {build_time * 1000:7.1f}ms, 그리기 {draw_time / frames * 1000:5.2f}ms / 프레임, 프레임 Surface {surfaces}개")
+    assets.clear()
+    build_time, draw_time, surfaces = run(enemy_count, frames, cached=True)
+    print(f"  assets     : 만들기 {build_time * 1000:7.1f}ms, 그리기 {draw_time / frames * 1000:5.2f}ms / 프레임, 프레임 Surface {surfaces}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+적 한 무리(기본 200마리)를 만들 때 파일을 몇 번 읽는지, 시간이 얼마나 걸리는지를
+예전 방식 (Animation 마다 pygame.image.load) 과 AssetManager 로 비교하고, 에셋별 메모리 보고를 보여 줍니다.
+무리를 모두 돌려준 (release) 뒤에는 에셋이 모두 비워지는지도 확인합니다.
+
+Window 폴더에서 실행합니다:
+    python -m benchmarks.asset_cache [적 수]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from assets import AssetManager
+from benchmarks.animation_frames import ENEMY_SHEETS, load_frames_per_animation
+
+
+def spawn_enemy(manager):
+    # main.py 의 Enemy 가 Animation 들을 만들 때와 같은 순서로 에셋을 받습니다.
+    for path, num_frames in ENEMY_SHEETS:
+        manager.acquire(path)
+        manager.get_frames(path, num_frames)
+        manager.get_frames(path, num_frames, flip=True)
+
+
+def release_enemy(manager):
+    for path, _ in ENEMY_SHEETS:
+        manager.release(path)
+
+
+def main():
+    enemy_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pygame.display.set_mode((1, 1))
+
+    start_time = time.perf_counter()
+    for _ in range(enemy_count):
+        for path, num_frames in ENEMY_SHEETS:
+            load_frames_per_animation(path, num_frames)
+    old_time = time.perf_counter() - start_time
+    print(f"적 {enemy_count}마리")
+    print(f"  예전        : {old_time * 1000:7.1f}ms, 파일 읽기 {enemy_count * len(ENEMY_SHEETS)}번")
+
+    manager = AssetManager()
+    start_time = time.perf_counter()
+    spawn_enemy(manager)
+    first_loads = manager.disk_loads
+    for _ in range(enemy_count - 1):
+        spawn_enemy(manager)
+    new_time = time.perf_counter() - start_time
+    print(
+        f"  AssetManager: {new_time * 1000:7.1f}ms, 파일 읽기 {manager.disk_loads}번 "
+        f"(첫 마리 {first_loads}번, 나머지 {manager.disk_loads - first_loads}번)"
+    )
+    for path, refs, size in manager.memory_report():
+        print(f"    {path:<28} 참조 {refs:>4}  {size / 1024:7.1f}KB")
+
+    for _ in range(enemy_count):
+        release_enemy(manager)
+    print(f"  모두 돌려준 뒤 남은 에셋: {len(manager.images)}개, 프레임 {len(manager.frames)}개")
+    return manager.disk_loads - first_loads or len(manager.images)
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
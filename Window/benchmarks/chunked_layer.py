@@ -0,0 +1,121 @@
+"""
+PlayScene 의 배경 세 층을 예전처럼 스테이지 너비 Surface 에 통째로 미리 그려 두고 붙일 때와
+ChunkedLayer (보이는 조각만 그리고 붙임) 로 그릴 때를 비교합니다.
+- 카메라 위치 여러 곳에서 같은 그림인지
+- 스테이지가 길어질 때 만들기 시간, 들고 있는 메모리, 프레임마다 그리는 시간
+
+Window 폴더에서 실행합니다:
+    python -m benchmarks.chunked_layer [프레임 수]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from assets import assets
+from chunked_layer import ChunkedLayer
+
+LOGICAL_WIDTH, LOGICAL_HEIGHT = 400, 300
+LAYER_PATHS = ("assets/background/background.png", "assets/background/midground.png", "assets/background/foreground.png")
+STAGE_WIDTHS = (LOGICAL_WIDTH * 2, LOGICAL_WIDTH * 10, LOGICAL_WIDTH * 50)
+
+
+def full_layers(images, width):
+    # 비교용: 예전 PlayScene.__init__ / draw
+    background, midground, foreground = images
+    background_layer = pygame.Surface((width, LOGICAL_HEIGHT))
+    midground_layer = pygame.Surface((width, LOGICAL_HEIGHT), pygame.SRCALPHA)
+    foreground_layer = pygame.Surface((width, LOGICAL_HEIGHT), pygame.SRCALPHA)
+    for x in range(0, width, background.get_width()):
+        background_layer.blit(background, (x, 0))
+    for x in range(0, width, midground.get_width()):
+        midground_layer.blit(midground, (x, 0))
+    return background_layer, midground_layer, foreground_layer
+
+
+def draw_full(surface, layers, foreground, camera_x):
+    background_layer, midground_layer, foreground_layer = layers
+    foreground_layer.fill((0, 0, 0, 0))
+    foreground_layer.blit(foreground, (0, 0))
+    surface.blit(background_layer, (-camera_x, 0))
+    surface.blit(midground_layer, (-camera_x, 0))
+    surface.blit(foreground_layer, (-camera_x, 0))
+
+
+def chunked_layers(images, width):
+    background, midground, foreground = images
+    entity_layer = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT), pygame.SRCALPHA)
+    return (
+        ChunkedLayer(background, width, LOGICAL_HEIGHT, alpha=False),
+        ChunkedLayer(midground, width, LOGICAL_HEIGHT),
+        ChunkedLayer(foreground, width, LOGICAL_HEIGHT, repeat=False),
+        entity_layer,
+    )
+
+
+def draw_chunked(surface, layers, camera_x):
+    # main.py PlayScene.draw 와 같은 순서 (캐릭터는 빼고)
+    background_layer, midground_layer, foreground_layer, entity_layer = layers
+    entity_layer.fill((0, 0, 0, 0))
+    foreground_layer.draw(entity_layer, camera_x)
+    background_layer.draw(surface, camera_x)
+    midground_layer.draw(surface, camera_x)
+    surface.blit(entity_layer, (0, 0))
+
+
+def layer_bytes(surfaces):
+    return sum(surface.get_width() * surface.get_height() * surface.get_bytesize() for surface in surfaces)
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.display.set_mode((1, 1))
+    images = [assets.load(path) for path in LAYER_PATHS]
+    expected = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+    actual = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+    mismatches = 0
+
+    for width in STAGE_WIDTHS:
+        camera_positions = [(width - LOGICAL_WIDTH) * frame // frames for frame in range(frames)]
+
+        start_time = time.perf_counter()
+        full = full_layers(images, width)
+        full_build = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        for camera_x in camera_positions:
+            draw_full(expected, full, images[2], camera_x)
+        full_draw = (time.perf_counter() - start_time) / frames
+
+        start_time = time.perf_counter()
+        chunked = chunked_layers(images, width)
+        chunked_build = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        for camera_x in camera_positions:
+            draw_chunked(actual, chunked, camera_x)
+        chunked_draw = (time.perf_counter() - start_time) / frames
+
+        for camera_x in camera_positions[::37] + [width - LOGICAL_WIDTH]:
+            draw_full(expected, full, images[2], camera_x)
+            draw_chunked(actual, chunked, camera_x)
+            if pygame.image.tobytes(expected, "RGB") != pygame.image.tobytes(actual, "RGB"):
+                mismatches += 1
+
+        chunk_surfaces = [chunk for layer in chunked[:3] for chunk in layer.chunks.values()]
+        print(f"스테이지 너비 {width}px")
+        print(
+            f"  통째로   : 만들기 {full_build * 1000:6.1f}ms, 층 메모리 {layer_bytes(full) / 1e6:6.1f}MB, "
+            f"그리기 {full_draw * 1000:.3f}ms / 프레임"
+        )
+        print(
+            f"  조각     : 만들기 {chunked_build * 1000:6.1f}ms, 층 메모리 {layer_bytes(chunk_surfaces) / 1e6:6.1f}MB "
+            f"(+ 캐릭터 층 {layer_bytes(chunked[3:]) / 1e6:.1f}MB), 그리기 {chunked_draw * 1000:.3f}ms / 프레임"
+        )
+    print("그림 확인: 모두 같음" if not mismatches else f"그림 확인: 다른 그림 {mismatches}번")
+    return mismatches
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
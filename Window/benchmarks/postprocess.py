@@ -0,0 +1,107 @@
+"""
+화면 효과를 창 크기마다 예전 방식과 PostProcess 로 걸어 보고 프레임마다 걸리는 시간을 비교합니다.
+- 스캔라인: 예전 draw_scanlines (프레임마다 pygame.draw.line 수천 번) / 만들어 둔 곱하기 Surface 한 번 붙이기
+- 흐리게: 예전 blur_surface (프레임마다 Surface 두 장 새로 만듦) / 줄인 Surface 를 다시 쓰는 BlurPass
+- 스캔라인 + 비네트를 한 장으로 합친 것이 하나씩 차례로 붙인 것과 (반올림 1 이내로) 같은지,
+  같은 크기로 다시 resize() 해도 새로 만들지 않는지 확인합니다.
+
+Window 폴더에서 실행합니다:
+    python -m benchmarks.postprocess [프레임 수]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from postprocess import BlurPass, PostProcess, ScanlinePass, VignettePass
+
+SCREEN_SIZES = ((800, 600), (1920, 1080), (3840, 2160))
+
+
+def draw_scanlines(surface):
+    # 비교용: 예전 main.py
+    for y in range(0, surface.get_height(), 2):
+        pygame.draw.line(surface, (0, 0, 0, 50), (0, y), (surface.get_width(), y))
+    for x in range(0, surface.get_width(), 2):
+        pygame.draw.line(surface, (0, 0, 0, 50), (x, 0), (x, surface.get_height()))
+
+
+def blur_surface(surface, scale_factor=4):
+    # 비교용: 예전 main.py
+    small_size = (surface.get_width() // scale_factor, surface.get_height() // scale_factor)
+    small_surface = pygame.transform.smoothscale(surface, small_size)
+    return pygame.transform.smoothscale(small_surface, surface.get_size())
+
+
+def time_frames(frames, function):
+    start_time = time.perf_counter()
+    for _ in range(frames):
+        function()
+    return (time.perf_counter() - start_time) / frames * 1000
+
+
+def random_picture(rng, size):
+    surface = pygame.Surface(size)
+    for _ in range(200):
+        color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        surface.fill(color, (rng.randrange(size[0]), rng.randrange(size[1]), rng.randrange(1, 400), rng.randrange(1, 400)))
+    return surface
+
+
+def largest_difference(first, second):
+    first_bytes = pygame.image.tobytes(first, "RGB")
+    second_bytes = pygame.image.tobytes(second, "RGB")
+    return max(abs(a - b) for a, b in zip(first_bytes[::97], second_bytes[::97]))
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    pygame.display.set_mode((1, 1))
+    rng = random.Random(25)
+    failures = 0
+
+    for size in SCREEN_SIZES:
+        picture = random_picture(rng, size)
+        screen = picture.copy()
+
+        old_scanlines = time_frames(frames, lambda: draw_scanlines(screen))
+        old_blur = time_frames(frames, lambda: blur_surface(screen))
+
+        start_time = time.perf_counter()
+        overlays = PostProcess([ScanlinePass(), VignettePass()])
+        overlays.resize(size)
+        build_time = (time.perf_counter() - start_time) * 1000
+        overlay_time = time_frames(frames, lambda: overlays.apply(screen))
+        blur = PostProcess([BlurPass()])
+        blur.resize(size)
+        blur_time = time_frames(frames, lambda: blur.apply(screen))
+
+        # 합친 한 장 == 차례로 하나씩
+        combined = picture.copy()
+        overlays.apply(combined)
+        one_by_one = picture.copy()
+        for post_pass in overlays.passes:
+            post_pass.apply(one_by_one)
+        difference = largest_difference(combined, one_by_one)
+        if difference > 1:
+            failures += 1
+        # 같은 크기면 다시 만들지 않습니다.
+        cached = overlays.steps[0]
+        overlays.resize(size)
+        if overlays.steps[0] is not cached:
+            failures += 1
+
+        print(f"{size[0]}x{size[1]}")
+        print(f"  스캔라인  : 예전 {old_scanlines:7.2f}ms, 스캔라인 + 비네트 한 장 {overlay_time:6.2f}ms / 프레임 (만들기 {build_time:.0f}ms, 창 크기가 바뀔 때만)")
+        print(f"  흐리게    : 예전 {old_blur:7.2f}ms, BlurPass {blur_time:6.2f}ms / 프레임")
+        print(f"  합친 그림과 차례로 붙인 그림의 차이 {difference}")
+    print("확인: 합친 효과가 차례로 붙인 것과 같음, 같은 크기에서 다시 만들지 않음" if not failures else f"확인: 실패 {failures}번")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,62 @@
+"""
+스테이지 하나에 필요한 이미지 (배경 세 장 + 캐릭터 시트) 를
+- 한 프레임 안에서 모두 읽을 때 (예전 MapScene) 의 멈춤 시간과
+- Preloader 로 읽을 때 한 프레임에 메인 스레드가 쓰는 가장 긴 시간, 끝날 때까지 걸린 프레임 수를 비교합니다.
+
+Window 폴더에서 실행합니다:
+    python -m benchmarks.preloader [프레임 간격(ms)]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from assets import assets
+from atlas import ATLAS_SHEETS
+from preloader import Preloader
+
+STAGE_PATHS = (
+    "assets/background/background.png",
+    "assets/background/midground.png",
+    "assets/background/foreground.png",
+    "assets/background/map.png",
+) + tuple(path for path, _, _, _ in ATLAS_SHEETS)
+
+
+def main():
+    frame_interval = (float(sys.argv[1]) if len(sys.argv) > 1 else 1000 / 120) / 1000
+    pygame.display.set_mode((1, 1))
+
+    start_time = time.perf_counter()
+    for path in STAGE_PATHS:
+        assets.load(path)
+    blocking_time = time.perf_counter() - start_time
+    assets.clear()
+
+    preloader = Preloader(STAGE_PATHS)
+    frames = 0
+    longest = 0.0
+    start_time = time.perf_counter()
+    while True:
+        frame_start = time.perf_counter()
+        done = preloader.update()
+        longest = max(longest, time.perf_counter() - frame_start)
+        frames += 1
+        if done:
+            break
+        time.sleep(frame_interval)  # 그 사이 게임은 로딩 화면을 그립니다.
+    total_time = time.perf_counter() - start_time
+
+    print(f"이미지 {len(STAGE_PATHS)}장")
+    print(f"  한 번에 읽기 : 한 프레임 {blocking_time * 1000:6.1f}ms 멈춤")
+    print(f"  Preloader    : 가장 긴 프레임 {longest * 1000:6.1f}ms, {frames}프레임 ({total_time * 1000:.0f}ms) 만에 끝")
+    missing = [path for path in STAGE_PATHS if path not in assets.images]
+    print("확인: 모두 읽음" if not missing else f"확인: 못 읽은 이미지 {missing}")
+    return len(missing)
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,97 @@
+"""
+논리 화면 (400x300) 을 창에 내보내는 시간을 창 크기와 확대 방식마다 잽니다.
+예전 방식 (배율 1 blur 로 smoothscale 두 번 + 프레임마다 새 Surface 로 scale) 과 Presenter 의 각 방식을 비교하고,
+nearest 방식이 예전과 같은 그림인지 확인합니다.
+메뉴에서 버튼 하나만 바뀐 프레임처럼 바뀐 자리만 내보낼 때의 시간과, 그 그림이 화면 전체를 내보낸 것과 같은지도 봅니다.
+
+Window 폴더에서 실행합니다:
+    python -m benchmarks.presenter [프레임 수]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from postprocess import PostProcess
+from presenter import PRESENT_MODES, Presenter
+
+LOGICAL_SIZE = (400, 300)
+SCREEN_SIZES = ((800, 600), (1024, 700), (1920, 1080), (3840, 2160))
+BUTTON_RECT = pygame.Rect(100, 100, 200, 50)  # 논리 좌표, MapScene 의 스테이지 버튼 하나
+
+
+def present_old(screen, logical_surface):
+    # 비교용: 예전 main.py 의 calculate_scale_and_letterbox + blur_surface(scale_factor=1) + scale
+    logical_width, logical_height = logical_surface.get_size()
+    screen_width, screen_height = screen.get_size()
+    if logical_width / logical_height > screen_width / screen_height:
+        scale = screen_width / logical_width
+        offset = (0, (screen_height - logical_height * scale) // 2)
+    else:
+        scale = screen_height / logical_height
+        offset = ((screen_width - logical_width * scale) // 2, 0)
+    small_surface = pygame.transform.smoothscale(logical_surface, logical_surface.get_size())
+    blured_surface = pygame.transform.smoothscale(small_surface, logical_surface.get_size())
+    screen.fill((0, 0, 0))
+    screen.blit(pygame.transform.scale(blured_surface, (logical_width * scale, logical_height * scale)), offset)
+
+
+def time_frames(frames, present):
+    start_time = time.perf_counter()
+    for _ in range(frames):
+        present()
+    return (time.perf_counter() - start_time) / frames * 1000
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    pygame.display.set_mode((1, 1))
+    rng = random.Random(24)
+    logical_surface = pygame.Surface(LOGICAL_SIZE)
+    for _ in range(300):
+        color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        logical_surface.fill(color, (rng.randrange(400), rng.randrange(300), rng.randrange(1, 60), rng.randrange(1, 60)))
+    mismatches = 0
+
+    for screen_size in SCREEN_SIZES:
+        screen = pygame.Surface(screen_size)
+        expected = pygame.Surface(screen_size)
+        present_old(expected, logical_surface)
+        old_time = time_frames(frames, lambda: present_old(screen, logical_surface))
+        line = f"{screen_size[0]}x{screen_size[1]}: 예전 {old_time:6.2f}ms"
+        for mode in PRESENT_MODES:
+            presenter = Presenter(LOGICAL_SIZE, screen_size, mode)
+            line += f", {mode} {time_frames(frames, lambda: presenter.present(screen, logical_surface)):6.2f}ms"
+            if mode == "nearest" and pygame.image.tobytes(screen, "RGB") != pygame.image.tobytes(expected, "RGB"):
+                mismatches += 1
+        print(line + " / 프레임")
+
+        # 버튼 하나가 바뀐 프레임: 바뀐 자리만 확대 (+ 곱하기 효과)
+        changed = logical_surface.copy()
+        changed.fill((200, 200, 0), BUTTON_RECT)
+        line = "  버튼 하나만 바뀐 프레임:"
+        for mode in ("nearest", "integer"):
+            for post_process in (None, PostProcess.from_names(("scanlines", "vignette"))):
+                presenter = Presenter(LOGICAL_SIZE, screen_size, mode, post_process=post_process)
+                expected = pygame.Surface(screen_size)
+                presenter.present(expected, changed)
+                presenter.present(screen, logical_surface)
+                partial_time = time_frames(frames, lambda: presenter.present(screen, changed, [BUTTON_RECT]))
+                full_time = time_frames(frames, lambda: presenter.present(screen, changed))
+                presenter.present(screen, logical_surface)
+                presenter.present(screen, changed, [BUTTON_RECT])
+                if pygame.image.tobytes(screen, "RGB") != pygame.image.tobytes(expected, "RGB"):
+                    mismatches += 1
+                name = mode + ("+효과" if post_process else "")
+                line += f" {name} 전체 {full_time:.2f}ms -> 바뀐 자리 {partial_time:.2f}ms,"
+        print(line.rstrip(","))
+    print("그림 확인: nearest 가 예전과 같음, 바뀐 자리만 내보낸 그림이 전체와 같음" if not mismatches else f"그림 확인: 다른 그림 {mismatches}개")
+    return mismatches
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,69 @@
+"""
+적이 많을 때 공격 판정(공격 rect 와 겹치는 적 찾기)을 적 목록을 모두 훑는 방식과 SpatialHash 로 비교합니다.
+매 프레임 적들이 움직이고, SpatialHash 는 PlayScene.update 처럼 프레임마다 rebuild 한 뒤 공격 rect 들로 query 합니다.
+두 방식이 찾은 적이 (순서까지) 같은지도 확인합니다.
+
+Window 폴더에서 실행합니다:
+    python -m benchmarks.spatial_hash [프레임 수]
+"""
+import random
+import sys
+import time
+
+import pygame
+
+from spatial_hash import SpatialHash
+
+LEVEL_WIDTH, LEVEL_HEIGHT = 20000, 300
+ENEMY_COUNTS = (1000, 2000, 5000)
+HITBOX_COUNT = 200  # 한 프레임의 공격 rect, 투사체 수
+
+
+class Target:
+    # Enemy 처럼 rect 만 가진 물체
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 24, 50)
+
+
+def simulate(enemy_count, frames, use_grid, seed=0):
+    rng = random.Random(seed)
+    enemies = [Target(rng.randrange(LEVEL_WIDTH), rng.randrange(LEVEL_HEIGHT - 50)) for _ in range(enemy_count)]
+    enemy_grid = SpatialHash()
+    hits = []
+    elapsed = 0.0
+    for _ in range(frames):
+        for enemy in enemies:
+            enemy.rect.x += rng.randint(-3, 3)
+        hitboxes = [pygame.Rect(rng.randrange(LEVEL_WIDTH), rng.randrange(LEVEL_HEIGHT - 50), 45, 50) for _ in range(HITBOX_COUNT)]
+        start_time = time.perf_counter()
+        if use_grid:
+            enemy_grid.rebuild(enemies)
+            for hitbox in hitboxes:
+                hits.append(enemy_grid.query(hitbox))
+        else:
+            for hitbox in hitboxes:
+                hits.append([enemy for enemy in enemies if hitbox.colliderect(enemy.rect)])
+        elapsed += time.perf_counter() - start_time  # 적 이동과 공격 rect 만들기는 빼고 잽니다.
+    return elapsed, [[enemies.index(enemy) for enemy in frame_hits] for frame_hits in hits[:HITBOX_COUNT * 3]]
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    failures = 0
+    for enemy_count in ENEMY_COUNTS:
+        linear_time, linear_hits = simulate(enemy_count, frames, use_grid=False)
+        grid_time, grid_hits = simulate(enemy_count, frames, use_grid=True)
+        same = linear_hits == grid_hits
+        failures += not same
+        print(
+            f"적 {enemy_count}, 공격 rect {HITBOX_COUNT}/프레임: "
+            f"모두 훑기 {linear_time / frames * 1000:7.2f}ms, "
+            f"공간 해시 {grid_time / frames * 1000:6.2f}ms / 프레임 "
+            f"({linear_time / grid_time:.0f}배)" + ("" if same else "  결과 다름")
+        )
+    print("결과 확인: 모두 같음" if not failures else f"결과 확인: 다른 경우 {failures}개")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,85 @@
+"""
+ATLAS_SHEETS 를 아틀라스로 만든 뒤
+- 시트 PNG 에서 자른 프레임과 아틀라스 프레임 (offset 만큼 옮겨 그림) 이 좌우 모두 같은 픽셀로 그려지는지 확인하고
+- 시트를 따로 읽을 때와 아틀라스를 읽을 때의 파일 수, Surface 수, 읽는 시간을 비교합니다.
+아틀라스는 임시 폴더에 만들므로 assets/atlas 는 건드리지 않습니다.
+
+Window 폴더에서 실행합니다:
+    python -m benchmarks.texture_atlas
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from assets import assets
+from atlas import ATLAS_SHEETS, TextureAtlas, build_atlas
+
+
+def draw_sheet_frame(surface, frames, index, midbottom):
+    # main.py Animation.draw 의 시트 쪽
+    rect = frames[index].get_rect(midbottom=midbottom)
+    surface.blit(frames[index], rect)
+
+
+def draw_atlas_frame(surface, frames, offsets, index, frame_size, midbottom):
+    # main.py Animation.draw 의 아틀라스 쪽
+    rect = pygame.Rect((0, 0), frame_size)
+    rect.midbottom = midbottom
+    surface.blit(frames[index], (rect.x + offsets[index][0], rect.y + offsets[index][1]))
+
+
+def compare(atlas):
+    mismatches = []
+    for path, num_frames, _, _ in ATLAS_SHEETS:
+        for flip in (False, True):
+            sheet_frames = assets.get_frames(path, num_frames, flip)
+            atlas_frames, offsets = atlas.get_frames(path, flip)
+            frame_size = atlas.frame_size(path)
+            for index in range(num_frames):
+                expected = pygame.Surface((300, 200), pygame.SRCALPHA)
+                actual = pygame.Surface((300, 200), pygame.SRCALPHA)
+                draw_sheet_frame(expected, sheet_frames, index, (150, 180))
+                draw_atlas_frame(actual, atlas_frames, offsets, index, frame_size, (150, 180))
+                if pygame.image.tobytes(expected, "RGBA") != pygame.image.tobytes(actual, "RGBA"):
+                    mismatches.append((path, index, flip))
+    return mismatches
+
+
+def main():
+    pygame.display.set_mode((1, 1))
+    index_path = os.path.join(tempfile.mkdtemp(), "atlas.json")
+
+    start_time = time.perf_counter()
+    index = build_atlas(index_path=index_path)
+    build_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for path, num_frames, _, _ in ATLAS_SHEETS:
+        assets.acquire(path)
+        assets.get_frames(path, num_frames)
+    sheet_time = time.perf_counter() - start_time
+    sheet_loads = assets.disk_loads
+    sheet_surfaces = len(assets.images)
+
+    start_time = time.perf_counter()
+    atlas = TextureAtlas(index_path)
+    for path, _, _, _ in ATLAS_SHEETS:
+        atlas.get_frames(path)
+    atlas_time = time.perf_counter() - start_time
+
+    mismatches = compare(atlas)
+    frame_count = sum(len(animation["frames"]) for animation in index["animations"].values())
+    print(f"시트 {len(ATLAS_SHEETS)}장, 프레임 {frame_count}개, 아틀라스 만들기 {build_time * 1000:.0f}ms")
+    print(f"  시트 PNG : 파일 {sheet_loads}개, 원본 Surface {sheet_surfaces}개, 읽기 {sheet_time * 1000:6.1f}ms")
+    print(f"  아틀라스 : 파일 {len(index['pages']) + 1}개 (JSON 포함), 원본 Surface {len(atlas.pages)}개, 읽기 {atlas_time * 1000:6.1f}ms")
+    print("그리기 확인: 모두 같음" if not mismatches else f"그리기 확인: 다른 프레임 {len(mismatches)}개 {mismatches[:5]}")
+    return len(mismatches)
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -2,6 +2,7 @@ import pygame
 from enum import Enum, auto
 from dataclasses import dataclass
 from utils import Button, Camera, Animation, Timer
+from spatial_hash import SpatialHash
 
 DEBUG = True
 @dataclass
@@ -85,7 +86,7 @@ class Player:
         self.attack_combo = 0
         self.current_attack = self.attack_data[self.attack_combo]
 
-        self.enemies = []
+        self.enemy_grid = SpatialHash()  # 공격 범위와 겹치는 적을 찾을 때 씁니다. (PlayScene 이 매 프레임 다시 등록)
 
         self.state = Player.State.NORMAL
         self.is_attack_frame_active = False
@@ -116,7 +117,7 @@ class Player:
             elif event.key == self.controls["dash"]:
                 self.pressed_actions.remove("dash")
 
-    def update(self, enemies, delta_time):
+    def update(self, enemy_grid, delta_time):
         match self.state:
             case Player.State.DEAD:
                 if self.death_animation.finished:
@@ -128,7 +129,7 @@ class Player:
                 self.hurt(delta_time)
 
             case Player.State.ATTACK:
-                self.enemies = enemies
+                self.enemy_grid = enemy_grid
                 self.attack(self.current_attack, delta_time)
                 
             case Player.State.DASH:
@@ -210,13 +211,12 @@ class Player:
             else:
                 self.current_attack.rect.x = self.rect.centerx - self.current_attack.rect.width
             self.current_attack.rect.y = self.rect.y
-            for enemy in self.enemies:
-                if self.current_attack.rect.colliderect(enemy.rect):
-                    if self.facing_right:
-                        knuck_back_direction = 1
-                    else:
-                        knuck_back_direction = -1
-                    enemy.take_damage(10, knuck_back_direction, self.knuck_back_distance, self.knock_back_time)
+            for enemy in self.enemy_grid.query(self.current_attack.rect):
+                if self.facing_right:
+                    knuck_back_direction = 1
+                else:
+                    knuck_back_direction = -1
+                enemy.take_damage(10, knuck_back_direction, self.knuck_back_distance, self.knock_back_time)
 
         if self.current_animation.current_frame == current_attack.dash_frame:
             self.x += self.pressed_directions[-1] * self.current_attack.dash_speed * delta_time
@@ -0,0 +1,52 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class ChunkedLayer:
+    """
+    이미지 한 장을 가로로 이어 붙인 (repeat=False 면 한 번만 놓은) width x height 짜리 배경 층입니다.
+    층 전체를 한 Surface 에 미리 그리지 않고 chunk_width 너비의 조각으로 나눠, 화면에 처음 보일 때만 조각을 그립니다.
+    draw() 는 카메라에 보이는 조각만 붙이고, 조각이 max_chunks 장을 넘으면 가장 오래 안 보인 것부터 버리므로
+    스테이지가 아무리 길어도 메모리는 조각 max_chunks 장 만큼입니다.
+    """
+
+    def __init__(self, image, width, height, chunk_width=256, repeat=True, alpha=True, max_chunks=8):
+        self.image = image
+        self.width = width
+        self.height = height
+        self.chunk_width = chunk_width
+        self.repeat = repeat
+        self.alpha = alpha
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()  # 조각 번호 -> Surface, 오래 안 쓴 순서
+        self.baked = 0  # 보고용: 지금까지 그린 조각 수
+
+    def chunk(self, index):
+        chunk = self.chunks.get(index)
+        if chunk is not None:
+            self.chunks.move_to_end(index)
+            return chunk
+        left = index * self.chunk_width
+        size = (min(self.chunk_width, self.width - left), self.height)
+        chunk = pygame.Surface(size, pygame.SRCALPHA) if self.alpha else pygame.Surface(size)
+        image_width = self.image.get_width()
+        if self.repeat:
+            first = left - left % image_width
+            for x in range(first, min(left + size[0], self.width), image_width):
+                chunk.blit(self.image, (x - left, 0))
+        else:
+            chunk.blit(self.image, (-left, 0))
+        self.chunks[index] = chunk
+        self.baked += 1
+        return chunk
+
+    def draw(self, surface, camera_x):
+        camera_x = int(camera_x)
+        first = max(0, camera_x // self.chunk_width)
+        last = min((self.width - 1) // self.chunk_width, (camera_x + surface.get_width() - 1) // self.chunk_width)
+        surface.blits([(self.chunk(index), (index * self.chunk_width - camera_x, 0)) for index in range(first, last + 1)], False)
+        # 이번에 보인 조각은 한도보다 많아도 버리지 않습니다. (보인 조각은 모두 뒤쪽에 있습니다)
+        keep = max(self.max_chunks, last - first + 1)
+        while len(self.chunks) > keep:
+            self.chunks.popitem(last=False)
@@ -0,0 +1,91 @@
+import pygame
+
+
+class FixedStepClock:
+    """
+    화면을 그리는 빈도와 상관없이 시뮬레이션을 항상 같은 간격(step 초)으로 돌리기 위한 시계입니다.
+    프레임마다 tick() 이 흐른 실제 시간을 쌓아 두고, 그 안에 들어가는 고정 간격 수만큼 update 를 돌리게 합니다.
+    남은 시간은 alpha (0 ~ 1) 로 남겨서, 그릴 때 지난 스텝과 이번 스텝 위치 사이를 보간하는 데 씁니다.
+    - max_fps: 그리는 빈도 상한 (0 이면 제한 없음)
+    - max_steps: 한 프레임에 돌릴 수 있는 최대 스텝 수. 넘치는 시간은 버립니다. (느려질수록 더 느려지는 것을 막습니다)
+    - skip_render_when_behind: max_steps 를 다 쓰고도 밀려 있으면 그리기를 건너뛰고 시뮬레이션을 먼저 따라잡습니다.
+      (연속으로 max_skipped_renders 번까지만)
+    """
+
+    def __init__(self, step_rate=120, max_fps=0, max_steps=8, skip_render_when_behind=False, max_skipped_renders=2):
+        self.step = 1 / step_rate
+        self.max_fps = max_fps
+        self.max_steps = max_steps
+        self.skip_render_when_behind = skip_render_when_behind
+        self.max_skipped_renders = max_skipped_renders
+        self.clock = pygame.time.Clock()
+
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.frame_time = 0.0
+        self.behind = False
+        self.skipped_in_a_row = 0
+        self.idled = False
+
+        # 보고용
+        self.steps_last_frame = 0
+        self.total_steps = 0
+        self.total_frames = 0
+        self.rendered_frames = 0
+        self.skipped_renders = 0
+        self.dropped_time = 0.0
+
+    def tick(self, frame_time=None):
+        """
+        지난 tick 뒤로 흐른 시간을 재고 (frame_time 을 주면 그 값을 쓰고), 이번 프레임에 돌릴 스텝 수를 돌려줍니다.
+        """
+        milliseconds = self.clock.tick(self.max_fps)
+        if frame_time is None:
+            frame_time = milliseconds / 1000.0
+        if self.idled:
+            # idle() 뒤에 일부러 쉰 시간은 시뮬레이션에도 버린 시간에도 넣지 않습니다.
+            frame_time = 0.0
+            self.idled = False
+        self.frame_time = frame_time
+        self.accumulator += frame_time
+
+        steps = 0
+        while self.accumulator >= self.step and steps < self.max_steps:
+            self.accumulator -= self.step
+            steps += 1
+        self.behind = self.accumulator >= self.step
+        if self.behind:
+            # 따라잡을 수 없는 시간은 버리고 한 스텝 미만만 남깁니다.
+            dropped = self.accumulator - self.accumulator % self.step
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+
+        self.alpha = self.accumulator / self.step
+        self.steps_last_frame = steps
+        self.total_steps += steps
+        self.total_frames += 1
+        return steps
+
+    def idle(self):
+        # 바뀐 것이 없어 다음 입력까지 쉬기 전에 부릅니다.
+        self.idled = True
+
+    def should_render(self):
+        if self.skip_render_when_behind and self.behind and self.skipped_in_a_row < self.max_skipped_renders:
+            self.skipped_in_a_row += 1
+            self.skipped_renders += 1
+            return False
+        self.skipped_in_a_row = 0
+        self.rendered_frames += 1
+        return True
+
+    def report(self):
+        average = self.total_steps / self.total_frames if self.total_frames else 0.0
+        return (
+            f"fps {self.clock.get_fps():.0f}  steps {self.steps_last_frame} (avg {average:.2f})  "
+            f"skipped {self.skipped_renders}  dropped {self.dropped_time:.2f}s"
+        )
+
+
+def lerp(previous, current, alpha):
+    return previous + (current - previous) * alpha
@@ -4,15 +4,29 @@ import json
 import os
 from enum import Enum, auto
 from dataclasses import dataclass
+from collections import OrderedDict
 import ctypes
+from spatial_hash import SpatialHash
+from fixed_step import FixedStepClock, lerp
+from assets import assets
+from atlas import TextureAtlas, ATLAS_INDEX
+from preloader import Preloader
+from chunked_layer import ChunkedLayer
+from presenter import Presenter
+from postprocess import PostProcess
 ctypes.windll.user32.SetProcessDPIAware()
 
 
 DEBUG = True
 
 MAX_FPS = 900
-MIN_FPS = 0.03
+PRESENT_MODE = "nearest"  # 논리 화면을 창에 확대하는 방식 (presenter.PRESENT_MODES, 게임 중 9 키로 바꿉니다)
+POST_EFFECTS = ("scanlines", "vignette")  # 화면에 겹칠 효과 (postprocess.PASS_TYPES), 게임 중 8 키로 켜고 끕니다.
+IDLE_WAIT_MS = 100  # 메뉴에서 바뀐 것이 없으면 다음 입력을 이만큼까지 기다리며 쉽니다.
+SIMULATION_RATE = 120  # 시뮬레이션은 그리는 빈도와 상관없이 1초에 이만큼 돕니다.
+MAX_STEPS_PER_FRAME = 4  # 느린 프레임에서 따라잡을 최대 스텝 수 (넘치는 시간은 버립니다)
 LOGICAL_WIDTH, LOGICAL_HEIGHT = 400, 300
+STAGE_WIDTH = LOGICAL_WIDTH * 2  # 스테이지 (카메라가 움직일 수 있는) 너비
 SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
 SAVE_FILE = "save_data.json"
 BACKGROUND_COLOR = (0, 0, 0)
@@ -71,6 +85,11 @@ class Button:
         self.text_color = text_color
         self.font = pygame.font.Font(None, text_size)
         self.state = Button.State.NORMAL
+        self.drawn = None  # 마지막으로 그린 (상태, 글자). 지금과 다르면 다시 그려야 합니다.
+
+    def is_dirty(self):
+        # hover / press / focus 로 상태가 바뀌었거나 글자가 바뀌어서 화면의 모습과 달라졌는지
+        return self.drawn != (self.state, self.text)
 
     def handle_event_and_check_clicked(self, event, mouse_position):
         if event.type == pygame.MOUSEMOTION:
@@ -113,6 +132,27 @@ class Button:
             text_rect = text_surface.get_rect(center=self.surface_rect.center)
             self.surface.blit(text_surface, text_rect)
         surface.blit(self.surface, self.rect)
+        self.drawn = (self.state, self.text)
+
+
+def draw_buttons(surface, background, buttons, full_redraw):
+    """
+    메뉴 장면의 그리기입니다. full_redraw 면 배경과 버튼을 모두 그리고 None (화면 전체) 을 돌려줍니다.
+    아니면 모습이 바뀐 버튼만 그 자리의 배경을 다시 깔고 그린 뒤, 그린 자리 (논리 좌표 Rect) 목록을 돌려줍니다.
+    아무것도 바뀌지 않았으면 빈 목록입니다.
+    """
+    if full_redraw:
+        surface.blit(background, (0, 0))
+        for button in buttons:
+            button.draw(surface)
+        return None
+    dirty_rects = []
+    for button in buttons:
+        if button.is_dirty():
+            surface.blit(background, button.rect, button.rect)
+            button.draw(surface)
+            dirty_rects.append(button.rect)
+    return dirty_rects
 
 
 class Camera:
@@ -121,6 +161,8 @@ class Camera:
         self.height = height
         self.x = 0
         self.y = 0
+        self.previous_x = 0  # 지난 스텝의 위치 (그릴 때 보간)
+        self.previous_y = 0
 
         # 흔들림 관련 속성
         self.offset_x = 0
@@ -135,6 +177,7 @@ class Camera:
         self.shake_direction = 1  # +1 또는 -1
 
     def update(self, target_rect, map_width, map_height, delta_time):
+        self.previous_x, self.previous_y = self.x, self.y
         if self.shake_duration > 0:
             self.shake_duration -= delta_time
             self.accumulated_time += delta_time
@@ -165,6 +208,9 @@ class Camera:
         self.x = max(0, min(self.x, map_width - self.width))
         self.y = max(0, min(self.y, map_height - self.height))
 
+    def interpolated_position(self, alpha):
+        return round(lerp(self.previous_x, self.x, alpha)), round(lerp(self.previous_y, self.y, alpha))
+
     def shake(self, magnitude, duration, axis='x', frequency=0.05):
         """
         magnitude: 흔들림 강도
@@ -184,15 +230,34 @@ class Camera:
 
 
 class Animation:
-    def __init__(self, sprite_sheet_path, num_frames, frame_length, loop=True):
-        self.sprite_sheet = pygame.image.load(sprite_sheet_path).convert_alpha()
-        self.num_frames = num_frames
-        self.frame_length = frame_length
+    def __init__(self, sprite_sheet_path, num_frames=None, frame_length=None, loop=True, scale=1):
+        """
+        assets.atlas (TextureAtlas) 에 이 시트가 있으면 아틀라스 페이지에서 프레임을 꺼내 쓰고, 없으면 시트 PNG 를 읽습니다.
+        아틀라스에서 꺼낼 때 num_frames, frame_length 를 주지 않으면 atlas.json 의 값 (프레임 수, 프레임마다의 시간) 을 씁니다.
+        """
+        self.sprite_sheet_path = sprite_sheet_path
         self.loop = loop
-
-        self.frame_width = self.sprite_sheet.get_width() // num_frames
-        self.frame_height = self.sprite_sheet.get_height()
-        self.frames = self.load_frames()
+        self.scale = scale
+        self.atlas = assets.atlas if assets.atlas is not None and sprite_sheet_path in assets.atlas and scale == 1 else None
+
+        if self.atlas is not None:
+            self.sprite_sheet = None
+            self.frame_width, self.frame_height = self.atlas.frame_size(sprite_sheet_path)
+            self.frames, self.offsets = self.atlas.get_frames(sprite_sheet_path)
+            self.num_frames = num_frames or len(self.frames)
+            durations = self.atlas.durations(sprite_sheet_path)
+            self.frame_lengths = durations if frame_length is None else [frame_length] * self.num_frames
+        else:
+            self.sprite_sheet = assets.acquire(sprite_sheet_path)  # 같은 시트는 한 번만 읽습니다. 다 쓰면 release()
+            self.num_frames = num_frames
+            self.frame_width = self.sprite_sheet.get_width() // num_frames * scale
+            self.frame_height = self.sprite_sheet.get_height() * scale
+            self.frames = self.load_frames()
+            self.offsets = None  # 시트에서 자른 프레임은 칸 크기 그대로라 옮겨 그릴 필요가 없습니다.
+            self.frame_lengths = [frame_length] * num_frames
+        self.frame_length = self.frame_lengths[0]
+        self.flipped_frames = None  # 왼쪽을 보는 프레임은 처음 뒤집어 그릴 때 만듭니다.
+        self.flipped_offsets = None
 
         self.current_frame = 0
         self.accumulated_time = 0
@@ -200,13 +265,13 @@ class Animation:
 
         self.rect = pygame.rect.Rect(0, 0, self.frame_width, self.frame_height)
 
-    def load_frames(self):
-        frames = []
-        for i in range(self.num_frames):
-            frame_rect = pygame.Rect(i * self.frame_width, 0, self.frame_width, self.frame_height)
-            frame = self.sprite_sheet.subsurface(frame_rect)
-            frames.append(frame)
-        return frames
+    def load_frames(self, flip=False):
+        # 같은 시트, 같은 방향, 같은 배율의 프레임은 모든 Animation 이 assets 의 리스트를 함께 씁니다.
+        return assets.get_frames(self.sprite_sheet_path, self.num_frames, flip, self.scale)
+
+    def release(self):
+        if self.atlas is None:  # 아틀라스 페이지는 TextureAtlas 가 들고 있습니다.
+            assets.release(self.sprite_sheet_path)
 
     def update(self, delta_time):
         if self.finished:
@@ -214,8 +279,9 @@ class Animation:
 
         self.accumulated_time += delta_time
 
-        if self.accumulated_time >= self.frame_length:
-            self.accumulated_time -= self.frame_length
+        frame_length = self.frame_lengths[self.current_frame]
+        if self.accumulated_time >= frame_length:
+            self.accumulated_time -= frame_length
             self.current_frame += 1
 
             if self.current_frame == self.num_frames:
@@ -226,10 +292,22 @@ class Animation:
                     self.current_frame = self.num_frames - 1
 
     def draw(self, surface, rect, flip):
-        current_frame_image = self.frames[self.current_frame]
-        current_frame_image = pygame.transform.flip(current_frame_image, flip, False)
+        if flip:
+            if self.flipped_frames is None:
+                if self.atlas is not None:
+                    self.flipped_frames, self.flipped_offsets = self.atlas.get_frames(self.sprite_sheet_path, flip=True)
+                else:
+                    self.flipped_frames = self.load_frames(flip=True)
+            frames, offsets = self.flipped_frames, self.flipped_offsets
+        else:
+            frames, offsets = self.frames, self.offsets
         self.rect.midbottom = rect.midbottom
-        surface.blit(current_frame_image, self.rect)
+        if offsets is None:
+            surface.blit(frames[self.current_frame], self.rect)
+        else:
+            # 아틀라스 프레임은 투명한 가장자리를 잘라냈으므로 원래 칸 안의 자리만큼 옮겨 그립니다.
+            offset_x, offset_y = offsets[self.current_frame]
+            surface.blit(frames[self.current_frame], (self.rect.x + offset_x, self.rect.y + offset_y))
 
     def reset(self):
         self.current_frame = 0
@@ -266,6 +344,8 @@ class Player:
     def __init__(self, x, y, controls):
         self.x = x
         self.y = y
+        self.previous_x = x  # 지난 스텝의 위치 (그릴 때 보간)
+        self.previous_y = y
         self.rect = pygame.Rect(x, y, 24, 50)
 
         self.controls = controls
@@ -339,7 +419,13 @@ class Player:
         self.dash_cooldown_time = 0.5
         self.dash_cooldown_timer = 0
 
-        self.enemies = []
+        self.enemy_grid = SpatialHash()  # 공격 범위와 겹치는 적을 찾을 때 씁니다. (PlayScene 이 매 프레임 다시 등록)
+
+    def release_assets(self):
+        for animation in (self.idle_animation, self.run_animation, self.dash_animation, self.hurt_animation, self.death_animation):
+            animation.release()
+        for attack_data in self.attack_datas:
+            attack_data.animation.release()
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -364,7 +450,8 @@ class Player:
                 if "dash" in self.pressed_actions:
                     self.pressed_actions.remove("dash")
 
-    def update(self, enemies, delta_time):
+    def update(self, enemy_grid, delta_time):
+        self.previous_x, self.previous_y = self.x, self.y
         match self.state:
             case Player.State.DEAD:
                 if self.death_animation.finished:
@@ -376,7 +463,7 @@ class Player:
                 self.hurt(delta_time)
 
             case Player.State.ATTACK:
-                self.enemies = enemies
+                self.enemy_grid = enemy_grid
                 self.attack(self.current_attack, delta_time)
 
             case Player.State.DASH:
@@ -419,22 +506,30 @@ class Player:
         self.rect.topleft = (self.x, self.y)
         self.health_bar.midtop = self.rect.midbottom
 
-    def draw(self, surface):
+    def interpolated_rect(self, alpha):
+        rect = self.rect.copy()
+        rect.topleft = (lerp(self.previous_x, self.x, alpha), lerp(self.previous_y, self.y, alpha))
+        return rect
+
+    def draw(self, surface, alpha=1.0, camera_x=0):
+        # 그릴 때는 지난 스텝과 이번 스텝 위치 사이를 보간한 위치에, 카메라만큼 옮겨 그립니다. (판정은 self.rect 그대로)
+        rect = self.interpolated_rect(alpha).move(-camera_x, 0)
+        health_bar = self.health_bar.move(rect.x - self.rect.x, rect.y - self.rect.y)
         if DEBUG:
             if self.facing_direction == 1:
-                self.current_attack.rect.x = self.rect.centerx
+                self.current_attack.rect.x = rect.centerx
             else:
-                self.current_attack.rect.x = self.rect.centerx - self.current_attack.rect.width
-            self.current_attack.rect.y = self.rect.y
+                self.current_attack.rect.x = rect.centerx - self.current_attack.rect.width
+            self.current_attack.rect.y = rect.y
             pygame.draw.rect(surface, "white", self.current_attack.rect, 1)
 
-            pygame.draw.rect(surface, "white", self.rect, 1)
+            pygame.draw.rect(surface, "white", rect, 1)
 
-        self.current_animation.draw(surface, self.rect, True if self.facing_direction == -1 else False)
+        self.current_animation.draw(surface, rect, True if self.facing_direction == -1 else False)
 
         health_ratio = self.current_health / self.max_health
-        pygame.draw.rect(surface, "black", self.health_bar)
-        pygame.draw.rect(surface, "green", (*self.health_bar.topleft, self.health_bar.w * health_ratio, self.health_bar.h))
+        pygame.draw.rect(surface, "black", health_bar)
+        pygame.draw.rect(surface, "green", (*health_bar.topleft, health_bar.w * health_ratio, health_bar.h))
 
     def dash(self, delta_time):
         self.x += self.facing_direction * self.dash_speed * delta_time
@@ -451,9 +546,8 @@ class Player:
             else:
                 self.current_attack.rect.x = self.rect.centerx - self.current_attack.rect.width
             self.current_attack.rect.y = self.rect.y
-            for enemy in self.enemies:
-                if self.current_attack.rect.colliderect(enemy.rect):
-                    enemy.take_damage(current_attack.damage, self.facing_direction, current_attack.knuck_back_distance, current_attack.knock_back_time)
+            for enemy in self.enemy_grid.query(self.current_attack.rect):
+                enemy.take_damage(current_attack.damage, self.facing_direction, current_attack.knuck_back_distance, current_attack.knock_back_time)
 
         if self.current_animation.current_frame == current_attack.dash_frame:
             self.x += self.pressed_directions[-1] * self.current_attack.dash_speed * delta_time
@@ -505,6 +599,8 @@ class Enemy:
         self.rect = pygame.Rect(x, y, 24, 50)
         self.x = x
         self.y = y
+        self.previous_x = x  # 지난 스텝의 위치 (그릴 때 보간)
+        self.previous_y = y
         self.speed = 60
         self.attack_dash_speed = 300
         self.facing_direction = 1
@@ -545,7 +641,14 @@ class Enemy:
 
         self.player = None
 
+    def release_assets(self):
+        for animation in (self.idle_animation, self.run_animation, self.hurt_animation):
+            animation.release()
+        for attack_data in self.attack_datas:
+            attack_data.animation.release()
+
     def update(self, player, delta_time):
+        self.previous_x, self.previous_y = self.x, self.y
         self.player = player
         match self.state:
             case Enemy.State.DEAD:
@@ -579,28 +682,36 @@ class Enemy:
         self.rect.topleft = (self.x, self.y)
         self.health_bar.midtop = self.rect.midbottom
 
-    def draw(self, surface):
+    def interpolated_rect(self, alpha):
+        rect = self.rect.copy()
+        rect.topleft = (lerp(self.previous_x, self.x, alpha), lerp(self.previous_y, self.y, alpha))
+        return rect
+
+    def draw(self, surface, alpha=1.0, camera_x=0):
+        # 그릴 때는 지난 스텝과 이번 스텝 위치 사이를 보간한 위치에, 카메라만큼 옮겨 그립니다. (판정은 self.rect 그대로)
+        rect = self.interpolated_rect(alpha).move(-camera_x, 0)
+        health_bar = self.health_bar.move(rect.x - self.rect.x, rect.y - self.rect.y)
         if DEBUG:
-            rect_chase = pygame.Rect(self.rect.centerx - self.chase_range, self.rect.centery, self.chase_range * 2, 1)
+            rect_chase = pygame.Rect(rect.centerx - self.chase_range, rect.centery, self.chase_range * 2, 1)
             pygame.draw.rect(surface, "red", rect_chase, 1)
 
-            rect_attack_range = pygame.Rect(self.rect.centerx - self.attack_range, self.rect.centery, self.attack_range * 2, 20)
+            rect_attack_range = pygame.Rect(rect.centerx - self.attack_range, rect.centery, self.attack_range * 2, 20)
             pygame.draw.rect(surface, "red", rect_attack_range, 1)
 
             if self.facing_direction == 1:
-                self.current_attack.rect.x = self.rect.centerx
+                self.current_attack.rect.x = rect.centerx
             else:
-                self.current_attack.rect.x = self.rect.centerx - self.current_attack.rect.width
-            self.current_attack.rect.y = self.rect.y
+                self.current_attack.rect.x = rect.centerx - self.current_attack.rect.width
+            self.current_attack.rect.y = rect.y
 
             pygame.draw.rect(surface, "red", self.current_attack.rect, 1)
 
-            pygame.draw.rect(surface, "red", self.rect, 1)
+            pygame.draw.rect(surface, "red", rect, 1)
 
-        self.current_animation.draw(surface, self.rect, True if self.facing_direction == -1 else False)
+        self.current_animation.draw(surface, rect, True if self.facing_direction == -1 else False)
         health_ratio = self.current_health / self.max_health
-        pygame.draw.rect(surface, "black", self.health_bar)
-        pygame.draw.rect(surface, "green", (*self.health_bar.topleft, self.health_bar.w * health_ratio, self.health_bar.h))
+        pygame.draw.rect(surface, "black", health_bar)
+        pygame.draw.rect(surface, "green", (*health_bar.topleft, health_bar.w * health_ratio, health_bar.h))
 
     def attack(self, current_attack: AttackData, delta_time):
         if self.current_animation.current_frame == current_attack.active_frame and not self.is_attack_frame_active:
@@ -665,7 +776,7 @@ class MainScene:
             ),
         ]
         self.background = pygame.image.load("main_scene_bg.png").convert()
-        self.layer = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+        self.full_redraw = True  # 처음 그릴 때만 배경까지 모두 그립니다.
 
     def handle_event(self, event, mouse_position):
         for button in self.buttons:
@@ -683,11 +794,27 @@ class MainScene:
     def update(self, delta_time):
         pass
 
-    def draw(self, logical_surface):
-        self.layer.blit(self.background, (0, 0))
-        for button in self.buttons:
-            button.draw(self.layer)
-        logical_surface.blit(self.layer, (0, 0))
+    def draw(self, logical_surface, alpha=1.0):
+        # 바뀐 자리 목록을 돌려줍니다. (None 은 화면 전체) 메인 루프는 그 자리만 화면에 내보냅니다.
+        dirty_rects = draw_buttons(logical_surface, self.background, self.buttons, self.full_redraw)
+        self.full_redraw = False
+        return dirty_rects
+
+
+STAGE_LAYER_PATHS = ("assets/background/background.png", "assets/background/midground.png", "assets/background/foreground.png")
+STAGE_CACHE_SIZE = 2  # 최근에 한 스테이지 몇 개의 에셋을 들고 있을지
+# Player / Enemy 의 Animation 이 읽는 시트 (LoadingScene 이 미리 읽어 둡니다)
+PLAYER_SHEET_PATHS = (
+    "assets/player/idle.png",
+    "assets/player/Fire_Warrior_FireSwordRun.png",
+    "assets/player/Fire_Warrior_FireSwordDash.png",
+    "assets/player/Fire_Warrior_FireSwordHit.png",
+    "assets/player/Fire_Warrior_FireSwordDeath.png",
+    "assets/player/attack1.png",
+    "assets/player/attack2.png",
+    "assets/player/attack3.png",
+)
+ENEMY_SHEET_PATHS = ("assets/enemy/idle.png", "assets/enemy/run.png", "assets/enemy/hurt.png", "assets/enemy/attack.png")
 
 
 @dataclass
@@ -697,6 +824,125 @@ class PlaySceneData:
     foreground: pygame.Surface
     player: Player
     enemies: list[Enemy]
+    layer_paths: tuple = ()
+
+    @classmethod
+    def load(cls, layer_paths, player, enemies):
+        # 배경 세 장은 assets 에서 받으므로 여러 스테이지가 같은 Surface 를 함께 씁니다.
+        background, midground, foreground = (assets.acquire(path) for path in layer_paths)
+        return cls(background, midground, foreground, player, enemies, layer_paths)
+
+    def release(self):
+        for path in self.layer_paths:
+            assets.release(path)
+        self.player.release_assets()
+        for enemy in self.enemies:
+            enemy.release_assets()
+
+
+@dataclass(frozen=True)
+class StageDescription:
+    """
+    스테이지를 만드는 데 필요한 값만 적어 둔 설명입니다. 버튼을 누를 때 build() 로 PlaySceneData 를 만듭니다.
+    """
+    layer_paths: tuple
+    enemy_positions: tuple  # 적을 세울 x 위치
+    player_position: tuple = (100, FLOOR_Y)
+
+    def asset_paths(self):
+        # 이 스테이지가 assets 에서 받을 이미지 (아틀라스에 든 시트는 빼고)
+        paths = self.layer_paths + PLAYER_SHEET_PATHS + (ENEMY_SHEET_PATHS if self.enemy_positions else ())
+        atlas = assets.atlas
+        return tuple(path for path in paths if atlas is None or path not in atlas)
+
+    def build(self, controls):
+        return PlaySceneData.load(
+            self.layer_paths,
+            player=Player(*self.player_position, controls),
+            enemies=[Enemy(x, FLOOR_Y) for x in self.enemy_positions],
+        )
+
+
+STAGES = (
+    StageDescription(STAGE_LAYER_PATHS, enemy_positions=(200,)),
+    StageDescription(STAGE_LAYER_PATHS, enemy_positions=(400,)),
+    StageDescription(STAGE_LAYER_PATHS, enemy_positions=(400, 200)),
+    StageDescription(STAGE_LAYER_PATHS, enemy_positions=(0,)),
+)
+
+
+class StageCache:
+    """
+    최근에 한 스테이지 capacity 개의 에셋을 참조 수 하나씩 더 들고 있어서, 다시 들어갈 때 디스크를 읽지 않게 합니다.
+    넘치면 가장 오래전에 한 스테이지부터 돌려주므로 스테이지가 몇 개든 들고 있는 메모리는 capacity 개 만큼입니다.
+    (Player / Enemy 는 플레이하면서 바뀌므로 들고 있지 않고, 들어갈 때마다 새로 만듭니다)
+    """
+
+    def __init__(self, capacity=STAGE_CACHE_SIZE):
+        self.capacity = capacity
+        self.stages = OrderedDict()  # StageDescription -> 받아 둔 경로
+
+    def retain(self, stage):
+        if stage in self.stages:
+            self.stages.move_to_end(stage)
+            return
+        paths = stage.asset_paths()
+        for path in paths:
+            assets.acquire(path)
+        self.stages[stage] = paths
+        while len(self.stages) > self.capacity:
+            self.unload(next(iter(self.stages)))
+
+    def unload(self, stage):
+        for path in self.stages.pop(stage, ()):
+            assets.release(path)
+
+    def clear(self):
+        for stage in list(self.stages):
+            self.unload(stage)
+
+
+# 장면이 바뀌어도 남아 있어야 하므로 MapScene 이 아니라 여기에 둡니다.
+stage_cache = StageCache()
+
+
+class LoadingScene:
+    """
+    paths 의 이미지를 Preloader 로 읽는 동안 진행 막대를 그리고, 다 읽으면 build() 가 만든 장면으로 넘어갑니다.
+    Back 을 누르면 읽기를 멈추고 (읽어 둔 이미지는 버리고) back() 이 만든 장면으로 돌아갑니다.
+    convert_alpha 는 고정 스텝마다가 아니라 그리는 프레임마다 한 번 (draw) 하므로 convert_budget 이 프레임당 한도입니다.
+    """
+
+    def __init__(self, paths, build, back):
+        self.preloader = Preloader(paths)
+        self.build = build
+        self.back = back
+        self.font = pygame.font.Font(None, 32)
+        self.bar_rect = pygame.Rect(50, LOGICAL_HEIGHT // 2, LOGICAL_WIDTH - 100, 20)
+        self.back_button = Button(pygame.Rect(10, 10, 100, 50), pygame.Color(200, 200, 0, 0), text="Back")
+
+    def handle_event(self, event, mouse_position):
+        if self.back_button.handle_event_and_check_clicked(event, mouse_position):
+            self.preloader.cancel()
+            return self.back()
+        return None
+
+    def update(self, delta_time):
+        if self.preloader.finished:
+            return self.build()
+        return None
+
+    def draw(self, logical_surface, alpha=1.0):
+        self.preloader.update()
+        logical_surface.fill((0, 0, 0))
+        text = self.font.render("Loading...", True, (255, 255, 255))
+        logical_surface.blit(text, text.get_rect(midbottom=(LOGICAL_WIDTH // 2, self.bar_rect.top - 10)))
+        pygame.draw.rect(logical_surface, (80, 80, 80), self.bar_rect)
+        filled = self.bar_rect.copy()
+        filled.width = int(self.bar_rect.width * self.preloader.progress)
+        pygame.draw.rect(logical_surface, (255, 255, 255), filled)
+        pygame.draw.rect(logical_surface, (255, 255, 255), self.bar_rect, 1)
+        self.back_button.draw(logical_surface)
 
 
 class MapScene:
@@ -704,38 +950,8 @@ class MapScene:
 
         self.game_data = game_data
 
-        stage1_data = PlaySceneData(
-            background=pygame.image.load("assets/background/background.png").convert_alpha(),
-            midground=pygame.image.load("assets/background/midground.png").convert_alpha(),
-            foreground=pygame.image.load("assets/background/foreground.png").convert_alpha(),
-            player=Player(100, FLOOR_Y, self.game_data["controls"]),
-            enemies=[Enemy(200, FLOOR_Y)],
-        )
-        stage2_data = PlaySceneData(
-            background=pygame.image.load("assets/background/background.png").convert_alpha(),
-            midground=pygame.image.load("assets/background/midground.png").convert_alpha(),
-            foreground=pygame.image.load("assets/background/foreground.png").convert_alpha(),
-            player=Player(100, FLOOR_Y, self.game_data["controls"]),
-            enemies=[Enemy(400, FLOOR_Y)],
-        )
-        stage3_data = PlaySceneData(
-            background=pygame.image.load("assets/background/background.png").convert_alpha(),
-            midground=pygame.image.load("assets/background/midground.png").convert_alpha(),
-            foreground=pygame.image.load("assets/background/foreground.png").convert_alpha(),
-            player=Player(100, FLOOR_Y, self.game_data["controls"]),
-            enemies=[Enemy(400, FLOOR_Y),Enemy(200, FLOOR_Y)],
-        )
-        stage4_data = PlaySceneData(
-            background=pygame.image.load("assets/background/background.png").convert_alpha(),
-            midground=pygame.image.load("assets/background/midground.png").convert_alpha(),
-            foreground=pygame.image.load("assets/background/foreground.png").convert_alpha(),
-            player=Player(100, FLOOR_Y, self.game_data["controls"]),
-            enemies=[Enemy(0, FLOOR_Y)],
-        )
-
-        self.stage_datas = (stage1_data, stage2_data, stage3_data, stage4_data)
-
-        self.background = pygame.image.load("assets/background/map.png").convert_alpha()
+        self.background = assets.acquire("assets/background/map.png")
+        self.full_redraw = True
 
         self.back_button = Button(pygame.Rect(10, 10, 100, 50), pygame.Color(200, 200, 0, 0), text="Back")
 
@@ -765,41 +981,53 @@ class MapScene:
     def handle_event(self, event, mouse_position):
         for i, button in enumerate(self.stage_buttons):
             if button.handle_event_and_check_clicked(event, mouse_position):
-                return PlayScene(self.game_data, self.stage_datas[i])
+                # 고른 스테이지의 이미지만 뒤에서 읽어 두고, 다 읽으면 그때 스테이지를 만듭니다.
+                # (최근에 한 스테이지는 stage_cache 가 이미지를 들고 있어서 바로 넘어갑니다)
+                self.release()
+                stage = STAGES[i]
+                return LoadingScene(stage.asset_paths(), lambda: self.enter_stage(stage), lambda: MapScene(self.game_data))
 
         if self.back_button.handle_event_and_check_clicked(event, mouse_position):
+            self.release()
+            stage_cache.clear()  # 스테이지 고르기를 떠나면 들고 있던 스테이지 에셋도 모두 돌려줍니다.
             return MainScene(self.game_data)
 
+    def enter_stage(self, stage):
+        # 버튼을 누른 스테이지 하나만 만듭니다. (PlaySceneData 의 에셋은 PlayScene 이 나갈 때 돌려줍니다)
+        stage_cache.retain(stage)
+        return PlayScene(self.game_data, stage.build(self.game_data["controls"]))
+
+    def release(self):
+        assets.release("assets/background/map.png")
+
     def update(self, delta_time):
         pass
 
-    def draw(self, logical_surface):
-        logical_surface.blit(self.background, (0, 0))
-
-        for button in self.stage_buttons:
-            button.draw(logical_surface)
-        self.back_button.draw(logical_surface)
+    def draw(self, logical_surface, alpha=1.0):
+        dirty_rects = draw_buttons(logical_surface, self.background, self.stage_buttons + (self.back_button,), self.full_redraw)
+        self.full_redraw = False
+        return dirty_rects
 
 
 class PlayScene:
     def __init__(self, game_data, play_scene_data: PlaySceneData):
         self.game_data = game_data
         self.camera = Camera(LOGICAL_WIDTH, LOGICAL_HEIGHT)
-        self.background_layer = pygame.Surface((LOGICAL_WIDTH * 2, LOGICAL_HEIGHT))
-        self.midground_layer = pygame.Surface((LOGICAL_WIDTH * 2, LOGICAL_HEIGHT), pygame.SRCALPHA)
-        self.foreground_layer = pygame.Surface((LOGICAL_WIDTH * 2, LOGICAL_HEIGHT), pygame.SRCALPHA)
+        self.entity_layer = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT), pygame.SRCALPHA)  # 전경 + 캐릭터 (화면 좌표)
         self.canvas_layer = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT), pygame.SRCALPHA)
         self.back_button = Button(pygame.Rect(10, 10, 100, 50), pygame.Color(200, 200, 0, 0), text="Back")
+        self.play_scene_data = play_scene_data
         self.player = play_scene_data.player
         self.enemies = play_scene_data.enemies
+        self.enemy_grid = SpatialHash()  # 적들의 rect 를 매 프레임 등록해 두고 공격 판정에서 주변 적만 찾습니다.
         self.background = play_scene_data.background
         self.background1 = play_scene_data.midground
         self.background2 = play_scene_data.foreground
 
-        for x in range(0, LOGICAL_WIDTH * 2, self.background.get_width()):
-            self.background_layer.blit(self.background, (x, 0))
-        for x in range(0, LOGICAL_WIDTH * 2, self.background1.get_width()):
-            self.midground_layer.blit(self.background1, (x, 0))
+        # 배경 층은 통째로 미리 그리지 않고 카메라에 보이는 조각만 (처음 보일 때) 그립니다.
+        self.background_layer = ChunkedLayer(self.background, STAGE_WIDTH, LOGICAL_HEIGHT, alpha=False)
+        self.midground_layer = ChunkedLayer(self.background1, STAGE_WIDTH, LOGICAL_HEIGHT)
+        self.foreground_layer = ChunkedLayer(self.background2, STAGE_WIDTH, LOGICAL_HEIGHT, repeat=False)
 
     def handle_event(self, event, mouse_position):
         if event.type == pygame.KEYDOWN:
@@ -807,31 +1035,37 @@ class PlayScene:
                 self.camera.shake(3, 0.1)
 
         if self.back_button.handle_event_and_check_clicked(event, mouse_position):
-            return MapScene(self.game_data)
+            # 새 화면이 에셋을 먼저 받은 뒤에 돌려줘야 함께 쓰는 시트를 다시 읽지 않습니다.
+            next_scene = MapScene(self.game_data)
+            self.play_scene_data.release()
+            return next_scene
         self.player.handle_event(event)
         return None
 
     def update(self, delta_time):
-        self.player.update(self.enemies, delta_time)
+        self.enemy_grid.rebuild(self.enemies)
+        self.player.update(self.enemy_grid, delta_time)
         for enemy in self.enemies:
             enemy.update(self.player, delta_time)
             if enemy.state == Enemy.State.DEAD:
                 self.enemies.remove(enemy)
-        self.camera.update(self.player.rect, LOGICAL_WIDTH * 2, LOGICAL_HEIGHT, delta_time)
+                enemy.release_assets()
+        self.camera.update(self.player.rect, STAGE_WIDTH, LOGICAL_HEIGHT, delta_time)
 
-    def draw(self, logical_surface):
-        self.foreground_layer.fill((0, 0, 0, 0))
+    def draw(self, logical_surface, alpha=1.0):
+        camera_x, _ = self.camera.interpolated_position(alpha)
+        self.entity_layer.fill((0, 0, 0, 0))
         self.canvas_layer.fill((0, 0, 0, 0))
 
-        self.foreground_layer.blit(self.background2, (0, 0))
+        self.foreground_layer.draw(self.entity_layer, camera_x)
         for enemy in self.enemies:
-            enemy.draw(self.foreground_layer)
-        self.player.draw(self.foreground_layer)
+            enemy.draw(self.entity_layer, alpha, camera_x)
+        self.player.draw(self.entity_layer, alpha, camera_x)
         self.back_button.draw(self.canvas_layer)
 
-        logical_surface.blit(self.background_layer, (-self.camera.x, 0))
-        logical_surface.blit(self.midground_layer, (-self.camera.x, 0))
-        logical_surface.blit(self.foreground_layer, (-self.camera.x, 0))
+        self.background_layer.draw(logical_surface, camera_x)
+        self.midground_layer.draw(logical_surface, camera_x)
+        logical_surface.blit(self.entity_layer, (0, 0))
         logical_surface.blit(self.canvas_layer, (0, 0))
 
 
@@ -841,6 +1075,7 @@ class SettingsScene:
         self.controls = self.game_data["controls"]
         self.back_button = Button(pygame.Rect(10, 10, 100, 50), pygame.Color(200, 200, 0, 0), text="Back")
         self.background = pygame.image.load("settings_scene_bg.png").convert()
+        self.full_redraw = True
         self.selected_action = None
         self.action_buttons = {
             "move_left": Button(
@@ -884,53 +1119,43 @@ class SettingsScene:
     def update(self, delta_time):
         pass
 
-    def draw(self, logical_surface):
-        logical_surface.blit(self.background, (0, 0))
-        for button in self.action_buttons.values():
-            button.draw(logical_surface)
-        self.back_button.draw(logical_surface)
+    def draw(self, logical_surface, alpha=1.0):
+        buttons = list(self.action_buttons.values()) + [self.back_button]
+        dirty_rects = draw_buttons(logical_surface, self.background, buttons, self.full_redraw)
+        self.full_redraw = False
+        return dirty_rects
 
 
 if __name__ == "__main__":
 
-    def calculate_scale_and_letterbox(logical_width, logical_height, screen_width, screen_height):
-        logical_aspect = logical_width / logical_height
-        screen_aspect = screen_width / screen_height
-        if logical_aspect > screen_aspect:
-            scale = screen_width / logical_width
-            scaled_height = logical_height * scale
-            offset_x = 0
-            offset_y = (screen_height - scaled_height) // 2
-        else:
-            scale = screen_height / logical_height
-            scaled_width = logical_width * scale
-            offset_x = (screen_width - scaled_width) // 2
-            offset_y = 0
-        return scale, (offset_x, offset_y)
-
-    def blur_surface(surface, scale_factor=4):
-        small_size = (surface.get_width() // scale_factor, surface.get_height() // scale_factor)
-        small_surface = pygame.transform.smoothscale(surface, small_size)
-        return pygame.transform.smoothscale(small_surface, surface.get_size())
-    
-    def draw_scanlines(surface):
-        for y in range(0, surface.get_height(), 2):
-            pygame.draw.line(surface, (0, 0, 0, 50), (0, y), (surface.get_width(), y))
-        for x in range(0, surface.get_width(), 2):
-            pygame.draw.line(surface, (0, 0, 0, 50), (x, 0), (x, surface.get_height()))
+    def wait_for_input(timeout):
+        # 입력이 올 때까지 (최대 timeout ms) 쉽니다. 받은 이벤트는 다음 프레임이 처리하도록 되돌려 놓습니다.
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
 
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
     pygame.display.set_caption("You must know this: Holding down a key will execute it continuously. You do not need to press the key repeatedly.")
     logical_surface = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+    if os.path.exists(ATLAS_INDEX):  # python atlas.py 로 만든 아틀라스가 있으면 시트 PNG 대신 씁니다.
+        assets.atlas = TextureAtlas(ATLAS_INDEX)
     game_data = load_game()
     current_scene = MainScene(game_data)
     save_game(game_data)
-    scale, offset = calculate_scale_and_letterbox(LOGICAL_WIDTH, LOGICAL_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT)
-    clock = pygame.time.Clock()
+    post_process = PostProcess.from_names(POST_EFFECTS, enabled=False)
+    presenter = Presenter(
+        (LOGICAL_WIDTH, LOGICAL_HEIGHT), (SCREEN_WIDTH, SCREEN_HEIGHT), PRESENT_MODE,
+        background_color=BACKGROUND_COLOR, post_process=post_process,
+    )
+    # 업데이트는 고정 간격(1 / SIMULATION_RATE 초)으로 필요한 만큼 돌리고, 그리기는 프레임마다 한 번 보간해서 그립니다.
+    clock = FixedStepClock(SIMULATION_RATE, max_fps=MAX_FPS, max_steps=MAX_STEPS_PER_FRAME)
+    debug_font = pygame.font.Font(None, 20)
+    debug_rect = None  # 지난 프레임에 디버그 글자를 그린 창 Rect (글자가 짧아지면 남는 자리를 지웁니다)
+    full_present = True  # 창 크기가 바뀌면 장면이 바뀐 자리만 알려 줘도 화면 전체를 다시 내보냅니다.
 
     while True:
-        delta_time = min(clock.tick(MAX_FPS) / 1000.0, MIN_FPS)
+        steps = clock.tick()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 save_game(game_data)
@@ -938,11 +1163,10 @@ if __name__ == "__main__":
                 sys.exit()
             elif event.type == pygame.VIDEORESIZE:
                 SCREEN_WIDTH, SCREEN_HEIGHT = event.w, event.h
-                scale, offset = calculate_scale_and_letterbox(LOGICAL_WIDTH, LOGICAL_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT)
+                presenter.resize((SCREEN_WIDTH, SCREEN_HEIGHT))
+                full_present = True
             elif event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
-                mouse_x = (event.pos[0] - offset[0]) / scale
-                mouse_y = (event.pos[1] - offset[1]) / scale
-                next_scene = current_scene.handle_event(event, (mouse_x, mouse_y))
+                next_scene = current_scene.handle_event(event, presenter.to_logical(event.pos))
                 if next_scene:
                     current_scene = next_scene
             elif event.type in (pygame.KEYDOWN, pygame.KEYUP):
@@ -950,19 +1174,50 @@ if __name__ == "__main__":
                     if event.key == pygame.K_0:
                         screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
                         SCREEN_WIDTH, SCREEN_HEIGHT = screen.get_width(), screen.get_height()
-                        scale, offset = calculate_scale_and_letterbox(LOGICAL_WIDTH, LOGICAL_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT)
+                        presenter.resize((SCREEN_WIDTH, SCREEN_HEIGHT))
+                        full_present = True
                     elif event.key == pygame.K_ESCAPE:
                         screen = pygame.display.set_mode((LOGICAL_WIDTH, LOGICAL_HEIGHT), pygame.RESIZABLE)
                         SCREEN_WIDTH, SCREEN_HEIGHT = screen.get_width(), screen.get_height()
-                        scale, offset = calculate_scale_and_letterbox(LOGICAL_WIDTH, LOGICAL_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT)
+                        presenter.resize((SCREEN_WIDTH, SCREEN_HEIGHT))
+                        full_present = True
+                    elif event.key == pygame.K_9:
+                        presenter.next_mode()
+                        full_present = True
+                    elif event.key == pygame.K_8:
+                        post_process.enabled = not post_process.enabled
+                        full_present = True
                 next_scene = current_scene.handle_event(event, (-100, -100))
                 if next_scene:
                     current_scene = next_scene
 
-        current_scene.update(delta_time)
-        current_scene.draw(logical_surface)
-        screen.fill(BACKGROUND_COLOR)
-        blured_surface = blur_surface(logical_surface, scale_factor=1)
-        scaled_surface = pygame.transform.scale(blured_surface, (LOGICAL_WIDTH * scale, LOGICAL_HEIGHT * scale))
-        screen.blit(scaled_surface, offset)
-        pygame.display.flip()
+        for _ in range(steps):
+            next_scene = current_scene.update(clock.step)  # LoadingScene 은 다 읽으면 다음 장면을 돌려줍니다.
+            if next_scene:
+                current_scene = next_scene
+        if not clock.should_render():
+            continue
+        # 메뉴 장면은 바뀐 자리 (논리 좌표) 목록을, 나머지는 None (화면 전체) 을 돌려줍니다.
+        dirty_rects = current_scene.draw(logical_surface, clock.alpha)
+        if full_present:
+            dirty_rects = None
+            full_present = False
+        if dirty_rects is not None and not dirty_rects:
+            clock.idle()
+            wait_for_input(IDLE_WAIT_MS)  # 바뀐 것이 없으면 그리지도 내보내지도 않고 쉽니다.
+            continue
+        previous_debug_rect = debug_rect
+        if dirty_rects is not None and previous_debug_rect is not None:
+            # 지난 디버그 글자 자리도 다시 그립니다. (여백에 걸친 부분은 여기서 지웁니다)
+            screen.fill(BACKGROUND_COLOR, previous_debug_rect)
+            dirty_rects = list(dirty_rects) + [presenter.to_logical_rect(previous_debug_rect)]
+        # 바뀐 자리만 그렸으면 그 창 Rect 목록을, 화면 전체를 그렸으면 None 을 돌려줍니다.
+        screen_rects = presenter.present(screen, logical_surface, dirty_rects)
+        if DEBUG:
+            debug_rect = screen.blit(debug_font.render(f"{clock.report()}  {presenter.report()}", False, "white"), (0, 0))
+        if screen_rects is None:
+            pygame.display.flip()
+        else:
+            if DEBUG:
+                screen_rects.append(debug_rect.union(previous_debug_rect) if previous_debug_rect else debug_rect)
+            pygame.display.update(screen_rects)
@@ -0,0 +1,173 @@
+import time
+from abc import ABC, abstractmethod
+
+import pygame
+
+
+class OverlayPass(ABC):
+    """
+    해상도가 같으면 늘 같은 그림인 효과 (스캔라인, 비네트) 입니다.
+    resize() 에서 크기가 바뀔 때만 build() 로 곱하기용 Surface (흰색은 그대로, 어두울수록 어둡게) 를 만들어 두고,
+    apply() 는 그것을 BLEND_MULT 로 한 번 붙입니다. 곱하기라서 이어진 효과 여러 개를 한 장으로 합칠 수 있습니다. (PostProcess)
+    """
+
+    def __init__(self):
+        self.size = None
+        self.overlay = None
+
+    def resize(self, size):
+        if size != self.size:
+            self.size = size
+            self.overlay = self.build(size)
+
+    @abstractmethod
+    def build(self, size):
+        # size 에 맞는 곱하기용 Surface 를 만들어 돌려줍니다.
+        pass
+
+    def apply(self, surface):
+        surface.blit(self.overlay, (0, 0), special_flags=pygame.BLEND_MULT)
+
+
+class ScanlinePass(OverlayPass):
+    # spacing 픽셀마다 darkness (0 ~ 255) 만큼 어두운 가로 (vertical 이면 세로도) 줄
+    def __init__(self, spacing=2, darkness=50, vertical=True):
+        super().__init__()
+        self.spacing = spacing
+        self.darkness = darkness
+        self.vertical = vertical
+
+    def build(self, size):
+        width, height = size
+        shade = (255 - self.darkness,) * 3
+        overlay = pygame.Surface(size)
+        overlay.fill((255, 255, 255))
+        for y in range(0, height, self.spacing):
+            overlay.fill(shade, (0, y, width, 1))
+        if self.vertical:
+            for x in range(0, width, self.spacing):
+                overlay.fill(shade, (x, 0, 1, height))
+        return overlay
+
+
+class VignettePass(OverlayPass):
+    """
+    가장자리로 갈수록 어두워지는 효과입니다. 작은 Surface 에 타원 모양 그러데이션을 계산해서 크기에 맞게 부드럽게 늘립니다.
+    - inner: 어두워지기 시작하는 거리 (가운데 0, 모서리 쪽 가장자리 1)
+    - strength: 가장자리의 어둡기 (0 ~ 1)
+    """
+
+    def __init__(self, strength=0.6, inner=0.5, resolution=64):
+        super().__init__()
+        self.strength = strength
+        self.inner = inner
+        self.resolution = resolution
+
+    def build(self, size):
+        small = pygame.Surface((self.resolution, self.resolution))
+        half = (self.resolution - 1) / 2
+        for y in range(self.resolution):
+            for x in range(self.resolution):
+                distance = (((x - half) / half) ** 2 + ((y - half) / half) ** 2) ** 0.5
+                amount = min(1.0, max(0.0, (distance - self.inner) / (1.0 - self.inner)))
+                value = 255 - int(255 * self.strength * amount * amount)
+                small.set_at((x, y), (value, value, value))
+        return pygame.transform.smoothscale(small, size)
+
+
+class BlurPass:
+    """
+    1 / factor 크기로 줄였다가 다시 키워 흐리게 합니다. 줄인 그림을 받을 Surface 는 크기가 바뀔 때만 만들고 계속 다시 씁니다.
+    """
+
+    def __init__(self, factor=4):
+        self.factor = factor
+        self.size = None
+        self.small = None
+
+    def resize(self, size):
+        if size != self.size:
+            self.size = size
+            self.small = pygame.Surface((max(1, size[0] // self.factor), max(1, size[1] // self.factor)))
+
+    def apply(self, surface):
+        if self.factor <= 1:
+            return  # 흐리게 할 것이 없습니다.
+        pygame.transform.smoothscale(surface, self.small.get_size(), self.small)
+        pygame.transform.smoothscale(self.small, surface.get_size(), surface)
+
+
+# POST_EFFECTS 에 쓰는 이름 -> 만드는 함수
+PASS_TYPES = {
+    "blur": BlurPass,
+    "scanlines": ScanlinePass,
+    "vignette": VignettePass,
+}
+
+
+class PostProcess:
+    """
+    화면에 내보낸 그림 위에 효과 (pass) 를 순서대로 겹칩니다.
+    효과마다 필요한 Surface 는 resize() (창 크기가 바뀔 때) 에만 다시 만들고, apply() 는 만들어 둔 것을 씁니다.
+    이어진 OverlayPass 들은 resize() 때 한 장으로 곱해 두므로 프레임마다 blit 한 번입니다.
+    enabled 가 False 거나 효과가 없으면 아무것도 하지 않습니다.
+    """
+
+    def __init__(self, passes, enabled=True):
+        self.passes = list(passes)
+        self.enabled = enabled
+        self.size = None
+        self.steps = []  # 합친 곱하기 Surface 또는 그때그때 계산하는 pass
+        self.time = 0.0  # 보고용: 마지막 apply 에 걸린 시간
+
+    @classmethod
+    def from_names(cls, names, enabled=True):
+        return cls([PASS_TYPES[name]() for name in names], enabled)
+
+    def resize(self, size):
+        # 꺼져 있으면 만들지 않고, 켜진 뒤 처음 apply 할 때 만듭니다.
+        if size == self.size or not self.enabled:
+            return
+        self.size = size
+        self.steps = []
+        combined = None
+        for post_pass in self.passes:
+            post_pass.resize(size)
+            if isinstance(post_pass, OverlayPass):
+                if combined is None:
+                    combined = post_pass.overlay.copy()
+                    self.steps.append(combined)
+                else:
+                    combined.blit(post_pass.overlay, (0, 0), special_flags=pygame.BLEND_MULT)
+            else:
+                combined = None
+                self.steps.append(post_pass)
+
+    def is_local(self):
+        # 픽셀마다 따로 계산하는 효과 (곱하기) 만 있으면 바뀐 자리만 다시 칠해도 됩니다.
+        return not self.enabled or all(isinstance(post_pass, OverlayPass) for post_pass in self.passes)
+
+    def apply(self, surface, area=None):
+        """
+        surface 에 효과를 겹칩니다. area (surface 좌표 Rect) 를 주면 그 자리만 칠합니다. (is_local() 일 때만)
+        """
+        if not self.enabled or not self.passes:
+            self.time = 0.0
+            return
+        start_time = time.perf_counter()
+        self.resize(surface.get_size())
+        for step in self.steps:
+            if isinstance(step, pygame.Surface):
+                if area is None:
+                    surface.blit(step, (0, 0), special_flags=pygame.BLEND_MULT)
+                else:
+                    surface.blit(step, area, area, special_flags=pygame.BLEND_MULT)
+            else:
+                step.apply(surface)
+        self.time = time.perf_counter() - start_time
+
+    def report(self):
+        if not self.enabled or not self.passes:
+            return "post off"
+        names = "+".join(type(post_pass).__name__.removesuffix("Pass").lower() for post_pass in self.passes)
+        return f"post {names} {self.time * 1000:.2f}ms"
@@ -0,0 +1,65 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from assets import assets
+
+
+class Preloader:
+    """
+    이미지 여러 장을 게임을 멈추지 않고 assets 에 미리 읽어 둡니다.
+    - 파일 읽기와 PNG 풀기는 스레드 풀에서 합니다. (pygame.image.load 는 디스플레이가 필요 없습니다)
+    - convert_alpha() 는 디스플레이 포맷이 필요하므로 메인 스레드에서, update() 를 부를 때마다
+      convert_budget 초 안에서 조금씩 (적어도 한 장) 합니다.
+    이미 assets 에 있거나 assets.atlas 에 든 경로는 건너뜁니다. 읽어 둔 이미지는 참조 수 0 으로 들어가고
+    그 뒤 acquire() 하는 쪽이 디스크를 읽지 않고 바로 받습니다.
+    """
+
+    def __init__(self, paths, max_workers=4, convert_budget=0.004):
+        atlas = assets.atlas
+        self.paths = [
+            path for path in dict.fromkeys(paths)
+            if path not in assets.images and not (atlas is not None and path in atlas)
+        ]
+        self.convert_budget = convert_budget
+        self.loaded = 0
+        self.executor = ThreadPoolExecutor(max_workers=max_workers) if self.paths else None
+        self.futures = [(path, self.executor.submit(pygame.image.load, path)) for path in self.paths]
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)  # 맡긴 일은 끝까지 하고 스레드는 알아서 닫힙니다.
+
+    @property
+    def total(self):
+        return len(self.paths)
+
+    @property
+    def progress(self):
+        return self.loaded / self.total if self.total else 1.0
+
+    @property
+    def finished(self):
+        return self.loaded == self.total
+
+    def update(self):
+        """
+        풀기가 끝난 이미지를 순서대로 convert_alpha() 해서 assets 에 넣습니다. 모두 끝났으면 True 를 돌려줍니다.
+        """
+        start_time = time.perf_counter()
+        while self.loaded < self.total:
+            path, future = self.futures[self.loaded]
+            if not future.done():
+                break
+            if path not in assets.images:
+                assets.add(path, future.result().convert_alpha())
+            self.loaded += 1
+            if time.perf_counter() - start_time >= self.convert_budget:
+                break
+        return self.finished
+
+    def cancel(self):
+        # 아직 아무도 acquire 하지 않은 (참조 수 0) 이미지를 버립니다.
+        for path, future in self.futures:
+            future.cancel()
+            if assets.ref_counts.get(path) == 0:
+                assets.unload(path)
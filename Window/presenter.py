@@ -0,0 +1,167 @@
+import math
+import time
+
+import pygame
+
+# 확대 방식
+# - nearest: 창에 꽉 차게 (비율 유지) 가장 가까운 픽셀로 확대합니다. (예전 방식)
+# - integer: 정수 배로만 가장 가까운 픽셀로 확대합니다. 픽셀이 고르게 커지는 대신 여백이 더 생길 수 있습니다.
+# - smooth: 창에 꽉 차게 부드럽게 (smoothscale) 확대합니다.
+# - blur: 1 / blur_factor 크기로 줄였다가 다시 부드럽게 키워 흐리게 확대합니다.
+PRESENT_MODES = ("nearest", "integer", "smooth", "blur")
+
+
+class Presenter:
+    """
+    논리 화면 (logical_surface) 을 창 크기에 맞게 확대해서 가운데에 (남는 곳은 검은 여백으로) 내보냅니다.
+    확대한 그림은 새 Surface 를 만들지 않고 transform.scale(..., dest_surface) 로 창의 그 자리 (subsurface) 에 바로 씁니다.
+    blur 용 작은 Surface 와 여백 Rect 는 창 크기가 바뀔 때 (resize) 만 새로 만들고, 프레임마다는 여백만 칠합니다.
+    배율이 1 이면 확대하지 않고 그대로 붙입니다. 방식마다 걸린 시간을 재서 report() 로 보여 줍니다.
+    post_process (postprocess.PostProcess) 를 주면 확대한 그림 위에 효과를 겹치고, 그 캐시도 resize() 때만 다시 만듭니다.
+    present() 에 바뀐 자리 (논리 좌표 Rect 목록) 를 주면 그 자리만 확대합니다. (nearest / integer 이고 효과가 모두 곱하기일 때)
+    """
+
+    def __init__(self, logical_size, screen_size, mode="nearest", blur_factor=4, background_color=(0, 0, 0), post_process=None):
+        self.logical_width, self.logical_height = logical_size
+        self.mode = mode
+        self.blur_factor = blur_factor
+        self.background_color = background_color
+        self.post_process = post_process
+        self.times = {mode: [0.0, 0] for mode in PRESENT_MODES}  # 방식 -> [걸린 시간 합, 횟수]
+        self.resize(screen_size)
+
+    def resize(self, screen_size):
+        """
+        창 크기가 바뀌거나 (VIDEORESIZE, 전체 화면 전환) 확대 방식이 바뀌면 부릅니다.
+        배율과 여백을 다시 계산하고 blur 용 작은 Surface 를 새로 만듭니다.
+        """
+        self.screen_width, self.screen_height = screen_size
+        scale = min(self.screen_width / self.logical_width, self.screen_height / self.logical_height)
+        if self.mode == "integer" and scale >= 1:
+            scale = int(scale)
+        self.scale = scale
+        scaled_size = (int(self.logical_width * scale), int(self.logical_height * scale))
+        self.offset = ((self.screen_width - scaled_size[0]) // 2, (self.screen_height - scaled_size[1]) // 2)
+        self.rect = pygame.Rect(self.offset, scaled_size)
+        # 바뀐 자리만 확대할 때 맞출 칸 크기: 논리 화면에서 이만큼마다 확대한 픽셀 경계가 정수로 떨어지므로
+        # 그 경계에서 잘라 확대하면 화면 전체를 확대할 때와 같은 픽셀을 고릅니다.
+        self.align = (
+            self.logical_width // math.gcd(self.logical_width, scaled_size[0]),
+            self.logical_height // math.gcd(self.logical_height, scaled_size[1]),
+        )
+        # 확대한 그림이 덮지 않는 네 곳 (위, 아래, 왼쪽, 오른쪽 여백)
+        self.letterbox_rects = [
+            rect for rect in (
+                pygame.Rect(0, 0, self.screen_width, self.rect.top),
+                pygame.Rect(0, self.rect.bottom, self.screen_width, self.screen_height - self.rect.bottom),
+                pygame.Rect(0, self.rect.top, self.rect.left, self.rect.height),
+                pygame.Rect(self.rect.right, self.rect.top, self.screen_width - self.rect.right, self.rect.height),
+            )
+            if rect.width > 0 and rect.height > 0
+        ]
+
+        self.blur_buffer = None  # blur_factor 가 1 이하면 흐리게 할 것이 없으므로 smooth 와 같습니다.
+        if self.mode == "blur" and self.blur_factor > 1:
+            small_size = (max(1, self.logical_width // self.blur_factor), max(1, self.logical_height // self.blur_factor))
+            self.blur_buffer = pygame.Surface(small_size)
+        if self.post_process is not None:
+            self.post_process.resize(self.rect.size)
+
+    def set_mode(self, mode):
+        self.mode = mode
+        self.resize((self.screen_width, self.screen_height))
+
+    def next_mode(self):
+        self.set_mode(PRESENT_MODES[(PRESENT_MODES.index(self.mode) + 1) % len(PRESENT_MODES)])
+
+    def to_logical(self, position):
+        # 창의 좌표 (마우스 위치) 를 논리 화면 좌표로 바꿉니다.
+        return (position[0] - self.offset[0]) / self.scale, (position[1] - self.offset[1]) / self.scale
+
+    def to_logical_rect(self, rect):
+        # 창의 Rect 를 덮는 논리 화면의 Rect (논리 화면 밖으로 나간 부분은 present 가 잘라 냅니다)
+        left, top = self.to_logical(rect.topleft)
+        right, bottom = self.to_logical(rect.bottomright)
+        return pygame.Rect(math.floor(left), math.floor(top), math.ceil(right) - math.floor(left), math.ceil(bottom) - math.floor(top))
+
+    def to_screen(self, rect):
+        # 논리 화면의 Rect 를 창의 Rect 로 바꿉니다. (소수점 때문에 한 픽셀씩 넉넉하게)
+        return pygame.Rect(
+            int(self.offset[0] + rect.x * self.scale) - 1,
+            int(self.offset[1] + rect.y * self.scale) - 1,
+            int(rect.width * self.scale) + 3,
+            int(rect.height * self.scale) + 3,
+        )
+
+    def present(self, screen, logical_surface, dirty_rects=None):
+        """
+        logical_surface 를 지금 방식으로 확대해서 screen 에 그립니다. (flip / update 는 부르는 쪽에서)
+        dirty_rects (논리 좌표) 를 주면 그 자리만 그리고 display.update 에 넘길 창 Rect 목록을 돌려줍니다.
+        화면 전체를 그렸으면 None 을 돌려줍니다.
+        """
+        start_time = time.perf_counter()
+        if screen.get_size() != (self.screen_width, self.screen_height):
+            self.resize(screen.get_size())  # VIDEORESIZE 의 크기와 실제 창 크기가 다를 수 있습니다.
+        if dirty_rects is not None and self.can_present_rects():
+            return self.present_rects(screen, logical_surface, dirty_rects)
+        for rect in self.letterbox_rects:
+            screen.fill(self.background_color, rect)
+        if self.blur_buffer is not None:
+            pygame.transform.smoothscale(logical_surface, self.blur_buffer.get_size(), self.blur_buffer)
+            pygame.transform.smoothscale(self.blur_buffer, self.rect.size, screen.subsurface(self.rect))
+        elif self.scale == 1:
+            screen.blit(logical_surface, self.offset)  # 확대할 것이 없습니다.
+        elif self.mode in ("smooth", "blur"):
+            pygame.transform.smoothscale(logical_surface, self.rect.size, screen.subsurface(self.rect))
+        else:
+            pygame.transform.scale(logical_surface, self.rect.size, screen.subsurface(self.rect))
+        if self.post_process is not None:
+            self.post_process.apply(screen.subsurface(self.rect))
+        spent = self.times[self.mode]
+        spent[0] += time.perf_counter() - start_time
+        spent[1] += 1
+        return None
+
+    def can_present_rects(self):
+        # 부드럽게 / 흐리게 확대하거나 흐리게 하는 효과가 있으면 이웃 픽셀이 섞이므로 화면 전체를 그립니다.
+        if self.mode not in ("nearest", "integer"):
+            return False
+        return self.post_process is None or self.post_process.is_local()
+
+    def present_rects(self, screen, logical_surface, dirty_rects):
+        align_x, align_y = self.align
+        scaled_width, scaled_height = self.rect.size
+        logical_bounds = pygame.Rect(0, 0, self.logical_width, self.logical_height)
+        canvas = screen.subsurface(self.rect)
+        screen_rects = []
+        for rect in dirty_rects:
+            rect = rect.clip(logical_bounds)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            left = rect.left - rect.left % align_x
+            top = rect.top - rect.top % align_y
+            right = min(self.logical_width, -(-rect.right // align_x) * align_x)
+            bottom = min(self.logical_height, -(-rect.bottom // align_y) * align_y)
+            source = pygame.Rect(left, top, right - left, bottom - top)
+            target = pygame.Rect(
+                left * scaled_width // self.logical_width,
+                top * scaled_height // self.logical_height,
+                (right - left) * scaled_width // self.logical_width,
+                (bottom - top) * scaled_height // self.logical_height,
+            )
+            if self.scale == 1:
+                canvas.blit(logical_surface, target, source)
+            else:
+                pygame.transform.scale(logical_surface.subsurface(source), target.size, canvas.subsurface(target))
+            if self.post_process is not None:
+                self.post_process.apply(canvas, target)
+            screen_rects.append(target.move(self.offset))
+        return screen_rects
+
+    def report(self):
+        spent, count = self.times[self.mode]
+        average = spent / count * 1000 if count else 0.0
+        report = f"{self.mode} x{self.scale:.2f} {self.rect.width}x{self.rect.height}  present {average:.2f}ms"
+        if self.post_process is not None:
+            report += f"  {self.post_process.report()}"
+        return report
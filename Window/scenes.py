@@ -2,6 +2,7 @@ import pygame
 import sys
 from utils import Button, Camera, Animation, Timer, save_game, load_game
 from characters import Player, Enemy
+from spatial_hash import SpatialHash
 from game_data import *
 
 
@@ -52,6 +53,7 @@ class PlayScene:
         self.back_button = Button(pygame.Rect(10, 10, 100, 50), pygame.Color(200, 200, 0, 0), text="Back")
         self.player = Player(100, 110, self.game_data["controls"])
         self.enemies = [Enemy(200, 110)]
+        self.enemy_grid = SpatialHash()  # 적들의 rect 를 매 프레임 등록해 두고 공격 판정에서 주변 적만 찾습니다.
         self.background = pygame.image.load("assets/background/background.png").convert_alpha()
         self.background1 = pygame.image.load("assets/background/midground.png").convert_alpha()
         self.background2 = pygame.image.load("assets/background/foreground.png").convert_alpha()
@@ -68,7 +70,8 @@ class PlayScene:
         return None
 
     def update(self, delta_time):
-        self.player.update(self.enemies, delta_time)
+        self.enemy_grid.rebuild(self.enemies)
+        self.player.update(self.enemy_grid, delta_time)
         for enemy in self.enemies:
             enemy.update(self.player, delta_time)
             if enemy.state == Enemy.State.DEAD:
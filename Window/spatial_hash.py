@@ -0,0 +1,91 @@
+class SpatialHash:
+    """
+    화면을 cell_size 크기의 격자로 나눠, 칸마다 그 칸에 왼쪽 위 꼭짓점이 있는 물체들을 적어 두는 공간 해시입니다.
+    매 프레임 rebuild() 로 물체들의 rect 를 다시 등록하고, 공격 범위 같은 rect 로 query() 하면
+    그 rect 근처 칸에 등록된 물체만 검사하므로 물체가 많아도 주변 몇 개만 봅니다.
+    물체 하나는 한 칸에만 등록하고 (다시 등록하는 비용이 가장 크므로), 대신 query() 가 등록된 물체 중
+    가장 큰 너비/높이만큼 왼쪽과 위로 칸을 더 봅니다.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}  # (칸 x, 칸 y) -> 등록 순서 번호 리스트
+        self.items = []
+        self.rects = []
+        self.max_width = 0
+        self.max_height = 0
+
+    def clear(self):
+        self.cells.clear()
+        self.items.clear()
+        self.rects.clear()
+        self.max_width = 0
+        self.max_height = 0
+
+    def insert(self, item, rect=None):
+        """
+        item 을 rect (주지 않으면 item.rect) 의 왼쪽 위 꼭짓점이 있는 칸에 등록합니다.
+        rect 는 복사하지 않으므로 query() 는 그때의 위치로 겹침을 확인합니다. (칸은 등록할 때의 위치 기준)
+        """
+        if rect is None:
+            rect = item.rect
+        number = len(self.items)
+        self.items.append(item)
+        self.rects.append(rect)
+        if rect.width > self.max_width:
+            self.max_width = rect.width
+        if rect.height > self.max_height:
+            self.max_height = rect.height
+        key = (rect.left // self.cell_size, rect.top // self.cell_size)
+        cell = self.cells.get(key)
+        if cell is None:
+            self.cells[key] = [number]
+        else:
+            cell.append(number)
+
+    def rebuild(self, items):
+        # 프레임마다 부르므로 insert 를 풀어 씁니다.
+        self.clear()
+        cell_size = self.cell_size
+        cells = self.cells
+        rects = self.rects
+        max_width = max_height = 0
+        self.items.extend(items)
+        for number, item in enumerate(self.items):
+            rect = item.rect
+            rects.append(rect)
+            if rect.width > max_width:
+                max_width = rect.width
+            if rect.height > max_height:
+                max_height = rect.height
+            key = (rect.left // cell_size, rect.top // cell_size)
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [number]
+            else:
+                cell.append(number)
+        self.max_width = max_width
+        self.max_height = max_height
+
+    def query(self, rect):
+        """
+        rect 와 겹치는 물체들을 등록한 순서대로 돌려줍니다. (목록을 모두 훑으며 colliderect 한 결과와 같습니다)
+        """
+        cell_size = self.cell_size
+        cells = self.cells
+        found = []
+        for cell_y in range((rect.top - self.max_height + 1) // cell_size, (rect.bottom - 1) // cell_size + 1):
+            for cell_x in range((rect.left - self.max_width + 1) // cell_size, (rect.right - 1) // cell_size + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell is not None:
+                    found.extend(cell)
+        rects = self.rects
+        items = self.items
+        found.sort()  # 물체마다 한 칸에만 있으므로 겹치는 번호는 없습니다.
+        return [items[number] for number in found if rect.colliderect(rects[number])]
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
@@ -19,6 +19,9 @@ RED = (255, 0, 0)
 BLUE = (0, 0, 255)
 GREY = (128, 128, 128)
 
+# 캐릭터 몸 크기 (가로 1칸, 세로 2칸)
+BODY_WIDTH, BODY_HEIGHT = 1, 2
+
 # 노드 클래스 정의
 class Node:
     def __init__(self, row, col):
@@ -33,6 +36,8 @@ class Node:
         self.f = float('inf')
         self.came_from = None
         self.is_obstacle = False
+        self.free_right = 0  # 오른쪽으로 이어지는 빈칸 수 (자기 포함)
+        self.body_width = 0  # 이 칸을 몸의 왼쪽 위로 했을 때 들어갈 수 있는 가장 넓은 너비 (몸 높이 BODY_HEIGHT 기준)
 
     def get_pos(self):
         return self.row, self.col
@@ -65,97 +70,20 @@ class Node:
             pygame.draw.rect(win, self.color, (self.x, self.y, TILE_SIZE, TILE_SIZE))
             pygame.draw.rect(win, self.color, (self.x, self.y+TILE_SIZE, TILE_SIZE, TILE_SIZE))
 
-    def can_move_diagonal(self, grid, row_offset, col_offset):
-        row_check = self.row + row_offset
-        col_check = self.col + col_offset
-
-        # 그리드 경계를 벗어나지 않도록 체크
-        if (
-            row_check < 0 or row_check >= ROWS - 1 or
-            col_check < 0 or col_check >= COLS - 1 or
-            self.row + 1 >= ROWS or self.col + 1 >= COLS
-        ):
-            return False
-
-        # 대각선 이동 시 필요한 검사
-        if grid[self.row - 1][self.col].is_obstacle:  # 위쪽 타일
-            return False
-        if grid[self.row][self.col - 1].is_obstacle:  # 왼쪽 타일
-            return False
-        if grid[self.row - 1][self.col - 1].is_obstacle:  # 대각선 타일
-            return False
-        if grid[self.row + 1][self.col - 1].is_obstacle:  # 아래쪽 타일의 왼쪽 타일
-            return False
-
-        return True
-
     def update_neighbors(self, grid):
         self.neighbors = []
 
-        # 수직 및 수평 이동
-        if self.row < ROWS - 2 and not grid[self.row + 2][self.col].is_obstacle:  # 아래로 이동
-            if not grid[self.row + 1][self.col].is_obstacle:
-                self.neighbors.append(grid[self.row + 1][self.col])
-
-        if self.row > 0 and not grid[self.row - 1][self.col].is_obstacle:  # 위로 이동
-            self.neighbors.append(grid[self.row - 1][self.col])
-
-        if self.col < COLS - 1 and not grid[self.row][self.col + 1].is_obstacle:  # 오른쪽으로 이동
-            if self.row < ROWS - 1 and not grid[self.row + 1][self.col + 1].is_obstacle:
-                self.neighbors.append(grid[self.row][self.col + 1])
-
-        if self.col > 0 and not grid[self.row][self.col - 1].is_obstacle:  # 왼쪽으로 이동
-            if self.row < ROWS - 1 and not grid[self.row + 1][self.col - 1].is_obstacle:
-                self.neighbors.append(grid[self.row][self.col - 1])
-
-        # 대각선 이동 시 모든 타일에 대한 충돌 검사
-        if self.row > 0 and self.col > 0:  # 위쪽-왼쪽 대각선 이동
-            if (
-                not grid[self.row - 1][self.col].is_obstacle and  # 위쪽 타일
-                not grid[self.row][self.col - 1].is_obstacle and  # 왼쪽 타일
-                not grid[self.row - 1][self.col - 1].is_obstacle and  # 대각선 타일
-                not grid[self.row][self.col].is_obstacle and  # 현재 타일
-                self.row + 1 < ROWS and self.col - 1 >= 0 and  # 경계 조건
-                not grid[self.row + 1][self.col].is_obstacle and  # 아래쪽 타일
-                not grid[self.row + 1][self.col - 1].is_obstacle  # 아래쪽 타일의 왼쪽 타일
-            ):
-                self.neighbors.append(grid[self.row - 1][self.col - 1])
-
-        if self.row > 0 and self.col < COLS - 1:  # 위쪽-오른쪽 대각선 이동
-            if (
-                not grid[self.row - 1][self.col].is_obstacle and  # 위쪽 타일
-                not grid[self.row][self.col + 1].is_obstacle and  # 오른쪽 타일
-                not grid[self.row - 1][self.col + 1].is_obstacle and  # 대각선 타일
-                not grid[self.row][self.col].is_obstacle and  # 현재 타일
-                self.row + 1 < ROWS and self.col + 1 < COLS and  # 경계 조건
-                not grid[self.row + 1][self.col].is_obstacle and  # 아래쪽 타일
-                not grid[self.row + 1][self.col + 1].is_obstacle  # 아래쪽 타일의 오른쪽 타일
-            ):
-                self.neighbors.append(grid[self.row - 1][self.col + 1])
-
-        if self.row < ROWS - 2 and self.col > 0:  # 아래쪽-왼쪽 대각선 이동
-            if (
-                not grid[self.row + 1][self.col].is_obstacle and  # 아래쪽 타일
-                not grid[self.row][self.col - 1].is_obstacle and  # 왼쪽 타일
-                not grid[self.row + 1][self.col - 1].is_obstacle and  # 대각선 타일
-                not grid[self.row][self.col].is_obstacle and  # 현재 타일
-                self.row - 1 >= 0 and self.col - 1 >= 0 and  # 경계 조건
-                not grid[self.row - 1][self.col].is_obstacle and  # 위쪽 타일
-                not grid[self.row - 1][self.col - 1].is_obstacle  # 위쪽 타일의 왼쪽 타일
-            ):
-                self.neighbors.append(grid[self.row + 1][self.col - 1])
-
-        if self.row < ROWS - 2 and self.col < COLS - 1:  # 아래쪽-오른쪽 대각선 이동
-            if (
-                not grid[self.row + 1][self.col].is_obstacle and  # 아래쪽 타일
-                not grid[self.row][self.col + 1].is_obstacle and  # 오른쪽 타일
-                not grid[self.row + 1][self.col + 1].is_obstacle and  # 대각선 타일
-                not grid[self.row][self.col].is_obstacle and  # 현재 타일
-                self.row - 1 >= 0 and self.col + 1 < COLS and  # 경계 조건
-                not grid[self.row - 1][self.col].is_obstacle and  # 위쪽 타일
-                not grid[self.row - 1][self.col + 1].is_obstacle  # 위쪽 타일의 오른쪽 타일
-            ):
-                self.neighbors.append(grid[self.row + 1][self.col + 1])
+        # 수직/수평 이동은 옮긴 자리에 몸이 들어가면 되고,
+        # 대각선 이동은 가로/세로로 한 칸씩 옮긴 자리에도 몸이 들어가야 합니다. (모서리에 걸리지 않도록)
+        for row_offset, col_offset in ((1, 0), (-1, 0), (0, 1), (0, -1), (-1, -1), (-1, 1), (1, -1), (1, 1)):
+            row = self.row + row_offset
+            col = self.col + col_offset
+            if not body_fits(grid, row, col):
+                continue
+            if row_offset and col_offset:
+                if not (body_fits(grid, self.row, col) and body_fits(grid, row, self.col)):
+                    continue
+            self.neighbors.append(grid[row][col])
 
 
 def heuristic(p1, p2):
@@ -216,6 +144,26 @@ def a_star_algorithm(draw, grid, start, end):
 
     return False
 
+def body_fits(grid, row, col):
+    # 몸이 덮는 칸들을 하나씩 보지 않고, 미리 계산해 둔 너비와 한 번만 비교합니다.
+    return 0 <= row < ROWS and 0 <= col < COLS and grid[row][col].body_width >= BODY_WIDTH
+
+def update_clearance(grid, row):
+    """
+    row 줄의 타일이 바뀐 뒤, 그 줄의 빈칸 수와 그 줄을 몸으로 덮을 수 있는 줄들의 몸 너비를 다시 계산합니다.
+    """
+    free_right = 0
+    for node in reversed(grid[row]):
+        free_right = 0 if node.is_obstacle else free_right + 1
+        node.free_right = free_right
+
+    for top in range(max(0, row - BODY_HEIGHT + 1), row + 1):
+        for col in range(COLS):
+            if top + BODY_HEIGHT > ROWS:
+                grid[top][col].body_width = 0
+            else:
+                grid[top][col].body_width = min(grid[top + i][col].free_right for i in range(BODY_HEIGHT))
+
 def make_grid():
     grid = []
     for i in range(ROWS):
@@ -223,6 +171,8 @@ def make_grid():
         for j in range(COLS):
             node = Node(i, j)
             grid[i].append(node)
+    for i in range(ROWS - 1, -1, -1):
+        update_clearance(grid, i)
     return grid
 
 def draw_grid(win):
@@ -280,12 +230,14 @@ def main():
 
                 elif node != end and node != start:
                     node.make_obstacle()
+                    update_clearance(grid, row)
 
             elif pygame.mouse.get_pressed()[2]:  # RIGHT CLICK
                 pos = pygame.mouse.get_pos()
                 row, col = get_clicked_pos(pos)
                 node = grid[row][col]
                 node.reset()
+                update_clearance(grid, row)
 
                 if node == start:
                     start = None
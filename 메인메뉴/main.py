@@ -31,6 +31,7 @@ GREEN = (0, 255, 0)
 RED = (255, 0, 0)
 BLACK = (0, 0, 0)
 GREY = (128, 128, 128)
+LAYER_COLORKEY = (255, 0, 255)  # 미리 그린 타일 Surface 에서 빈칸을 투명하게 할 색
 HOVER_COLOR = (200, 200, 200)
 CLICK_COLOR = (150, 150, 150)
 
@@ -41,6 +42,9 @@ FPS = 60
 # 적과 플레이어 사이의 최소 거리 설정
 MIN_DISTANCE_TO_PLAYER = TILE_SIZE
 
+# 타일맵을 미리 그려 두는 Surface 한 장이 덮는 칸 수 (가로, 세로)
+LAYER_CHUNK_TILES = 16
+
 #플립이 연속해서 일어나는 버그 제어
 FLIP_THRESHOLD = 0.5
 
@@ -52,17 +56,74 @@ class TileMap:
         self.tiles = self.create_tiles()
 
     def create_tiles(self):
+        # 칸 (x, y) 의 Rect 를 tile_rects[y][x] 에 두고 (빈칸은 None), 충돌 검사 때 다시 만들지 않고 꺼내 씁니다.
+        self.layer_chunks = {}  # (청크 x, 청크 y) -> 벽을 미리 그려 둔 Surface. 타일을 다시 만들면 새로 그립니다.
         tiles = []
+        self.tile_rects = []
         for row_index, row in enumerate(self.tile_map):
+            rect_row = []
             for col_index, col in enumerate(row):
                 if col == "#":
                     tile = pygame.Rect(col_index * self.tile_size, row_index * self.tile_size, self.tile_size, self.tile_size)
                     tiles.append(tile)
+                    rect_row.append(tile)
+                else:
+                    rect_row.append(None)
+            self.tile_rects.append(rect_row)
         return tiles
 
+    def colliding_tiles(self, rect):
+        # rect 가 덮는 칸 범위만 읽습니다. (tiles 를 모두 훑는 것과 결과와 순서가 같습니다)
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        left = max(0, rect.left // self.tile_size)
+        right = min(len(self.tile_map[0]) - 1, (rect.right - 1) // self.tile_size)
+        top = max(0, rect.top // self.tile_size)
+        bottom = min(len(self.tile_map) - 1, (rect.bottom - 1) // self.tile_size)
+        if left > right or top > bottom:
+            return []  # 맵 밖 (음수 끝값이 슬라이스에서 뒤에서부터 세는 값으로 바뀌지 않게)
+        collisions = []
+        for rect_row in self.tile_rects[top:bottom + 1]:
+            for tile in rect_row[left:right + 1]:
+                if tile is not None:
+                    collisions.append(tile)
+        return collisions
+
+    def layer_chunk(self, chunk_x, chunk_y):
+        # 청크의 벽을 한 번만 Surface 에 그려 둡니다. 빈칸은 LAYER_COLORKEY 로 투명하게 둡니다. (벽이 없으면 None)
+        key = (chunk_x, chunk_y)
+        if key in self.layer_chunks:
+            return self.layer_chunks[key]
+        left = chunk_x * LAYER_CHUNK_TILES
+        top = chunk_y * LAYER_CHUNK_TILES
+        rows = [row[left:left + LAYER_CHUNK_TILES] for row in self.tile_map[top:top + LAYER_CHUNK_TILES]]
+        chunk = None
+        if any("#" in row for row in rows):
+            chunk = pygame.Surface((len(rows[0]) * self.tile_size, len(rows) * self.tile_size))
+            chunk.fill(LAYER_COLORKEY)
+            chunk.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+            for y, row in enumerate(rows):
+                for x, col in enumerate(row):
+                    if col == "#":
+                        chunk.fill(GREEN, (x * self.tile_size, y * self.tile_size, self.tile_size, self.tile_size))
+        self.layer_chunks[key] = chunk
+        return chunk
+
     def draw(self, surface):
-        for tile in self.tiles:
-            pygame.draw.rect(surface, GREEN, tile)
+        # 타일마다 그리는 대신 미리 그려 둔 청크 중 surface 에 보이는 것만 한 번에 붙입니다.
+        chunk_pixels = self.tile_size * LAYER_CHUNK_TILES
+        clip = surface.get_clip()
+        left = max(0, clip.left // chunk_pixels)
+        right = min((len(self.tile_map[0]) - 1) // LAYER_CHUNK_TILES, (clip.right - 1) // chunk_pixels)
+        top = max(0, clip.top // chunk_pixels)
+        bottom = min((len(self.tile_map) - 1) // LAYER_CHUNK_TILES, (clip.bottom - 1) // chunk_pixels)
+        blits = []
+        for chunk_y in range(top, bottom + 1):
+            for chunk_x in range(left, right + 1):
+                chunk = self.layer_chunk(chunk_x, chunk_y)
+                if chunk is not None:
+                    blits.append((chunk, (chunk_x * chunk_pixels, chunk_y * chunk_pixels)))
+        surface.blits(blits, False)
 
     def is_obstacle(self, x, y):
         if 0 <= y < len(self.tile_map) and 0 <= x < len(self.tile_map[0]):
@@ -238,7 +299,7 @@ class Player:
             self.attack_range.midright = self.rect.midleft
 
     def check_collision(self):
-        return [tile for tile in self.tile_map.tiles if self.rect.colliderect(tile)]
+        return self.tile_map.colliding_tiles(self.rect)
 
     def draw(self, surface):
         image = self.current_animation.get_image()